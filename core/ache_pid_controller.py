@@ -9,13 +9,19 @@ Process Variable: ScarIndex(t) = Avg_i(Entropy(pθ(x_0^i|xt))) (Model Uncertaint
 Output Adjustment: Adjust generative guidance scale (omega) based on error e(t)
 """
 
+import time
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
+from core.controller_telemetry import NullTelemetrySink, TelemetrySink, get_default_telemetry_sink
+
+# Default number of ticks retained in controller history
+HISTORY_CAPACITY = 10000
+
 
 @dataclass
 class PIDParameters:
@@ -62,6 +68,67 @@ class PIDState:
         }
 
 
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+class PIDHistory:
+    """
+    Fixed-capacity ring buffer of controller ticks
+
+    Each field is a preallocated float64 array; timestamps are epoch seconds.
+    Once ``capacity`` ticks are stored the oldest tick is overwritten.
+    ``values`` and ``tail`` return read-only arrays; before the ring wraps
+    they are views of the internal buffer.
+    """
+
+    FIELDS = ("error", "scarindex", "guidance", "timestamp")
+
+    def __init__(self, capacity: int = HISTORY_CAPACITY):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._arrays = {name: np.zeros(capacity, dtype=np.float64) for name in self.FIELDS}
+        self._next = 0
+        self._size = 0
+
+    def append(self, error: float, scarindex: float, guidance: float, timestamp: float):
+        """Record one tick"""
+        i = self._next
+        arrays = self._arrays
+        arrays["error"][i] = error
+        arrays["scarindex"][i] = scarindex
+        arrays["guidance"][i] = guidance
+        arrays["timestamp"][i] = timestamp
+        self._next = (i + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def values(self, name: str) -> np.ndarray:
+        """Retained values of a field, oldest first"""
+        array = self._arrays[name]
+        if self._size < self.capacity:
+            return _read_only(array[: self._size])
+        return _read_only(np.concatenate((array[self._next:], array[:self._next])))
+
+    def tail(self, name: str, n: int) -> np.ndarray:
+        """Most recent ``n`` values of a field, oldest first"""
+        n = min(n, self._size)
+        start = self._next - n
+        array = self._arrays[name]
+        if start >= 0:
+            return _read_only(array[start:self._next])
+        return _read_only(np.concatenate((array[start:], array[: self._next])))
+
+    def clear(self):
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+
 class AchePIDController:
     """
     PID Controller for Ache-to-Order transmutation stability
@@ -88,6 +155,8 @@ class AchePIDController:
         min_guidance: float = 0.1,
         max_guidance: float = 2.0,
         integral_windup_limit: float = 10.0,
+        history_capacity: int = HISTORY_CAPACITY,
+        telemetry: Optional[TelemetrySink] = None,
     ):
         """
         Initialize the PID controller
@@ -100,6 +169,8 @@ class AchePIDController:
             min_guidance: Minimum guidance scale
             max_guidance: Maximum guidance scale
             integral_windup_limit: Limit for integral term to prevent windup
+            history_capacity: Ticks kept in the history ring buffer
+            telemetry: Sink receiving sampled ticks (defaults to the shared batched Supabase sink)
         """
         self.target_scarindex = target_scarindex
         self.parameters = PIDParameters(kp=kp, ki=ki, kd=kd)
@@ -115,11 +186,37 @@ class AchePIDController:
         self.previous_error = 0.0
         self.guidance_scale = 1.0
 
-        # History for analysis
-        self.error_history: List[float] = []
-        self.scarindex_history: List[float] = []
-        self.guidance_history: List[float] = []
-        self.timestamp_history: List[datetime] = []
+        self.telemetry = telemetry if telemetry is not None else get_default_telemetry_sink()
+
+        # Bounded history for analysis
+        self.history = PIDHistory(history_capacity)
+        self._reset_metrics()
+
+    def _reset_metrics(self):
+        """Running aggregates behind get_performance_metrics (over every tick since reset)"""
+        self._samples = 0
+        self._abs_error_sum = 0.0
+        self._sq_error_sum = 0.0
+        self._max_abs_error = 0.0
+        self._max_scarindex = -np.inf
+        self._settling_index: Optional[int] = None
+
+    @property
+    def error_history(self) -> np.ndarray:
+        return self.history.values("error")
+
+    @property
+    def scarindex_history(self) -> np.ndarray:
+        return self.history.values("scarindex")
+
+    @property
+    def guidance_history(self) -> np.ndarray:
+        return self.history.values("guidance")
+
+    @property
+    def timestamp_history(self) -> np.ndarray:
+        """Tick timestamps as float64 epoch seconds"""
+        return self.history.values("timestamp")
 
     def update(self, current_scarindex: float, dt: Optional[float] = None) -> float:
         """
@@ -162,34 +259,37 @@ class AchePIDController:
         # Clamp to valid range
         self.guidance_scale = np.clip(self.guidance_scale, self.min_guidance, self.max_guidance)
 
-        # Update history
-        self.error_history.append(self.error)
-        self.scarindex_history.append(current_scarindex)
-        self.guidance_history.append(self.guidance_scale)
-        self.timestamp_history.append(datetime.now(timezone.utc))
+        # Update history and running metrics
+        self.history.append(self.error, current_scarindex, self.guidance_scale, time.time())
+
+        abs_error = abs(self.error)
+        self._abs_error_sum += abs_error
+        self._sq_error_sum += self.error * self.error
+        if abs_error > self._max_abs_error:
+            self._max_abs_error = abs_error
+        if current_scarindex > self._max_scarindex:
+            self._max_scarindex = current_scarindex
+        if self._settling_index is None and abs_error < 0.05 * self.target_scarindex:
+            self._settling_index = self._samples
+        self._samples += 1
 
         # Update previous error for next iteration
         self.previous_error = self.error
         
-        # Persist to Supabase if available
-        try:
-            from core.db import get_supabase
-            supabase = get_supabase()
-            
-            # Record Ache Value
-            supabase.table("ache_values").insert({
-                "source": "pid_controller",
-                "value": self.error, # Using error as a proxy for raw Ache for now
-                "metadata": {
-                    "target": self.target_scarindex,
-                    "current": current_scarindex,
-                    "guidance": self.guidance_scale
-                }
-            }).execute()
-            
-        except Exception as e:
-            # Don't fail controller if persistence fails
-            pass
+        # Hand sampled ticks to the telemetry sink (persistence happens off the loop)
+        if self.telemetry.sample("ache_values"):
+            self.telemetry.write(
+                "ache_values",
+                {
+                    "source": "pid_controller",
+                    "value": self.error,  # Using error as a proxy for raw Ache for now
+                    "metadata": {
+                        "target": self.target_scarindex,
+                        "current": current_scarindex,
+                        "guidance": self.guidance_scale,
+                    },
+                },
+            )
 
         return self.guidance_scale
 
@@ -200,10 +300,8 @@ class AchePIDController:
         self.derivative = 0.0
         self.previous_error = 0.0
         self.guidance_scale = 1.0
-        self.error_history.clear()
-        self.scarindex_history.clear()
-        self.guidance_history.clear()
-        self.timestamp_history.clear()
+        self.history.clear()
+        self._reset_metrics()
 
     def tune(self, kp: float, ki: float, kd: float):
         """
@@ -250,42 +348,31 @@ class AchePIDController:
         """
         Calculate performance metrics for the controller
 
+        O(1): metrics are accumulated in ``update`` and cover every tick since
+        the last reset, including ticks already evicted from the history buffer.
+
         Returns:
             Dictionary with performance metrics
         """
-        if len(self.error_history) == 0:
+        if self._samples == 0:
             return {"mean_error": 0.0, "rmse": 0.0, "max_error": 0.0, "settling_time": 0.0, "overshoot": 0.0}
 
-        errors = np.array(self.error_history)
-        scarindexes = np.array(self.scarindex_history)
-
-        # Mean absolute error
-        mean_error = np.mean(np.abs(errors))
-
-        # Root mean square error
-        rmse = np.sqrt(np.mean(errors**2))
-
-        # Maximum error
-        max_error = np.max(np.abs(errors))
-
-        # Settling time (time to reach within 5% of target)
-        settling_threshold = 0.05 * self.target_scarindex
-        settled_indices = np.where(np.abs(errors) < settling_threshold)[0]
-        settling_time = len(self.error_history) if len(settled_indices) == 0 else settled_indices[0]
+        # Settling time (first tick within 5% of the target in force at that tick)
+        settling_time = self._samples if self._settling_index is None else self._settling_index
 
         # Overshoot (maximum excursion beyond target)
         if self.target_scarindex > 0:
-            overshoot = np.max(scarindexes - self.target_scarindex) / self.target_scarindex
+            overshoot = (self._max_scarindex - self.target_scarindex) / self.target_scarindex
         else:
             overshoot = 0.0
 
         return {
-            "mean_error": float(mean_error),
-            "rmse": float(rmse),
-            "max_error": float(max_error),
+            "mean_error": float(self._abs_error_sum / self._samples),
+            "rmse": float(np.sqrt(self._sq_error_sum / self._samples)),
+            "max_error": float(self._max_abs_error),
             "settling_time": int(settling_time),
             "overshoot": float(overshoot),
-            "samples": len(self.error_history),
+            "samples": self._samples,
         }
 
     def auto_tune_ziegler_nichols(self, ultimate_gain: float, ultimate_period: float) -> PIDParameters:
@@ -398,7 +485,13 @@ class ScarDiffusionController:
 
 
 def simulate_pid_response(
-    target: float = 0.7, initial: float = 0.3, steps: int = 100, kp: float = 1.0, ki: float = 0.5, kd: float = 0.2
+    target: float = 0.7,
+    initial: float = 0.3,
+    steps: int = 100,
+    kp: float = 1.0,
+    ki: float = 0.5,
+    kd: float = 0.2,
+    telemetry: Optional[TelemetrySink] = None,
 ) -> Tuple[List[float], List[float], List[float]]:
     """
     Simulate PID controller response
@@ -408,11 +501,14 @@ def simulate_pid_response(
         initial: Initial ScarIndex
         steps: Number of simulation steps
         kp, ki, kd: PID parameters
+        telemetry: Sink for simulated ticks (default: discard)
 
     Returns:
         (scarindex_values, guidance_values, error_values)
     """
-    controller = AchePIDController(target_scarindex=target, kp=kp, ki=ki, kd=kd)
+    controller = AchePIDController(
+        target_scarindex=target, kp=kp, ki=ki, kd=kd, telemetry=telemetry or NullTelemetrySink()
+    )
 
     scarindex_values = [initial]
     guidance_values = []
@@ -440,6 +536,205 @@ def simulate_pid_response(
     return scarindex_values, guidance_values, error_values
 
 
+ArrayLike = Union[float, List[float], np.ndarray]
+
+
+@dataclass
+class PIDBatchResult:
+    """
+    Result of simulate_pid_batch
+
+    Gains are shape (N,). Trajectories are (N, steps) arrays (scarindex has
+    steps + 1 columns including the initial value) and are None when not kept.
+    Metric arrays are shape (N,) with the same meaning as
+    ``AchePIDController.get_performance_metrics``.
+    """
+
+    kp: np.ndarray
+    ki: np.ndarray
+    kd: np.ndarray
+    target: float
+    metrics: Dict[str, np.ndarray] = field(default_factory=dict)
+    scarindex: Optional[np.ndarray] = None
+    guidance: Optional[np.ndarray] = None
+    error: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.kp)
+
+    def metrics_for(self, index: int) -> dict:
+        """Metrics of one run, shaped like get_performance_metrics"""
+        return {
+            "mean_error": float(self.metrics["mean_error"][index]),
+            "rmse": float(self.metrics["rmse"][index]),
+            "max_error": float(self.metrics["max_error"][index]),
+            "settling_time": int(self.metrics["settling_time"][index]),
+            "overshoot": float(self.metrics["overshoot"][index]),
+            "samples": int(self.metrics["samples"][index]),
+        }
+
+    def best(self, metric: str = "rmse") -> Tuple[PIDParameters, dict]:
+        """Gains and metrics of the run minimising ``metric``"""
+        index = int(np.argmin(self.metrics[metric]))
+        parameters = PIDParameters(kp=float(self.kp[index]), ki=float(self.ki[index]), kd=float(self.kd[index]))
+        return parameters, self.metrics_for(index)
+
+
+def pid_gain_grid(kp_values: ArrayLike, ki_values: ArrayLike, kd_values: ArrayLike) -> Tuple[np.ndarray, ...]:
+    """
+    Cartesian product of gain values
+
+    Returns:
+        (kp, ki, kd) flat arrays covering every combination
+    """
+    kp, ki, kd = np.meshgrid(
+        np.atleast_1d(kp_values), np.atleast_1d(ki_values), np.atleast_1d(kd_values), indexing="ij"
+    )
+    return kp.ravel(), ki.ravel(), kd.ravel()
+
+
+def ziegler_nichols_neighbourhood(
+    ultimate_gain: float, ultimate_period: float, spread: float = 0.5, points: int = 5
+) -> Tuple[np.ndarray, ...]:
+    """
+    Gain grid around the Ziegler-Nichols PID tuning
+
+    Each gain is scaled by ``points`` factors spaced evenly in
+    [1 - spread, 1 + spread] around the classic Ziegler-Nichols value.
+
+    Returns:
+        (kp, ki, kd) flat arrays of ``points ** 3`` gain sets
+    """
+    kp = 0.6 * ultimate_gain
+    ki = 2.0 * kp / ultimate_period
+    kd = kp * ultimate_period / 8.0
+    factors = np.linspace(1.0 - spread, 1.0 + spread, points)
+    return pid_gain_grid(kp * factors, ki * factors, kd * factors)
+
+
+def simulate_pid_batch(
+    kp: ArrayLike,
+    ki: ArrayLike,
+    kd: ArrayLike,
+    target: float = 0.7,
+    initial: float = 0.3,
+    steps: int = 100,
+    response_rate: float = 0.1,
+    noise_std: float = 0.01,
+    seed: Optional[int] = None,
+    common_noise: bool = False,
+    min_guidance: float = 0.1,
+    max_guidance: float = 2.0,
+    integral_windup_limit: float = 10.0,
+    dt: float = 1.0,
+    keep_trajectories: bool = True,
+) -> PIDBatchResult:
+    """
+    Simulate N PID controllers for ``steps`` ticks at once
+
+    Vectorized counterpart of simulate_pid_response: every gain set advances
+    through the same first-order plant, with integral anti-windup clipping
+    and guidance clamping applied per step across the whole batch.
+
+    Args:
+        kp, ki, kd: Gains, scalars or arrays broadcastable to shape (N,)
+        target: Target ScarIndex
+        initial: Initial ScarIndex
+        steps: Number of simulation steps
+        response_rate: Plant response rate
+        noise_std: Standard deviation of measurement noise (0 disables noise)
+        seed: Seed for the noise generator
+        common_noise: Drive every run with the same noise path (fairer gain comparisons)
+        min_guidance, max_guidance: Guidance clamp
+        integral_windup_limit: Anti-windup limit on the integral term
+        dt: Time step
+        keep_trajectories: Return the (N, steps) trajectories as well as metrics
+
+    Returns:
+        PIDBatchResult with per-run metrics
+    """
+    kp, ki, kd = (np.atleast_1d(np.asarray(g, dtype=np.float64)).ravel() for g in np.broadcast_arrays(kp, ki, kd))
+    if np.any(kp < 0) or np.any(ki < 0) or np.any(kd < 0):
+        raise ValueError("PID parameters must be non-negative")
+    runs = len(kp)
+
+    rng = np.random.default_rng(seed)
+    noise = None
+    if noise_std > 0:
+        noise = rng.normal(0.0, noise_std, (1 if common_noise else runs, steps))
+
+    current = np.full(runs, float(initial))
+    integral = np.zeros(runs)
+    previous_error = np.zeros(runs)
+
+    abs_error_sum = np.zeros(runs)
+    sq_error_sum = np.zeros(runs)
+    max_abs_error = np.zeros(runs)
+    max_scarindex = np.full(runs, -np.inf)
+    settling = np.full(runs, steps, dtype=np.int64)
+    settling_threshold = 0.05 * target
+
+    if keep_trajectories:
+        scarindex_out = np.empty((runs, steps + 1))
+        scarindex_out[:, 0] = current
+        guidance_out = np.empty((runs, steps))
+        error_out = np.empty((runs, steps))
+
+    for t in range(steps):
+        error = target - current
+
+        integral += error * dt
+        np.clip(integral, -integral_windup_limit, integral_windup_limit, out=integral)
+        derivative = (error - previous_error) / dt if dt > 0 else np.zeros(runs)
+
+        guidance = np.clip(kp * error + ki * integral + kd * derivative, min_guidance, max_guidance)
+
+        # Running metrics over the measurements fed to the controller
+        abs_error = np.abs(error)
+        abs_error_sum += abs_error
+        sq_error_sum += error * error
+        np.maximum(max_abs_error, abs_error, out=max_abs_error)
+        np.maximum(max_scarindex, current, out=max_scarindex)
+        newly_settled = (settling == steps) & (abs_error < settling_threshold)
+        settling[newly_settled] = t
+
+        if keep_trajectories:
+            guidance_out[:, t] = guidance
+            error_out[:, t] = error
+
+        # Plant response (same simplified first-order system as simulate_pid_response)
+        current = current + response_rate * (target - current) * guidance
+        if noise is not None:
+            current += noise[0 if common_noise else slice(None), t]
+        np.clip(current, 0, 1, out=current)
+        previous_error = error
+
+        if keep_trajectories:
+            scarindex_out[:, t + 1] = current
+
+    samples = max(steps, 1)
+    overshoot = (max_scarindex - target) / target if target > 0 else np.zeros(runs)
+    metrics = {
+        "mean_error": abs_error_sum / samples,
+        "rmse": np.sqrt(sq_error_sum / samples),
+        "max_error": max_abs_error,
+        "settling_time": settling,
+        "overshoot": overshoot,
+        "samples": np.full(runs, steps, dtype=np.int64),
+    }
+
+    return PIDBatchResult(
+        kp=kp,
+        ki=ki,
+        kd=kd,
+        target=target,
+        metrics=metrics,
+        scarindex=scarindex_out if keep_trajectories else None,
+        guidance=guidance_out if keep_trajectories else None,
+        error=error_out if keep_trajectories else None,
+    )
+
+
 if __name__ == "__main__":
     # Example usage and simulation
     print("AchePIDController Simulation")
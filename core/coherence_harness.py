@@ -0,0 +1,116 @@
+"""
+Coherence Harness - Local fake providers for the Distributed Coherence Protocol
+
+Stands in for the LLM providers so consensus rounds can be exercised and
+benchmarked without network access. Each fake provider sleeps for a
+configurable latency and answers with scores derived from a hash of the
+Ache content, so agreeing providers produce identical output hashes.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import statistics
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .coherence_protocol import DistributedCoherenceProtocol, LLMProvider
+
+
+@dataclass
+class FakeProvider:
+    """Latency and behaviour profile of one fake provider"""
+
+    latency: float = 0.05  # seconds
+    jitter: float = 0.0  # uniform +/- seconds
+    failure_rate: float = 0.0
+    disagree: bool = False  # answer with scores that do not match the others
+    tail_probability: float = 0.0  # chance of a slow straggler response
+    tail_latency: float = 1.0
+
+
+def deterministic_scores(ache_content: Dict) -> Dict:
+    """Coherence scores derived from the content hash (identical across providers)"""
+    digest = hashlib.sha256(json.dumps(ache_content, sort_keys=True).encode()).digest()
+    dimensions = ("c_narrative", "c_social", "c_economic", "c_technical")
+    scores = {name: round(digest[i] / 255, 3) for i, name in enumerate(dimensions)}
+    scores["ache_after"] = round(digest[4] / 255, 3)
+    scores["reasoning"] = "fake provider"
+    return scores
+
+
+class FakeProviderHarness:
+    """
+    FakeProviderHarness - Async analyzer injected into DistributedCoherenceProtocol
+    """
+
+    def __init__(self, providers: Optional[Dict[LLMProvider, FakeProvider]] = None, seed: int = 0):
+        """
+        Initialize harness
+
+        Args:
+            providers: Profile per provider (unlisted providers use FakeProvider())
+            seed: Seed for jitter, failures and tail latency
+        """
+        self.providers = providers or {}
+        self.rng = random.Random(seed)
+        self.calls: Counter = Counter()
+        self.completed: Counter = Counter()
+        self.cancelled: Counter = Counter()
+
+    async def __call__(self, provider: LLMProvider, instance: int, ache_content: Dict, system_prompt: str) -> Dict:
+        profile = self.providers.get(provider, FakeProvider())
+        self.calls[provider] += 1
+
+        delay = profile.latency + self.rng.uniform(-profile.jitter, profile.jitter)
+        if profile.tail_probability and self.rng.random() < profile.tail_probability:
+            delay = profile.tail_latency
+        try:
+            await asyncio.sleep(max(0.0, delay))
+        except asyncio.CancelledError:
+            self.cancelled[provider] += 1
+            raise
+
+        if profile.failure_rate and self.rng.random() < profile.failure_rate:
+            raise RuntimeError(f"{provider.value} fake failure")
+
+        self.completed[provider] += 1
+        output = deterministic_scores(ache_content)
+        if profile.disagree:
+            output["reasoning"] = f"dissent from {provider.value}"
+        return output
+
+    def build_protocol(self, **kwargs) -> DistributedCoherenceProtocol:
+        """Create a protocol wired to this harness"""
+        return DistributedCoherenceProtocol(analyzer=self, **kwargs)
+
+
+async def benchmark_consensus(protocol: DistributedCoherenceProtocol, rounds: int = 20) -> Dict:
+    """
+    Run consensus rounds and summarise latency
+
+    Returns:
+        Dict with mean/p50/p95/max latency in ms and the consensus rate
+    """
+    latencies: List[float] = []
+    achieved = 0
+    for i in range(rounds):
+        started = time.perf_counter()
+        result = await protocol.verify_consensus(ache_content={"round": i}, ache_before=0.5)
+        latencies.append((time.perf_counter() - started) * 1000)
+        achieved += result.achieved
+
+    ordered = sorted(latencies)
+    return {
+        "rounds": rounds,
+        "mean_ms": statistics.fmean(latencies),
+        "p50_ms": ordered[len(ordered) // 2],
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max_ms": ordered[-1],
+        "consensus_rate": achieved / rounds,
+        "hedged_requests": protocol.hedged_requests,
+        "timed_out_requests": protocol.timed_out_requests,
+    }
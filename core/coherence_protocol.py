@@ -17,29 +17,37 @@ import asyncio
 import hashlib
 import json
 import os
+import time
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Tuple
 
 # Third-party imports
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 # Optional third-party imports
 try:
-    from anthropic import Anthropic
+    from anthropic import AsyncAnthropic
 
     ANTHROPIC_AVAILABLE = True
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
+if TYPE_CHECKING:
+    from .consensus_cache import ConsensusCache
+
 # Constants
 ANTHROPIC_JSON_INSTRUCTION = (
     "\n\nIMPORTANT: Respond ONLY with valid JSON. Do not include any explanation or text outside the JSON object."
 )
 
 
+# Default per-provider request timeout in seconds
+DEFAULT_PROVIDER_TIMEOUT = 60.0
+
+
 class LLMProvider(Enum):
     """Supported LLM providers for consensus"""
 
@@ -95,6 +103,13 @@ class ConsensusResult:
     final_output: Optional[Dict]
     verification_hashes: List[str]
 
+    # Fan-out bookkeeping (not persisted)
+    failures: Dict[str, str] = field(default_factory=dict)  # "provider#instance" -> error
+    cancelled: int = 0  # stragglers cancelled after an early decision
+    latency_ms: float = 0.0
+    cached: bool = False  # served from ConsensusCache
+    cached_from: Optional[str] = None  # consensus_group of the round a cache hit replays
+
     def to_dict(self) -> Dict:
         """Convert to dictionary for database storage"""
         return {
@@ -107,30 +122,71 @@ class ConsensusResult:
         }
 
 
+ProviderAnalyzer = Callable[[LLMProvider, int, Dict, str], Awaitable[Dict]]
+
+
 class DistributedCoherenceProtocol:
     """
     Implements the Cryptographic Output Verification (COV) protocol
 
     Uses multi-provider consensus (2-of-3) to ensure distributed coherence
     and mitigate the centralization risk of relying on commercial LLMs.
+
+    Providers are queried concurrently through async clients. Each request
+    is bounded by ``provider_timeout``; with ``hedge_delay`` set, a request
+    still outstanding after that many seconds is duplicated and the first
+    reply wins. With ``early_return`` the round is decided as soon as
+    ``consensus_threshold`` matching hashes arrive (or consensus becomes
+    unreachable) and the remaining requests are cancelled.
     """
 
-    def __init__(self, consensus_threshold: int = 2, total_providers: int = 3):
+    def __init__(
+        self,
+        consensus_threshold: int = 2,
+        total_providers: int = 3,
+        provider_timeout: Optional[float] = DEFAULT_PROVIDER_TIMEOUT,
+        hedge_delay: Optional[float] = None,
+        early_return: bool = True,
+        analyzer: Optional[ProviderAnalyzer] = None,
+        cache: Optional["ConsensusCache"] = None,
+    ):
         """
         Initialize the protocol
 
         Args:
             consensus_threshold: Number of providers that must agree (default: 2)
             total_providers: Total number of providers to query (default: 3)
+            provider_timeout: Seconds before a provider request is abandoned (None waits forever)
+            hedge_delay: Seconds before a duplicate request is sent to a slow provider (None disables hedging)
+            early_return: Decide the round as soon as the outcome is known and cancel stragglers
+            analyzer: Replacement for the LLM call, ``(provider, instance, ache_content, system_prompt) -> Dict``;
+                used by the fake-provider harness
+            cache: ConsensusCache answering repeated (content, prompt, providers, threshold) rounds
         """
         self.consensus_threshold = consensus_threshold
         self.total_providers = total_providers
-        self.openai_client = OpenAI()  # API key pre-configured in environment
+        self.provider_timeout = provider_timeout
+        self.hedge_delay = hedge_delay
+        self.early_return = early_return
+        self.analyzer = analyzer or self.query_provider
+        self.cache = cache
+
+        # Fan-out counters
+        self.hedged_requests = 0
+        self.timed_out_requests = 0
+
+        if analyzer is not None:
+            # Injected analyzer; no network clients needed
+            self.openai_client = None
+            self.anthropic_client = None
+            return
+
+        self.openai_client = AsyncOpenAI()  # API key pre-configured in environment
 
         # Initialize Anthropic client if available and API key is set
         if ANTHROPIC_AVAILABLE:
             try:
-                self.anthropic_client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+                self.anthropic_client = AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
             except (TypeError, ValueError):
                 # If API key not set or invalid, set to None
                 # Claude Sonnet 4 will fail gracefully if selected
@@ -139,11 +195,11 @@ class DistributedCoherenceProtocol:
             # Anthropic package not installed
             self.anthropic_client = None
 
-    async def analyze_ache_with_provider(
+    async def query_provider(
         self, provider: LLMProvider, instance: int, ache_content: Dict, system_prompt: str
-    ) -> ProviderOutput:
+    ) -> Dict:
         """
-        Analyze Ache content with a single provider instance
+        Request a coherence analysis from an LLM provider
 
         Args:
             provider: LLM provider to use
@@ -152,7 +208,7 @@ class DistributedCoherenceProtocol:
             system_prompt: System prompt for semantic analysis
 
         Returns:
-            ProviderOutput with analysis results
+            Parsed JSON output of the provider
         """
         # Prepare the analysis prompt
         user_prompt = f"""
@@ -180,7 +236,7 @@ Provide a JSON response with:
             # For Anthropic, we need to explicitly request JSON in the prompt
             anthropic_user_prompt = user_prompt + ANTHROPIC_JSON_INSTRUCTION
 
-            response = self.anthropic_client.messages.create(
+            response = await self.anthropic_client.messages.create(
                 model=provider.value,
                 max_tokens=1024,
                 temperature=0.1,
@@ -222,7 +278,7 @@ Provide a JSON response with:
                     raise ValueError("Failed to parse JSON from Anthropic response. No JSON object found.") from e
         else:
             # Use OpenAI API for all other providers
-            response = self.openai_client.chat.completions.create(
+            response = await self.openai_client.chat.completions.create(
                 model=provider.value,
                 messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
                 temperature=0.1,  # Low temperature for consistency
@@ -232,11 +288,78 @@ Provide a JSON response with:
             # Parse the OpenAI response
             output = json.loads(response.choices[0].message.content)
 
+        return output
+
+    async def analyze_ache_with_provider(
+        self, provider: LLMProvider, instance: int, ache_content: Dict, system_prompt: str
+    ) -> ProviderOutput:
+        """
+        Analyze Ache content with a single provider instance
+
+        Args:
+            provider: LLM provider to use
+            instance: Instance number for this provider
+            ache_content: Raw Ache content to analyze
+            system_prompt: System prompt for semantic analysis
+
+        Returns:
+            ProviderOutput with analysis results
+        """
+        output = await self.analyzer(provider, instance, ache_content, system_prompt)
+
         # Create and return provider output
         return ProviderOutput.create(provider=provider, instance=instance, output=output)
 
+    async def _analyze_hedged(
+        self, provider: LLMProvider, instance: int, ache_content: Dict, system_prompt: str
+    ) -> ProviderOutput:
+        """Run one provider request, duplicating it if no reply arrives within hedge_delay"""
+        primary = asyncio.ensure_future(
+            self.analyze_ache_with_provider(provider, instance, ache_content, system_prompt)
+        )
+        if self.hedge_delay is None:
+            return await primary
+
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.hedge_delay)
+            if not done:
+                self.hedged_requests += 1
+                pending.add(
+                    asyncio.ensure_future(
+                        self.analyze_ache_with_provider(provider, instance, ache_content, system_prompt)
+                    )
+                )
+
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _analyze_with_timeout(
+        self, provider: LLMProvider, instance: int, ache_content: Dict, system_prompt: str
+    ) -> ProviderOutput:
+        try:
+            return await asyncio.wait_for(
+                self._analyze_hedged(provider, instance, ache_content, system_prompt), self.provider_timeout
+            )
+        except asyncio.TimeoutError:
+            self.timed_out_requests += 1
+            raise TimeoutError(f"{provider.value} timed out after {self.provider_timeout}s") from None
+
     async def verify_consensus(
-        self, ache_content: Dict, ache_before: float, system_prompt: Optional[str] = None
+        self,
+        ache_content: Dict,
+        ache_before: float,
+        system_prompt: Optional[str] = None,
+        bypass_cache: bool = False,
     ) -> ConsensusResult:
         """
         Verify consensus across multiple providers
@@ -245,6 +368,7 @@ Provide a JSON response with:
             ache_content: Raw Ache content to analyze
             ache_before: Ache level before processing
             system_prompt: Optional custom system prompt
+            bypass_cache: Force re-verification; the fresh result still refreshes the cache
 
         Returns:
             ConsensusResult with verification outcome
@@ -263,27 +387,57 @@ viability, and technical soundness."""
             LLMProvider.CLAUDE_SONNET_4,
         ][: self.total_providers]
 
-        # Query all providers in parallel
-        tasks = [
-            self.analyze_ache_with_provider(
-                provider=provider, instance=i, ache_content=ache_content, system_prompt=system_prompt
-            )
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.key(ache_content, system_prompt, providers, self.consensus_threshold)
+            if bypass_cache:
+                self.cache.record_bypass()
+            else:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return replace(
+                        cached,
+                        consensus_group=str(uuid.uuid4()),
+                        cached=True,
+                        cached_from=cached.consensus_group,
+                    )
+
+        started = time.monotonic()
+
+        # Query all providers concurrently
+        tasks = {
+            asyncio.ensure_future(
+                self._analyze_with_timeout(
+                    provider=provider, instance=i, ache_content=ache_content, system_prompt=system_prompt
+                )
+            ): (provider, i)
             for i, provider in enumerate(providers)
-        ]
-
-        outputs = await asyncio.gather(*tasks)
+        }
 
-        # Group outputs by hash to find consensus
+        outputs: List[ProviderOutput] = []
+        failures: Dict[str, str] = {}
         hash_groups: Dict[str, List[ProviderOutput]] = {}
-        for output in outputs:
-            hash_key = output.output_hash
-            if hash_key not in hash_groups:
-                hash_groups[hash_key] = []
-            hash_groups[hash_key].append(output)
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    provider, instance = tasks[task]
+                    if task.exception() is not None:
+                        failures[f"{provider.value}#{instance}"] = str(task.exception())
+                        continue
+                    output = task.result()
+                    outputs.append(output)
+                    hash_groups.setdefault(output.output_hash, []).append(output)
+
+                if self.early_return and pending and self._consensus_decided(hash_groups, len(pending)):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
 
         # Find the largest consensus group
-        consensus_group_hash = max(hash_groups.keys(), key=lambda k: len(hash_groups[k]))
-        consensus_outputs = hash_groups[consensus_group_hash]
+        consensus_outputs = max(hash_groups.values(), key=len) if hash_groups else []
         consensus_count = len(consensus_outputs)
 
         # Check if consensus threshold is met
@@ -295,7 +449,7 @@ viability, and technical soundness."""
         # Create consensus result
         consensus_group_id = str(uuid.uuid4())
 
-        return ConsensusResult(
+        result = ConsensusResult(
             consensus_group=consensus_group_id,
             achieved=consensus_achieved,
             provider_count=len(outputs),
@@ -303,8 +457,22 @@ viability, and technical soundness."""
             outputs=outputs,
             final_output=final_output,
             verification_hashes=[output.output_hash for output in outputs],
+            failures=failures,
+            cancelled=len(pending),
+            latency_ms=(time.monotonic() - started) * 1000,
         )
 
+        # Only settled rounds are cached; failed ones should be retried
+        if cache_key is not None and consensus_achieved:
+            self.cache.put(cache_key, result)
+
+        return result
+
+    def _consensus_decided(self, hash_groups: Dict[str, List[ProviderOutput]], outstanding: int) -> bool:
+        """True once the threshold is met or can no longer be met by outstanding providers"""
+        largest = max((len(group) for group in hash_groups.values()), default=0)
+        return largest >= self.consensus_threshold or largest + outstanding < self.consensus_threshold
+
     def calculate_checksum_consensus(self, outputs: List[ProviderOutput]) -> Tuple[bool, str]:
         """
         Calculate 2-of-3 checksum consensus
@@ -355,6 +523,8 @@ viability, and technical soundness."""
                 "consensus_achieved": consensus_result.achieved,
                 "metadata": {"output": output.output, "timestamp": output.timestamp.isoformat()},
             }
+            if consensus_result.cached_from is not None:
+                record["metadata"]["cached_from"] = consensus_result.cached_from
             records.append(record)
 
         return records
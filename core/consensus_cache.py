@@ -0,0 +1,235 @@
+"""
+Consensus Cache - Content-addressed cache of coherence verification results
+
+Ingestion replays and retries submit the same Ache content many times.
+ConsensusCache stores ConsensusResults keyed by a canonical hash of
+(ache_content, system prompt, provider set, threshold) so duplicates are
+answered without querying the providers again.
+
+Two tiers:
+    memory  OrderedDict with TTL and LRU eviction (``max_entries``)
+    disk    optional SQLite table that survives restarts (``db_path``)
+
+Entries expire ``ttl`` seconds after they were stored in either tier.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .coherence_protocol import ConsensusResult, LLMProvider, ProviderOutput
+
+
+def consensus_key(ache_content: Dict, system_prompt: str, providers: List[LLMProvider], threshold: int) -> str:
+    """Canonical SHA-256 of everything that determines a consensus round"""
+    canonical = json.dumps(
+        {
+            "ache_content": ache_content,
+            "system_prompt": system_prompt,
+            "providers": [provider.value for provider in providers],
+            "threshold": threshold,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def encode_result(result: ConsensusResult) -> str:
+    """Serialize a ConsensusResult, including provider outputs"""
+    payload = result.to_dict()
+    payload["outputs"] = [
+        {
+            "provider": output.provider.value,
+            "instance": output.instance,
+            "output": output.output,
+            "output_hash": output.output_hash,
+            "signature": output.signature,
+            "timestamp": output.timestamp.isoformat(),
+        }
+        for output in result.outputs
+    ]
+    return json.dumps(payload, sort_keys=True, default=str)
+
+
+def decode_result(data: str) -> ConsensusResult:
+    """Rebuild a ConsensusResult serialized by encode_result"""
+    payload = json.loads(data)
+    outputs = [
+        ProviderOutput(
+            provider=LLMProvider(item["provider"]),
+            instance=item["instance"],
+            output=item["output"],
+            output_hash=item["output_hash"],
+            signature=item["signature"],
+            timestamp=datetime.fromisoformat(item["timestamp"]),
+        )
+        for item in payload["outputs"]
+    ]
+    return ConsensusResult(
+        consensus_group=payload["consensus_group"],
+        achieved=payload["consensus_achieved"],
+        provider_count=payload["provider_count"],
+        consensus_count=payload["consensus_count"],
+        outputs=outputs,
+        final_output=payload["final_output"],
+        verification_hashes=payload["verification_hashes"],
+    )
+
+
+class ConsensusCache:
+    """
+    ConsensusCache - TTL/LRU cache of ConsensusResults with optional SQLite tier
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 3600.0, db_path: Optional[str] = None):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Results kept in memory before LRU eviction
+            ttl: Seconds a result stays valid
+            db_path: SQLite file for the persistent tier (None keeps the cache in memory only)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.db_path = db_path
+
+        # key -> (expires_at, result)
+        self._entries: "OrderedDict[str, Tuple[float, ConsensusResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS consensus_cache ("
+                "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, result TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+        # Counters
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    key = staticmethod(consensus_key)
+
+    def get(self, key: str) -> Optional[ConsensusResult]:
+        """Look up a result, falling back to the disk tier on a memory miss"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return result
+                del self._entries[key]
+                self.expirations += 1
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT expires_at, result FROM consensus_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    expires_at, data = row
+                    if expires_at > now:
+                        result = decode_result(data)
+                        self._remember(key, expires_at, result)
+                        self.hits += 1
+                        self.disk_hits += 1
+                        return result
+                    self._db.execute("DELETE FROM consensus_cache WHERE key = ?", (key,))
+                    self._db.commit()
+                    self.expirations += 1
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, result: ConsensusResult):
+        """Store a result in both tiers"""
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._remember(key, expires_at, result)
+            self.stores += 1
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO consensus_cache (key, expires_at, result) VALUES (?, ?, ?)",
+                    (key, expires_at, encode_result(result)),
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, expires_at: float, result: ConsensusResult):
+        self._entries[key] = (expires_at, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def record_bypass(self):
+        """Count a forced re-verification"""
+        self.bypasses += 1
+
+    def purge_expired(self) -> int:
+        """Drop expired entries from both tiers; returns the number removed"""
+        now = time.time()
+        with self._lock:
+            expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+            for key in expired:
+                del self._entries[key]
+            removed = len(expired)
+            if self._db is not None:
+                removed += self._db.execute("DELETE FROM consensus_cache WHERE expires_at <= ?", (now,)).rowcount
+                self._db.commit()
+            self.expirations += removed
+            return removed
+
+    def clear(self):
+        """Remove every entry from both tiers"""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM consensus_cache")
+                self._db.commit()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict:
+        """Get hit/miss counters and tier sizes"""
+        lookups = self.hits + self.misses
+        stats = {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "bypasses": self.bypasses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+        if self._db is not None:
+            with self._lock:
+                stats["disk_entries"] = self._db.execute("SELECT COUNT(*) FROM consensus_cache").fetchone()[0]
+        return stats
+
+    def close(self):
+        """Close the SQLite connection"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
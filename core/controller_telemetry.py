@@ -0,0 +1,199 @@
+"""
+Controller Telemetry - Pluggable persistence sinks for control loops
+
+Keeps Supabase I/O out of the PID control loop. Controllers hand rows to a
+TelemetrySink, which decides whether the tick is sampled and where the row
+goes:
+
+    NullTelemetrySink      drop everything (simulations, benchmarks)
+    InMemoryTelemetrySink  keep rows in a bounded deque (tests, notebooks)
+    BatchedTelemetrySink   background thread, bulk inserts per table
+                           (core.write_behind.WriteBehindQueue)
+
+Sampling is per table: ``sample_every`` keeps every Nth tick and
+``sample_rate`` keeps a random fraction of the remaining ones, so a loop
+can run at thousands of Hz while still persisting a known share of ticks.
+"""
+
+import logging
+import random
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from core.write_behind import WriteBehindQueue
+
+logger = logging.getLogger(__name__)
+
+
+class TelemetrySink(ABC):
+    """
+    TelemetrySink - Sampling front end shared by all sinks
+
+    Subclasses implement ``write``.
+    """
+
+    def __init__(self, sample_every: int = 1, sample_rate: float = 1.0, seed: Optional[int] = None):
+        """
+        Initialize sink
+
+        Args:
+            sample_every: Keep one tick in N per table (decimation)
+            sample_rate: Probability of keeping a decimated tick
+            seed: Seed for sample_rate draws
+        """
+        if sample_every < 1:
+            raise ValueError("sample_every must be >= 1")
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.sample_every = sample_every
+        self.sample_rate = sample_rate
+        self._rng = random.Random(seed)
+        self._ticks: Dict[str, int] = {}
+
+        self.offered = 0
+        self.sampled = 0
+
+    def sample(self, table: str) -> bool:
+        """Advance the tick counter for ``table`` and report whether this tick is kept"""
+        self.offered += 1
+        tick = self._ticks.get(table, 0)
+        self._ticks[table] = tick + 1
+        if tick % self.sample_every:
+            return False
+        if self.sample_rate < 1.0 and self._rng.random() >= self.sample_rate:
+            return False
+        self.sampled += 1
+        return True
+
+    @abstractmethod
+    def write(self, table: str, row: Dict):
+        """Persist a sampled row"""
+
+    def emit(self, table: str, row: Dict) -> bool:
+        """Sample and write in one call; returns True if the row was kept"""
+        if not self.sample(table):
+            return False
+        self.write(table, row)
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        return True
+
+    def close(self, timeout: Optional[float] = None):
+        pass
+
+    def get_metrics(self) -> Dict:
+        return {"offered": self.offered, "sampled": self.sampled}
+
+
+class NullTelemetrySink(TelemetrySink):
+    """Drops every tick without building rows"""
+
+    def sample(self, table: str) -> bool:
+        self.offered += 1
+        return False
+
+    def write(self, table: str, row: Dict):
+        pass
+
+
+class InMemoryTelemetrySink(TelemetrySink):
+    """Keeps sampled rows in memory"""
+
+    def __init__(self, maxlen: Optional[int] = 10000, **kwargs):
+        super().__init__(**kwargs)
+        self.rows: Deque[Tuple[str, Dict]] = deque(maxlen=maxlen)
+
+    def write(self, table: str, row: Dict):
+        self.rows.append((table, row))
+
+    def rows_for(self, table: str) -> List[Dict]:
+        return [row for name, row in self.rows if name == table]
+
+
+class BatchedTelemetrySink(WriteBehindQueue, TelemetrySink):
+    """
+    BatchedTelemetrySink - Background bulk inserts into Supabase
+
+    ``write`` never blocks: when the queue is full the row is dropped and
+    counted. Failed inserts are logged and counted rather than swallowed.
+    Queued rows are flushed at interpreter exit, so short scripts keep
+    their telemetry.
+    """
+
+    thread_name = "controller-telemetry"
+
+    def __init__(
+        self,
+        client: Any = None,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10000,
+        **kwargs,
+    ):
+        """
+        Initialize sink
+
+        Args:
+            client: Supabase client (defaults to ``core.db.get_supabase()``)
+            batch_size: Rows collected before a flush
+            flush_interval: Maximum seconds a row waits before being flushed
+            max_queue_size: Bound on queued rows; further rows are dropped
+            **kwargs: Sampling options for TelemetrySink
+        """
+        TelemetrySink.__init__(self, **kwargs)
+        WriteBehindQueue.__init__(
+            self, client=client, batch_size=batch_size, flush_interval=flush_interval, max_queue_size=max_queue_size
+        )
+
+        self.written = 0
+        self.failed = 0
+
+    def write(self, table: str, row: Dict):
+        self._enqueue((table, row))
+
+    def _write_batch(self, batch: List[Tuple[str, Dict]]):
+        by_table: Dict[str, List[Dict]] = {}
+        for table, row in batch:
+            by_table.setdefault(table, []).append(row)
+
+        for table, rows in by_table.items():
+            try:
+                self.client.table(table).insert(rows).execute()
+            except Exception as e:
+                with self._lock:
+                    self.failed += len(rows)
+                logger.warning("Failed to persist %d %s telemetry rows: %s", len(rows), table, e)
+            else:
+                with self._lock:
+                    self.written += len(rows)
+
+    def get_metrics(self) -> Dict:
+        with self._lock:
+            metrics = TelemetrySink.get_metrics(self)
+            metrics.update(WriteBehindQueue.get_metrics(self))
+            metrics.update({"written": self.written, "failed": self.failed})
+        return metrics
+
+
+_default_sink: Optional[TelemetrySink] = None
+_default_lock = threading.Lock()
+
+
+def get_default_telemetry_sink() -> TelemetrySink:
+    """Process-wide sink used by controllers that are not given one"""
+    global _default_sink
+    if _default_sink is None:
+        with _default_lock:
+            if _default_sink is None:
+                _default_sink = BatchedTelemetrySink()
+    return _default_sink
+
+
+def set_default_telemetry_sink(sink: Optional[TelemetrySink]):
+    """Replace the process-wide sink (None restores the batched default on next use)"""
+    global _default_sink
+    with _default_lock:
+        _default_sink = sink
@@ -1,6 +1,8 @@
 import os
 from supabase import create_client, Client
 
+from core.supabase_registry import ROLE_SERVICE, get_client_registry
+
 _supabase: Client | None = None
 
 def get_supabase() -> Client:
@@ -16,5 +18,5 @@ def get_supabase() -> Client:
         if not url or not key:
             raise ValueError("Missing SUPABASE_URL or SUPABASE_SERVICE_ROLE_KEY environment variables.")
             
-        _supabase = create_client(url, key)
+        _supabase = get_client_registry().client_for(url, key, role=ROLE_SERVICE, factory=create_client)
     return _supabase
@@ -0,0 +1,331 @@
+"""
+Glyph Graph - Interned glyph registry and compact binding adjacency
+
+Backs the Glyphic Binding Engine's symbolic space with columnar storage
+instead of per-glyph Python sets:
+
+- GlyphRegistry interns glyph UUIDs to dense integer slots and keeps each
+  glyph's coherence in a float64 column with a running sum, so the mean
+  coherence of the space is O(1). Slots of removed glyphs are recycled once
+  the binding graph has dropped their edges, so the slot range (and every
+  CSR rebuild) stays proportional to the live glyph count under churn.
+- BindingGraph stores bindings as a CSR adjacency (int32 neighbour slots and
+  uint8 strength codes). Updates land in a per-slot overlay that reads
+  consult directly (the last write per glyph pair wins) and are folded into
+  the CSR only once the overlay is large relative to the merged edges.
+
+A binding costs ~10 bytes in the CSR (both directions) versus a few hundred
+bytes for UUID strings held in two sets and two dicts.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+UNBOUND = 0
+
+
+class GlyphRegistry:
+    """
+    GlyphRegistry - Glyph UUID <-> integer slot interning
+
+    Removed slots are marked dead in ``alive`` and become reusable after
+    ``recycle()``, which the BindingGraph calls once no edge refers to them.
+    Until then a dead slot is never handed out, so stale edges cannot attach
+    to a new glyph.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.index: Dict[str, int] = {}
+        self.ids: List[Optional[str]] = []
+        self._dead: List[int] = []  # removed, may still have edges
+        self._free: List[int] = []  # removed and purged, ready for reuse
+
+        self.coherence = np.zeros(capacity, dtype=np.float64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.coherence_total = 0.0
+
+    def _grow(self, size: int):
+        capacity = max(size, 2 * len(self.coherence))
+        self.coherence = np.resize(self.coherence, capacity)
+        self.alive = np.resize(self.alive, capacity)
+        self.alive[len(self.ids):] = False
+
+    def intern(self, glyph_id: str, coherence: float) -> int:
+        """Register a glyph and return its slot"""
+        if self._free:
+            slot = self._free.pop()
+            self.ids[slot] = glyph_id
+        else:
+            slot = len(self.ids)
+            if slot >= len(self.coherence):
+                self._grow(slot + 1)
+            self.ids.append(glyph_id)
+
+        self.index[glyph_id] = slot
+        self.coherence[slot] = coherence
+        self.alive[slot] = True
+        self.coherence_total += coherence
+        return slot
+
+    def slot(self, glyph_id: str) -> Optional[int]:
+        return self.index.get(glyph_id)
+
+    def slots(self, glyph_ids: Iterable[str]) -> np.ndarray:
+        """Slots for known glyph IDs, in order (unknown IDs are skipped)"""
+        index = self.index
+        return np.fromiter((index[g] for g in glyph_ids if g in index), dtype=np.int64)
+
+    def set_coherence(self, slot: int, coherence: float):
+        self.coherence_total += coherence - self.coherence[slot]
+        self.coherence[slot] = coherence
+
+    def remove(self, glyph_ids: Iterable[str]) -> np.ndarray:
+        """Unregister glyphs; returns their slots"""
+        removed = np.fromiter((self.index.pop(g) for g in glyph_ids if g in self.index), dtype=np.int64)
+        for slot in removed:
+            self.ids[slot] = None
+        self.alive[removed] = False
+        self.coherence_total -= float(self.coherence[removed].sum())
+        self.coherence[removed] = 0.0
+        self._dead.extend(removed.tolist())
+        return removed
+
+    def recycle(self):
+        """Make removed slots reusable; only call once no binding refers to them"""
+        self._free.extend(self._dead)
+        self._dead.clear()
+
+    @property
+    def num_slots(self) -> int:
+        """Slots handed out so far, live or dead"""
+        return len(self.ids)
+
+    @property
+    def mean_coherence(self) -> float:
+        return self.coherence_total / len(self.index) if self.index else 1.0
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, glyph_id: str) -> bool:
+        return glyph_id in self.index
+
+
+class BindingGraph:
+    """
+    BindingGraph - Undirected, weighted CSR adjacency over glyph slots
+
+    Strength codes are small positive integers; binding with ``UNBOUND`` (0)
+    removes a binding. Writes land in a per-slot overlay that reads consult
+    directly, so interleaved bind/read calls stay O(degree). The overlay is
+    folded into a fresh CSR once it holds more than ``merge_ratio`` of the
+    merged edges (and at least ``merge_min`` pairs), or on the first read
+    after glyphs were removed. Each merge drops edges to dead slots and then
+    recycles those slots in the registry, so a registry must back only one
+    graph.
+    """
+
+    def __init__(self, registry: GlyphRegistry, merge_ratio: float = 0.25, merge_min: int = 1024):
+        self.registry = registry
+        self.merge_ratio = merge_ratio
+        self.merge_min = merge_min
+
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.empty(0, dtype=np.int32)
+        self.codes = np.empty(0, dtype=np.uint8)
+
+        # Writes since the last merge, stored both ways: slot -> {neighbour: code}
+        self._pending: Dict[int, Dict[int, int]] = {}
+        self._pending_pairs = 0
+        self._stale = False
+
+        self.merges = 0
+
+    def bind(self, slot_1: int, slot_2: int, code: int):
+        row = self._pending.setdefault(slot_1, {})
+        if slot_2 not in row:
+            self._pending_pairs += 1
+        row[slot_2] = code
+        if slot_1 != slot_2:
+            self._pending.setdefault(slot_2, {})[slot_1] = code
+
+    def unbind(self, slot_1: int, slot_2: int):
+        self.bind(slot_1, slot_2, UNBOUND)
+
+    def invalidate(self):
+        """Drop edges to dead registry slots on the next read"""
+        self._stale = True
+
+    def compact(self):
+        """Fold pending writes and drop dead slots now, releasing the slots for reuse"""
+        self._stale = True
+        self._merge()
+
+    def _upper_edges(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        rows = np.repeat(np.arange(len(self.indptr) - 1, dtype=np.int64), np.diff(self.indptr))
+        cols = self.indices.astype(np.int64)
+        upper = rows <= cols
+        return rows[upper], cols[upper], self.codes[upper]
+
+    def _merge(self):
+        """Fold the overlay and dead slots into a fresh CSR"""
+        num_slots = self.registry.num_slots
+        lo, hi, codes = self._upper_edges()
+        if self._pending:
+            pairs = [
+                (slot, neighbour, code)
+                for slot, row in self._pending.items()
+                for neighbour, code in row.items()
+                if slot <= neighbour
+            ]
+            new_lo, new_hi, new_codes = (np.array(column, dtype=np.int64) for column in zip(*pairs))
+            self._pending = {}
+            self._pending_pairs = 0
+
+            # Pending writes replace merged edges for the same pair
+            stride = max(num_slots, 1)
+            kept = ~np.isin(lo * stride + hi, new_lo * stride + new_hi)
+            lo = np.concatenate([lo[kept], new_lo])
+            hi = np.concatenate([hi[kept], new_hi])
+            codes = np.concatenate([codes[kept], new_codes.astype(np.uint8)])
+
+        alive = self.registry.alive
+        live = (codes != UNBOUND) & alive[lo] & alive[hi]
+        lo, hi, codes = lo[live], hi[live], codes[live]
+        # No edge (merged or pending) touches a dead slot any more
+        self.registry.recycle()
+
+        # Expand to both directions (self-bindings once)
+        mirror = lo != hi
+        rows = np.concatenate([lo, hi[mirror]])
+        cols = np.concatenate([hi, lo[mirror]])
+        both_codes = np.concatenate([codes, codes[mirror]])
+
+        order = np.lexsort((cols, rows))
+        self.indices = cols[order].astype(np.int32)
+        self.codes = both_codes[order].astype(np.uint8)
+        self.indptr = np.zeros(num_slots + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=num_slots), out=self.indptr[1:])
+
+        self._stale = False
+        self.merges += 1
+
+    def _ensure_merged(self):
+        if self._stale or self._pending_pairs > max(self.merge_min, self.merge_ratio * len(self.indices)):
+            self._merge()
+        elif len(self.indptr) <= self.registry.num_slots:
+            # New glyphs without merged bindings: extend with empty rows, doubling to amortize
+            size = max(self.registry.num_slots + 1, 2 * len(self.indptr))
+            grown = np.full(size, self.indptr[-1], dtype=np.int64)
+            grown[: len(self.indptr)] = self.indptr
+            self.indptr = grown
+
+    def _merged_code(self, slot: int, neighbour: int) -> int:
+        start, end = self.indptr[slot], self.indptr[slot + 1]
+        position = start + int(np.searchsorted(self.indices[start:end], neighbour))
+        if position < end and self.indices[position] == neighbour:
+            return int(self.codes[position])
+        return UNBOUND
+
+    def neighbours(self, slot: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Neighbour slots (ascending) and strength codes of one slot"""
+        self._ensure_merged()
+        start, end = self.indptr[slot], self.indptr[slot + 1]
+        indices, codes = self.indices[start:end], self.codes[start:end]
+        pending = self._pending.get(slot)
+        if not pending:
+            return indices, codes
+
+        row = dict(zip(indices.tolist(), codes.tolist()))
+        row.update(pending)
+        bound = sorted((neighbour, code) for neighbour, code in row.items() if code != UNBOUND)
+        return (
+            np.array([neighbour for neighbour, _ in bound], dtype=np.int32),
+            np.array([code for _, code in bound], dtype=np.uint8),
+        )
+
+    def _pending_positions(self, slots: np.ndarray) -> np.ndarray:
+        """Positions in ``slots`` whose rows have pending writes"""
+        if not self._pending:
+            return np.empty(0, dtype=np.int64)
+        pending = self._pending
+        return np.flatnonzero(np.fromiter((slot in pending for slot in slots.tolist()), dtype=bool, count=len(slots)))
+
+    def degrees(self, slots: Sequence[int]) -> np.ndarray:
+        self._ensure_merged()
+        slots = np.asarray(slots, dtype=np.int64)
+        degrees = self.indptr[slots + 1] - self.indptr[slots]
+        for position in self._pending_positions(slots):
+            degrees[position] = len(self.neighbours(int(slots[position]))[0])
+        return degrees
+
+    def subgraph(self, slots: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Edges with both endpoints in ``slots``
+
+        Returns:
+            (src, dst) slot arrays, grouped by ``slots`` order and sorted by
+            dst within each source
+        """
+        self._ensure_merged()
+        if not len(slots):
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        members = np.zeros(self.registry.num_slots, dtype=bool)
+        members[slots] = True
+
+        starts = self.indptr[slots]
+        counts = self.indptr[slots + 1] - starts
+        total = int(counts.sum())
+        offsets = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+        positions = np.repeat(starts, counts) + offsets
+
+        src = np.repeat(slots, counts)
+        dst = self.indices[positions].astype(np.int64)
+        inside = members[dst]
+        src, dst = src[inside], dst[inside]
+
+        touched = self._pending_positions(slots)
+        if not len(touched):
+            return src, dst
+
+        # Rows with pending writes: replace their merged edges with the overlaid row
+        touched_slots = slots[touched]
+        untouched = ~np.isin(src, touched_slots)
+        extra_src, extra_dst = [src[untouched]], [dst[untouched]]
+        for slot in touched_slots.tolist():
+            neighbours = self.neighbours(slot)[0].astype(np.int64)
+            neighbours = neighbours[members[neighbours]]
+            extra_src.append(np.full(len(neighbours), slot, dtype=np.int64))
+            extra_dst.append(neighbours)
+        src, dst = np.concatenate(extra_src), np.concatenate(extra_dst)
+
+        order_of = np.empty(self.registry.num_slots, dtype=np.int64)
+        order_of[slots] = np.arange(len(slots))
+        order = np.lexsort((dst, order_of[src]))
+        return src[order], dst[order]
+
+    def count_edges_touching(self, slots: np.ndarray) -> int:
+        """Bindings from ``slots`` to slots outside the set"""
+        if not len(slots):
+            return 0
+        src, _ = self.subgraph(slots)
+        return int(self.degrees(slots).sum() - len(src))
+
+    @property
+    def num_bindings(self) -> int:
+        """Undirected bindings (self-bindings count once)"""
+        self._ensure_merged()
+        rows = np.repeat(np.arange(len(self.indptr) - 1, dtype=np.int64), np.diff(self.indptr))
+        count = int((rows <= self.indices).sum())
+        for slot, row in self._pending.items():
+            for neighbour, code in row.items():
+                if slot <= neighbour:
+                    count += (code != UNBOUND) - (self._merged_code(slot, neighbour) != UNBOUND)
+        return count
+
+    @property
+    def nbytes(self) -> int:
+        return self.indptr.nbytes + self.indices.nbytes + self.codes.nbytes
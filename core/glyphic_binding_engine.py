@@ -16,11 +16,17 @@ Key Concepts:
 - Coherence: Structural integrity of symbolic space
 """
 
+import heapq
+import time
 import uuid
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from core.glyph_graph import BindingGraph, GlyphRegistry
 
 
 class GlyphType(Enum):
@@ -43,6 +49,11 @@ class BindingStrength(Enum):
     ABSOLUTE = "absolute"  # Inseparable
 
 
+# Compact codes for BindingGraph (0 is reserved for "unbound")
+STRENGTH_CODES: Dict[BindingStrength, int] = {strength: code for code, strength in enumerate(BindingStrength, start=1)}
+STRENGTHS_BY_CODE: Dict[int, BindingStrength] = {code: strength for strength, code in STRENGTH_CODES.items()}
+
+
 @dataclass
 class Glyph:
     """
@@ -59,9 +70,8 @@ class Glyph:
     symbol: str = ""  # Symbolic representation
     semantic_content: Dict = field(default_factory=dict)
 
-    # Bindings
-    bound_to: Set[str] = field(default_factory=set)  # IDs of bound glyphs
-    binding_strengths: Dict[str, BindingStrength] = field(default_factory=dict)
+    # Bindings of a standalone glyph; engine glyphs read and write the engine's BindingGraph
+    _bindings: Dict[str, BindingStrength] = field(default_factory=dict, init=False, repr=False)
 
     # Provenance
     source: str = ""  # Origin (e.g., "paradox_network", "user_input")
@@ -77,30 +87,57 @@ class Glyph:
     access_count: int = 0
     metadata: Dict = field(default_factory=dict)
 
+    # Set by the engine so accesses keep its eviction index current
+    on_access: Optional[Callable[["Glyph"], None]] = field(default=None, repr=False, compare=False)
+    # Set by the engine that owns this glyph and keeps its bindings
+    engine: Optional["GlyphicBindingEngine"] = field(default=None, repr=False, compare=False)
+
+    @property
+    def bound_to(self) -> Set[str]:
+        """IDs of bound glyphs"""
+        return set(self.get_bindings())
+
+    @property
+    def binding_strengths(self) -> Dict[str, BindingStrength]:
+        """Binding strength per bound glyph ID"""
+        return self.get_bindings()
+
     def bind_to(self, other_glyph_id: str, strength: BindingStrength):
         """Create semantic binding to another glyph"""
-        self.bound_to.add(other_glyph_id)
-        self.binding_strengths[other_glyph_id] = strength
+        if self.engine is not None:
+            self.engine.bind_glyphs(self.id, other_glyph_id, strength)
+        else:
+            self._bindings[other_glyph_id] = strength
 
     def unbind_from(self, other_glyph_id: str):
         """Remove semantic binding"""
-        if other_glyph_id in self.bound_to:
-            self.bound_to.remove(other_glyph_id)
-            del self.binding_strengths[other_glyph_id]
+        if self.engine is not None:
+            self.engine.unbind_glyphs(self.id, other_glyph_id)
+        else:
+            self._bindings.pop(other_glyph_id, None)
+
+    def get_bindings(self) -> Dict[str, BindingStrength]:
+        """Bound glyph IDs and strengths, from the owning engine when there is one"""
+        if self.engine is not None:
+            return self.engine.get_bindings(self.id)
+        return dict(self._bindings)
 
-    def access(self):
+    def access(self, count: int = 1):
         """Record access to this glyph"""
         self.last_accessed = datetime.now(timezone.utc)
-        self.access_count += 1
+        self.access_count += count
+        if self.on_access is not None:
+            self.on_access(self)
 
     def to_dict(self) -> Dict:
+        bindings = self.get_bindings()
         return {
             "id": self.id,
             "glyph_type": self.glyph_type.value,
             "symbol": self.symbol,
             "semantic_content": self.semantic_content,
-            "bound_to": list(self.bound_to),
-            "binding_strengths": {k: v.value for k, v in self.binding_strengths.items()},
+            "bound_to": list(bindings),
+            "binding_strengths": {k: v.value for k, v in bindings.items()},
             "source": self.source,
             "created_by": self.created_by,
             "coherence_score": self.coherence_score,
@@ -112,6 +149,83 @@ class Glyph:
         }
 
 
+class GlyphEvictionIndex:
+    """
+    Eviction order over the glyph store
+
+    A min-heap keyed per policy with lazy invalidation: every add or access
+    pushes a fresh entry (O(log n)) and superseded entries are skipped when
+    popped. The heap is rebuilt once stale entries outnumber live ones.
+
+    Policies:
+        "lfu"    fewest accesses first, least recently used among ties
+        "lru-k"  oldest K-th most recent access first (glyphs with fewer than
+                 K accesses go first, least recently used among them)
+    """
+
+    POLICIES = ("lfu", "lru-k")
+
+    def __init__(self, policy: str = "lfu", k: int = 2):
+        if policy not in self.POLICIES:
+            raise ValueError(f"policy must be one of {self.POLICIES}, got {policy!r}")
+        self.policy = policy
+        self.k = k
+
+        self._heap: List[Tuple[Tuple[int, int], str]] = []
+        self._keys: Dict[str, Tuple[int, int]] = {}
+        self._history: Dict[str, Deque[int]] = {}
+        self._clock = 0
+
+        self.compactions = 0
+
+    def _key(self, glyph: "Glyph") -> Tuple[int, int]:
+        self._clock += 1
+        if self.policy == "lfu":
+            return (glyph.access_count, self._clock)
+
+        history = self._history.setdefault(glyph.id, deque(maxlen=self.k))
+        history.append(self._clock)
+        kth_recent = history[0] if len(history) == self.k else -1
+        return (kth_recent, self._clock)
+
+    def touch(self, glyph: "Glyph"):
+        """Record an add or access"""
+        key = self._key(glyph)
+        self._keys[glyph.id] = key
+        heapq.heappush(self._heap, (key, glyph.id))
+        if len(self._heap) > 2 * len(self._keys) + 64:
+            self._compact()
+
+    add = touch
+
+    def remove(self, glyph_id: str):
+        self._keys.pop(glyph_id, None)
+        self._history.pop(glyph_id, None)
+
+    def pop_victims(self, count: int) -> List[str]:
+        """Remove and return up to ``count`` glyph IDs in eviction order"""
+        victims = []
+        heap = self._heap
+        while heap and len(victims) < count:
+            key, glyph_id = heapq.heappop(heap)
+            if self._keys.get(glyph_id) == key:
+                victims.append(glyph_id)
+                self.remove(glyph_id)
+        return victims
+
+    def _compact(self):
+        self._heap = [(key, glyph_id) for glyph_id, key in self._keys.items()]
+        heapq.heapify(self._heap)
+        self.compactions += 1
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def heap_size(self) -> int:
+        return len(self._heap)
+
+
 @dataclass
 class Sigil:
     """
@@ -154,15 +268,15 @@ class Sigil:
 
     def calculate_coherence(self, glyphs: Dict[str, Glyph]) -> float:
         """Calculate coherence of this sigil based on component glyphs"""
+        total_coherence = sum(glyphs[g].coherence_score for g in self.component_glyphs if g in glyphs)
+        return self.score_coherence(total_coherence)
+
+    def score_coherence(self, total_coherence: float) -> float:
+        """Set coherence from the summed coherence of known component glyphs"""
         if not self.component_glyphs:
             return 0.0
 
         # Average coherence of component glyphs
-        total_coherence = 0.0
-        for glyph_id in self.component_glyphs:
-            if glyph_id in glyphs:
-                total_coherence += glyphs[glyph_id].coherence_score
-
         avg_coherence = total_coherence / len(self.component_glyphs)
 
         # Bonus for strong bindings
@@ -191,7 +305,8 @@ class SigilThread:
     SigilThread - Parallel processing thread for glyph streams
 
     Enables parallel processing of multiple glyph streams to handle
-    high-velocity complexity from the Paradox Network.
+    high-velocity complexity from the Paradox Network. Each thread owns a
+    FIFO work queue that the engine's worker pool drains.
     """
 
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -199,7 +314,7 @@ class SigilThread:
 
     # Processing
     sigils: List[str] = field(default_factory=list)  # Sigil IDs
-    processing_queue: List[str] = field(default_factory=list)  # Glyph IDs to process
+    processing_queue: Deque[str] = field(default_factory=deque)  # Glyph IDs to process
 
     # Performance
     glyphs_processed: int = 0
@@ -217,12 +332,32 @@ class SigilThread:
         """Add glyph to processing queue"""
         self.processing_queue.append(glyph_id)
 
+    def enqueue_glyphs(self, glyph_ids: Sequence[str]):
+        """Add a stream of glyphs to processing queue"""
+        self.processing_queue.extend(glyph_ids)
+
     def dequeue_glyph(self) -> Optional[str]:
         """Remove and return next glyph from queue"""
         if self.processing_queue:
-            return self.processing_queue.pop(0)
+            return self.processing_queue.popleft()
         return None
 
+    def drain(self, known_glyphs: Dict[str, "Glyph"]) -> List[str]:
+        """
+        Empty the queue, keeping IDs of glyphs that exist
+
+        Does not touch shared engine state beyond reading ``known_glyphs``,
+        so several threads can be drained concurrently.
+        """
+        queue = self.processing_queue
+        processed = []
+        while queue:
+            glyph_id = queue.popleft()
+            if glyph_id in known_glyphs:
+                processed.append(glyph_id)
+        self.glyphs_processed += len(processed)
+        return processed
+
     def add_sigil(self, sigil_id: str):
         """Register a sigil with this thread"""
         if sigil_id not in self.sigils:
@@ -259,7 +394,14 @@ class GlyphicBindingEngine:
     while maintaining structural integrity of the symbolic space.
     """
 
-    def __init__(self, max_threads: int = 5, coherence_threshold: float = 0.5, max_glyphs: int = 10000):
+    def __init__(
+        self,
+        max_threads: int = 5,
+        coherence_threshold: float = 0.5,
+        max_glyphs: int = 10000,
+        workers: int = 1,
+        eviction_policy: str = "lfu",
+    ):
         """
         Initialize Glyphic Binding Engine
 
@@ -267,14 +409,32 @@ class GlyphicBindingEngine:
             max_threads: Maximum number of SigilThreads
             coherence_threshold: Minimum coherence for glyph acceptance
             max_glyphs: Maximum glyphs in symbolic space
+            workers: Worker pool size for draining SigilThreads. Draining is pure Python and
+                holds the GIL, so the default of 1 drains serially; raise it only when
+                streams wait on I/O
+            eviction_policy: "lfu" or "lru-k" order used when the glyph store is full
         """
         self.glyphs: Dict[str, Glyph] = {}
+        self.registry = GlyphRegistry()
+        self.bindings = BindingGraph(self.registry)
         self.sigils: Dict[str, Sigil] = {}
         self.threads: Dict[str, SigilThread] = {}
 
         self.max_threads = max_threads
         self.coherence_threshold = coherence_threshold
         self.max_glyphs = max_glyphs
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Eviction order over self.glyphs
+        self.eviction_index = GlyphEvictionIndex(policy=eviction_policy)
+        self.eviction_rounds = 0
+        self.glyphs_evicted = 0
+        self.bindings_removed = 0
+        self.last_eviction_ms = 0.0
+        self.total_eviction_ms = 0.0
 
         # Performance metrics
         self.total_glyphs_created = 0
@@ -330,6 +490,10 @@ class GlyphicBindingEngine:
             glyph.coherence_score = self.coherence_threshold
 
         self.glyphs[glyph.id] = glyph
+        self.registry.intern(glyph.id, glyph.coherence_score)
+        glyph.on_access = self.eviction_index.touch
+        glyph.engine = self
+        self.eviction_index.add(glyph)
         self.total_glyphs_created += 1
 
         return glyph
@@ -364,20 +528,43 @@ class GlyphicBindingEngine:
         Returns:
             True if binding created
         """
-        if glyph_id_1 not in self.glyphs or glyph_id_2 not in self.glyphs:
+        slot_1 = self.registry.slot(glyph_id_1)
+        slot_2 = self.registry.slot(glyph_id_2)
+        if slot_1 is None or slot_2 is None:
             return False
 
-        glyph1 = self.glyphs[glyph_id_1]
-        glyph2 = self.glyphs[glyph_id_2]
-
-        # Create bidirectional binding
-        glyph1.bind_to(glyph_id_2, strength)
-        glyph2.bind_to(glyph_id_1, strength)
+        # Bindings are undirected in the graph
+        self.bindings.bind(slot_1, slot_2, STRENGTH_CODES[strength])
 
         self.total_bindings_created += 1
 
         return True
 
+    def unbind_glyphs(self, glyph_id_1: str, glyph_id_2: str) -> bool:
+        """Remove the semantic binding between two glyphs"""
+        slot_1 = self.registry.slot(glyph_id_1)
+        slot_2 = self.registry.slot(glyph_id_2)
+        if slot_1 is None or slot_2 is None:
+            return False
+
+        self.bindings.unbind(slot_1, slot_2)
+        return True
+
+    def get_bindings(self, glyph_id: str) -> Dict[str, BindingStrength]:
+        """Bound glyph IDs and binding strengths of a glyph"""
+        slot = self.registry.slot(glyph_id)
+        if slot is None:
+            return {}
+
+        ids = self.registry.ids
+        neighbours, codes = self.bindings.neighbours(slot)
+        return {ids[n]: STRENGTHS_BY_CODE[c] for n, c in zip(neighbours.tolist(), codes.tolist())}
+
+    def set_glyph_coherence(self, glyph_id: str, coherence_score: float):
+        """Update a glyph's coherence, keeping the running coherence sum current"""
+        self.glyphs[glyph_id].coherence_score = coherence_score
+        self.registry.set_coherence(self.registry.index[glyph_id], coherence_score)
+
     def create_sigil(self, name: str, glyph_ids: List[str], emergent_meaning: str = "") -> Sigil:
         """
         Create a sigil from component glyphs
@@ -392,16 +579,15 @@ class GlyphicBindingEngine:
         """
         sigil = Sigil(name=name, component_glyphs=glyph_ids, emergent_meaning=emergent_meaning)
 
-        # Build binding graph from glyph bindings
-        for glyph_id in glyph_ids:
-            if glyph_id in self.glyphs:
-                glyph = self.glyphs[glyph_id]
-                for bound_id in glyph.bound_to:
-                    if bound_id in glyph_ids:
-                        sigil.add_binding(glyph_id, bound_id)
+        # Build binding graph from the member subgraph
+        ids = self.registry.ids
+        members = self.registry.slots(dict.fromkeys(glyph_ids))
+        src, dst = self.bindings.subgraph(members)
+        for from_slot, to_slot in zip(src.tolist(), dst.tolist()):
+            sigil.binding_graph.setdefault(ids[from_slot], []).append(ids[to_slot])
 
         # Calculate coherence
-        sigil.calculate_coherence(self.glyphs)
+        sigil.score_coherence(float(self.registry.coherence[self.registry.slots(glyph_ids)].sum()))
 
         self.sigils[sigil.id] = sigil
         self.total_sigils_created += 1
@@ -442,32 +628,79 @@ class GlyphicBindingEngine:
             thread = self.threads[thread_id]
         else:
             # Use default thread
-            thread = list(self.threads.values())[0]
-
-        # Enqueue glyphs
-        for glyph_id in glyph_ids:
-            thread.enqueue_glyph(glyph_id)
-
-        # Process glyphs
-        processed_glyphs = []
-        while thread.processing_queue:
-            glyph_id = thread.dequeue_glyph()
-            if glyph_id and glyph_id in self.glyphs:
-                self.glyphs[glyph_id].access()
-                processed_glyphs.append(glyph_id)
-                thread.glyphs_processed += 1
-
-        # Create sigil from processed glyphs
-        sigil = self.create_sigil(
-            name=f"Stream Sigil {thread.sigils_created + 1}",
-            glyph_ids=processed_glyphs,
-            emergent_meaning="Synthesized from glyph stream",
-        )
+            thread = next(iter(self.threads.values()))
 
-        sigil.thread_id = thread.id
-        thread.add_sigil(sigil.id)
+        return self.process_glyph_streams([glyph_ids], thread_ids=[thread.id])[0]
 
-        return sigil
+    def process_glyph_streams(
+        self, streams: Sequence[Sequence[str]], thread_ids: Optional[Sequence[str]] = None
+    ) -> List[Sigil]:
+        """
+        Process several glyph streams concurrently, one sigil per stream
+
+        Streams are assigned to SigilThreads round-robin (or by ``thread_ids``),
+        each thread's queue is drained by the worker pool, and the results are
+        merged into the engine in stream order, so sigils, access counts and
+        thread statistics do not depend on worker scheduling.
+
+        Args:
+            streams: Glyph ID streams
+            thread_ids: Optional SigilThread ID per stream
+
+        Returns:
+            Resulting sigils, in stream order
+        """
+        threads = list(self.threads.values())
+        assignments: List[SigilThread] = []
+        for index in range(len(streams)):
+            thread_id = thread_ids[index] if thread_ids else None
+            assignments.append(self.threads.get(thread_id) or threads[index % len(threads)])
+
+        # Streams sharing a SigilThread are drained in order by the same worker
+        jobs: Dict[str, List[int]] = {}
+        for index, thread in enumerate(assignments):
+            jobs.setdefault(thread.id, []).append(index)
+
+        def drain(job: Tuple[SigilThread, List[int]]) -> List[Tuple[int, List[str]]]:
+            thread, indexes = job
+            results = []
+            for index in indexes:
+                thread.enqueue_glyphs(streams[index])
+                results.append((index, thread.drain(self.glyphs)))
+            return results
+
+        work = [(self.threads[thread_id], indexes) for thread_id, indexes in jobs.items()]
+        if self.workers > 1 and len(work) > 1:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sigil-thread")
+            drained = [result for results in self._executor.map(drain, work) for result in results]
+        else:
+            drained = [result for job in work for result in drain(job)]
+
+        # Deterministic merge: apply accesses and create sigils in stream order
+        processed_by_stream: Dict[int, List[str]] = dict(drained)
+        sigils = []
+        for index, thread in enumerate(assignments):
+            processed_glyphs = processed_by_stream[index]
+            for glyph_id, count in Counter(processed_glyphs).items():
+                self.glyphs[glyph_id].access(count)
+
+            sigil = self.create_sigil(
+                name=f"Stream Sigil {thread.sigils_created + 1}",
+                glyph_ids=processed_glyphs,
+                emergent_meaning="Synthesized from glyph stream",
+            )
+            sigil.thread_id = thread.id
+            thread.add_sigil(sigil.id)
+            sigils.append(sigil)
+
+        return sigils
+
+    def shutdown(self):
+        """Stop the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
     def _cleanup_glyphs(self, target_reduction: float = 0.1):
         """
@@ -476,29 +709,61 @@ class GlyphicBindingEngine:
         Args:
             target_reduction: Fraction of glyphs to remove
         """
-        # Sort by access count
-        sorted_glyphs = sorted(self.glyphs.values(), key=lambda g: g.access_count)
+        self.evict_glyphs(int(len(self.glyphs) * target_reduction))
+
+    def evict_glyphs(self, count: int) -> List[str]:
+        """
+        Evict ``count`` glyphs in eviction-policy order
 
-        # Remove least-accessed
-        remove_count = int(len(sorted_glyphs) * target_reduction)
-        for glyph in sorted_glyphs[:remove_count]:
-            # Remove bindings
-            for bound_id in list(glyph.bound_to):
-                if bound_id in self.glyphs:
-                    self.glyphs[bound_id].unbind_from(glyph.id)
+        O(count log n) to pick victims; their bindings are dropped from the
+        graph in a single CSR rebuild.
 
-            # Remove glyph
-            del self.glyphs[glyph.id]
+        Returns:
+            IDs of evicted glyphs
+        """
+        started = time.perf_counter()
+        victims = self.eviction_index.pop_victims(count)
+        self._remove_glyphs(victims)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.eviction_rounds += 1
+        self.glyphs_evicted += len(victims)
+        self.last_eviction_ms = elapsed_ms
+        self.total_eviction_ms += elapsed_ms
+        return victims
+
+    def _remove_glyphs(self, glyph_ids: Iterable[str]):
+        """Delete glyphs and drop their bindings"""
+        removed = [glyph_id for glyph_id in glyph_ids if glyph_id in self.glyphs]
+
+        slots = self.registry.slots(removed)
+        self.bindings_removed += self.bindings.count_edges_touching(slots)
+
+        for glyph_id in removed:
+            glyph = self.glyphs.pop(glyph_id)
+            glyph.on_access = None
+            glyph.engine = None
+        self.registry.remove(removed)
+        # The next read rebuilds the CSR, dropping these bindings and freeing the slots
+        self.bindings.invalidate()
+
+    def get_eviction_metrics(self) -> Dict:
+        """Eviction index and cleanup statistics"""
+        return {
+            "policy": self.eviction_index.policy,
+            "indexed_glyphs": len(self.eviction_index),
+            "heap_size": self.eviction_index.heap_size,
+            "heap_compactions": self.eviction_index.compactions,
+            "eviction_rounds": self.eviction_rounds,
+            "glyphs_evicted": self.glyphs_evicted,
+            "bindings_removed": self.bindings_removed,
+            "last_eviction_ms": self.last_eviction_ms,
+            "avg_eviction_ms": self.total_eviction_ms / self.eviction_rounds if self.eviction_rounds else 0.0,
+        }
 
     def get_symbolic_coherence(self) -> float:
         """Calculate overall coherence of symbolic space"""
-        if not self.glyphs:
-            return 1.0
-
-        total_coherence = sum(g.coherence_score for g in self.glyphs.values())
-        avg_coherence = total_coherence / len(self.glyphs)
-
-        return avg_coherence
+        return self.registry.mean_coherence
 
     def get_engine_status(self) -> Dict:
         """Get comprehensive GBE status"""
@@ -512,8 +777,11 @@ class GlyphicBindingEngine:
             "glyphs_created": self.total_glyphs_created,
             "sigils_created": self.total_sigils_created,
             "bindings_created": self.total_bindings_created,
+            "total_bindings": self.bindings.num_bindings,
+            "binding_bytes": self.bindings.nbytes,
             "symbolic_coherence": self.get_symbolic_coherence(),
             "capacity_used": len(self.glyphs) / self.max_glyphs,
+            "eviction": self.get_eviction_metrics(),
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
@@ -8,6 +8,7 @@ from dotenv import load_dotenv
 from supabase import Client, create_client
 
 from core.guardian.anomaly_detector import AnomalyDetector
+from core.supabase_registry import ROLE_SERVICE, get_client_registry
 from core.audit_emitter import emit_audit_event
 from core.temporal import TemporalDriftEngine
 from core.causality_emitter import link_events
@@ -32,7 +33,7 @@ def initialize_supabase_client() -> Client | None:
         return None
 
     try:
-        return create_client(url, key)
+        return get_client_registry().client_for(url, key, role=ROLE_SERVICE, factory=create_client)
     except Exception as exc:  # pragma: no cover - defensive
         print(f"[ACHE] Failed to initialize Supabase client: {exc}")
         return None
@@ -29,6 +29,8 @@ from typing import Dict, List, Optional
 
 from supabase import Client, create_client
 
+from core.supabase_registry import get_client_registry
+
 logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
 log = logging.getLogger(__name__)
 
@@ -135,7 +137,7 @@ class PanicFrameStore:
             return
 
         try:
-            self.client = create_client(url, key)
+            self.client = get_client_registry().client_for(url, key, factory=create_client)
         except Exception as exc:  # pragma: no cover - defensive
             if not _SUPABASE_WARNING_EMITTED:
                 log.warning(
@@ -22,7 +22,18 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+# Cells (operations x agents) evaluated per voting chunk
+VOTE_CHUNK_CELLS = 1 << 22
+
+# Support rule shared by ParadoxAgent.vote_on_operation and the batched vote
+MIN_SUPPORTED_MAGNITUDE = 0.1
+MAX_SUPPORTED_MAGNITUDE = 0.8
+MIN_SUPPORTED_DELTA_C = -0.2
+PARADOX_VOTE_RATE = 0.2  # Chance of a flipped vote per unit of creativity
 
 
 class ParadoxMode(Enum):
@@ -139,6 +150,9 @@ class ParadoxAgent:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     metadata: Dict = field(default_factory=dict)
 
+    # Source of paradoxical-vote draws; a ParadoxNetwork shares its seeded generator
+    rng: np.random.Generator = field(default_factory=np.random.default_rng, repr=False, compare=False)
+
     def propose_operation(self, target_component: str, current_scarindex: float, soc_tau: float) -> ParadoxOperation:
         """
         Propose a Paradox operation
@@ -221,15 +235,15 @@ class ParadoxAgent:
             vote_for = True
 
         # Support operations with reasonable magnitude
-        elif 0.1 <= operation.disruption_magnitude <= 0.8:
+        elif MIN_SUPPORTED_MAGNITUDE <= operation.disruption_magnitude <= MAX_SUPPORTED_MAGNITUDE:
             vote_for = True
 
         # Support operations with positive expected outcomes
-        elif operation.expected_delta_c > -0.2:
+        elif operation.expected_delta_c > MIN_SUPPORTED_DELTA_C:
             vote_for = True
 
         # Random factor based on creativity
-        if random.random() < self.creativity * 0.2:
+        if self.rng.random() < self.creativity * PARADOX_VOTE_RATE:
             vote_for = not vote_for  # Paradoxical vote!
 
         return vote_for
@@ -273,7 +287,14 @@ class ParadoxNetwork:
     coordination and preventing chaotic collapse.
     """
 
-    def __init__(self, consensus_threshold: float = 0.6, min_agents: int = 3, max_agents: int = 10):
+    def __init__(
+        self,
+        consensus_threshold: float = 0.6,
+        min_agents: int = 3,
+        max_agents: int = 10,
+        seed: Optional[int] = None,
+        vote_chunk_cells: int = VOTE_CHUNK_CELLS,
+    ):
         """
         Initialize Paradox Network
 
@@ -281,10 +302,16 @@ class ParadoxNetwork:
             consensus_threshold: Fraction of votes needed for approval
             min_agents: Minimum number of agents
             max_agents: Maximum number of agents
+            seed: Seed for the paradoxical-vote draws
+            vote_chunk_cells: Operations x agents cells evaluated per voting chunk
         """
         self.agents: Dict[str, ParadoxAgent] = {}
         self.operations: Dict[str, ParadoxOperation] = {}
-        self.pending_operations: List[str] = []
+        # Ordered set of operation IDs awaiting a vote
+        self.pending_operations: Dict[str, None] = {}
+
+        self.rng = np.random.default_rng(seed)
+        self.vote_chunk_cells = vote_chunk_cells
 
         self.consensus_threshold = consensus_threshold
         self.min_agents = min_agents
@@ -304,19 +331,19 @@ class ParadoxNetwork:
         explorer = ParadoxAgent(
             name="Paradox Explorer Alpha", mode=ParadoxMode.EXPLORATION, intensity=0.3, frequency=0.2, creativity=0.9
         )
-        self.agents[explorer.id] = explorer
+        self._register_agent(explorer)
 
         # Disruptor - high intensity, medium creativity
         disruptor = ParadoxAgent(
             name="Paradox Disruptor Beta", mode=ParadoxMode.DISRUPTION, intensity=0.8, frequency=0.1, creativity=0.6
         )
-        self.agents[disruptor.id] = disruptor
+        self._register_agent(disruptor)
 
         # Synthesizer - balanced parameters
         synthesizer = ParadoxAgent(
             name="Paradox Synthesizer Gamma", mode=ParadoxMode.SYNTHESIS, intensity=0.5, frequency=0.15, creativity=0.7
         )
-        self.agents[synthesizer.id] = synthesizer
+        self._register_agent(synthesizer)
 
     def add_agent(
         self, name: str, intensity: float = 0.5, frequency: float = 0.1, creativity: float = 0.7
@@ -338,9 +365,14 @@ class ParadoxNetwork:
 
         agent = ParadoxAgent(name=name, intensity=intensity, frequency=frequency, creativity=creativity)
 
-        self.agents[agent.id] = agent
+        self._register_agent(agent)
         return agent
 
+    def _register_agent(self, agent: ParadoxAgent):
+        # Scalar votes draw from the network's generator, so a seed covers every voting path
+        agent.rng = self.rng
+        self.agents[agent.id] = agent
+
     async def propose_operation(
         self, agent_id: str, target_component: str, current_scarindex: float, soc_tau: float
     ) -> ParadoxOperation:
@@ -368,7 +400,7 @@ class ParadoxNetwork:
 
         # Register operation
         self.operations[operation.id] = operation
-        self.pending_operations.append(operation.id)
+        self.pending_operations[operation.id] = None
         self.total_operations += 1
 
         return operation
@@ -383,64 +415,110 @@ class ParadoxNetwork:
         Returns:
             Voting results
         """
-        if operation_id not in self.operations:
-            raise ValueError(f"Operation {operation_id} not found")
+        return self.vote_on_operations([operation_id])[0]
 
-        operation = self.operations[operation_id]
+    def vote_on_operations(self, operation_ids: Iterable[str]) -> List[Dict]:
+        """
+        All active agents vote on a batch of operations
 
-        # Each agent votes
-        votes_for = 0
-        votes_against = 0
-        weighted_votes_for = 0.0
-        weighted_votes_against = 0.0
+        Votes are evaluated as an (operations x agents) boolean matrix: each
+        operation's support is decided by the shared support rule, flipped per
+        agent with probability ``creativity * PARADOX_VOTE_RATE``, and agents
+        always back their own proposals. Approval is the reputation-weighted
+        vote share, computed as a matrix-vector product.
 
-        for agent in self.agents.values():
-            if not agent.active:
-                continue
+        Args:
+            operation_ids: Operation IDs
 
-            vote = agent.vote_on_operation(operation)
+        Returns:
+            Voting results, in input order
+        """
+        operation_ids = list(operation_ids)
+        for operation_id in operation_ids:
+            if operation_id not in self.operations:
+                raise ValueError(f"Operation {operation_id} not found")
+
+        active = [agent for agent in self.agents.values() if agent.active]
+        reputation = np.fromiter((a.reputation for a in active), dtype=np.float64, count=len(active))
+        flip_threshold = np.fromiter(
+            (a.creativity * PARADOX_VOTE_RATE for a in active), dtype=np.float64, count=len(active)
+        )
+        columns = {agent.id: index for index, agent in enumerate(active)}
 
-            if vote:
-                votes_for += 1
-                weighted_votes_for += agent.reputation
-            else:
-                votes_against += 1
-                weighted_votes_against += agent.reputation
-
-        # Update operation
-        operation.votes_for = votes_for
-        operation.votes_against = votes_against
-
-        # Check consensus (weighted by reputation)
-        total_weighted_votes = weighted_votes_for + weighted_votes_against
-        if total_weighted_votes > 0:
-            approval_ratio = weighted_votes_for / total_weighted_votes
-            operation.approved = approval_ratio >= self.consensus_threshold
-        else:
-            operation.approved = False
+        results = []
+        chunk = max(1, self.vote_chunk_cells // max(1, len(active)))
+        for start in range(0, len(operation_ids), chunk):
+            batch = [self.operations[operation_id] for operation_id in operation_ids[start:start + chunk]]
+            results.extend(self._vote_chunk(batch, reputation, flip_threshold, columns))
 
-        operation.consensus_reached = True
+        return results
 
-        if operation.approved:
-            self.approved_operations += 1
-            # Update proposing agent
-            if operation.agent_id in self.agents:
-                self.agents[operation.agent_id].operations_approved += 1
+    def _vote_chunk(
+        self,
+        operations: List[ParadoxOperation],
+        reputation: np.ndarray,
+        flip_threshold: np.ndarray,
+        columns: Dict[str, int],
+    ) -> List[Dict]:
+        count = len(operations)
+        magnitude = np.fromiter((op.disruption_magnitude for op in operations), dtype=np.float64, count=count)
+        expected_delta_c = np.fromiter((op.expected_delta_c for op in operations), dtype=np.float64, count=count)
+        critical = np.fromiter(
+            (op.priority is ParadoxPriority.CRITICAL for op in operations), dtype=bool, count=count
+        )
+        owner = np.fromiter((columns.get(op.agent_id, -1) for op in operations), dtype=np.int64, count=count)
 
-        # Remove from pending
-        if operation_id in self.pending_operations:
-            self.pending_operations.remove(operation_id)
+        support = (
+            critical
+            | ((magnitude >= MIN_SUPPORTED_MAGNITUDE) & (magnitude <= MAX_SUPPORTED_MAGNITUDE))
+            | (expected_delta_c > MIN_SUPPORTED_DELTA_C)
+        )
 
-        return {
-            "operation_id": operation_id,
-            "votes_for": votes_for,
-            "votes_against": votes_against,
-            "weighted_votes_for": weighted_votes_for,
-            "weighted_votes_against": weighted_votes_against,
-            "approval_ratio": weighted_votes_for / total_weighted_votes if total_weighted_votes > 0 else 0,
-            "approved": operation.approved,
-            "consensus_reached": operation.consensus_reached,
-        }
+        # Paradoxical votes flip the agent's support
+        flipped = self.rng.random((count, len(reputation))) < flip_threshold
+        votes = support[:, None] ^ flipped
+
+        # Agents always back their own proposals
+        own = owner >= 0
+        votes[np.flatnonzero(own), owner[own]] = True
+
+        votes_for = votes.sum(axis=1)
+        weighted_votes_for = votes @ reputation
+        weighted_total = reputation.sum()
+        weighted_votes_against = weighted_total - weighted_votes_for
+        approval_ratio = weighted_votes_for / weighted_total if weighted_total > 0 else np.zeros(count)
+        approved = (approval_ratio >= self.consensus_threshold) & (weighted_total > 0)
+
+        results = []
+        for index, operation in enumerate(operations):
+            operation.votes_for = int(votes_for[index])
+            operation.votes_against = len(reputation) - operation.votes_for
+            operation.approved = bool(approved[index])
+            operation.consensus_reached = True
+
+            if operation.approved:
+                self.approved_operations += 1
+                # Update proposing agent
+                if operation.agent_id in self.agents:
+                    self.agents[operation.agent_id].operations_approved += 1
+
+            # Remove from pending
+            self.pending_operations.pop(operation.id, None)
+
+            results.append(
+                {
+                    "operation_id": operation.id,
+                    "votes_for": operation.votes_for,
+                    "votes_against": operation.votes_against,
+                    "weighted_votes_for": float(weighted_votes_for[index]),
+                    "weighted_votes_against": float(weighted_votes_against[index]),
+                    "approval_ratio": float(approval_ratio[index]),
+                    "approved": operation.approved,
+                    "consensus_reached": operation.consensus_reached,
+                }
+            )
+
+        return results
 
     async def execute_operation(self, operation_id: str, actual_delta_c: float) -> Dict:
         """
@@ -503,13 +581,7 @@ class ParadoxNetwork:
         Returns:
             List of voting results
         """
-        results = []
-
-        for operation_id in list(self.pending_operations):
-            result = await self.vote_on_operation(operation_id)
-            results.append(result)
-
-        return results
+        return self.vote_on_operations(list(self.pending_operations))
 
     def get_approved_operations(self) -> List[ParadoxOperation]:
         """Get all approved but not executed operations"""
@@ -1,6 +1,8 @@
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+import math
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Deque, Iterable, Optional, Tuple
 from core.db import get_supabase
 from core.logging_config import setup_logging
 
@@ -63,28 +65,201 @@ class ScarIndexOracle:
             }
         )
 
+
+# Weights for different event types (lower is better/neutral, higher is disruptive)
+EVENT_WEIGHTS: Dict[str, float] = {
+    "github_webhook": 0.01,  # Normal activity
+    "guardian_heartbeat": 0.0,  # Healthy
+    "error": 0.1,  # System error
+    "security_alert": 0.3,  # Security breach
+}
+DEFAULT_EVENT_WEIGHT = 0.05
+
+# Windows (in minutes) maintained incrementally by the streaming engine
+DEFAULT_WINDOWS = (5, 15, 60)
+
+
+def score_event_counts(counts: Dict[str, int]) -> float:
+    """
+    Scores a window from per-event-type counts.
+
+    Shared by the batch and streaming paths so both produce identical values.
+    """
+    if not counts:
+        return 1.0
+
+    total_penalty = math.fsum(
+        EVENT_WEIGHTS.get(etype, DEFAULT_EVENT_WEIGHT) * count
+        for etype, count in counts.items()
+        if count
+    )
+
+    # Normalize to 0.0 - 1.0
+    return max(0.0, 1.0 - total_penalty)
+
+
+def _parse_event_timestamp(value: Any) -> Optional[float]:
+    """Converts an ``event_timestamp`` column value into UTC epoch seconds."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return None
+
+
+class StreamingScarIndex:
+    """
+    Sliding-window ScarIndex engine.
+
+    Keeps per-event-type counts for each configured window. Events are added
+    as they arrive and dropped as they expire, so a window query costs O(1)
+    regardless of event volume. A high-water mark on ``event_timestamp``
+    lets callers fetch only rows newer than the last ingested event.
+    """
+
+    def __init__(self, windows: Iterable[int] = DEFAULT_WINDOWS):
+        self.windows: Tuple[int, ...] = tuple(sorted({int(w) for w in windows}))
+        if not self.windows or self.windows[0] <= 0:
+            raise ValueError("windows must be positive minute values")
+
+        self._events: Dict[int, Deque[Tuple[float, str]]] = {w: deque() for w in self.windows}
+        self._counts: Dict[int, Counter] = {w: Counter() for w in self.windows}
+
+        self.high_water_mark: Optional[str] = None
+        self._hwm_epoch: Optional[float] = None
+        # Row keys already ingested at exactly the high-water mark, so a
+        # ``gte`` re-fetch of that instant does not double count.
+        self._hwm_keys: set = set()
+
+    @property
+    def max_window(self) -> int:
+        return self.windows[-1]
+
+    def supports(self, minutes: int) -> bool:
+        return minutes in self._counts
+
+    @staticmethod
+    def _row_key(row: Dict[str, Any]) -> Any:
+        return row.get("id") or (row.get("event_timestamp"), row.get("event_type"))
+
+    def ingest(self, rows: Iterable[Dict[str, Any]], now: Optional[float] = None) -> int:
+        """
+        Adds telemetry rows to every window and advances the high-water mark.
+
+        Rows older than the high-water mark are ignored; rows at the mark are
+        de-duplicated by ``id``. Returns the number of rows accepted.
+        """
+        parsed = []
+        for row in rows:
+            ts = _parse_event_timestamp(row.get("event_timestamp"))
+            if ts is None:
+                continue
+            parsed.append((ts, row))
+        parsed.sort(key=lambda item: item[0])
+
+        accepted = 0
+        for ts, row in parsed:
+            key = self._row_key(row)
+            if self._hwm_epoch is not None:
+                if ts < self._hwm_epoch:
+                    continue
+                if ts == self._hwm_epoch and key in self._hwm_keys:
+                    continue
+
+            etype = row.get("event_type", "unknown")
+            for window in self.windows:
+                self._events[window].append((ts, etype))
+                self._counts[window][etype] += 1
+            accepted += 1
+
+            if self._hwm_epoch is None or ts > self._hwm_epoch:
+                self._hwm_epoch = ts
+                self.high_water_mark = row.get("event_timestamp")
+                self._hwm_keys = set()
+            self._hwm_keys.add(key)
+
+        self.advance(now)
+        return accepted
+
+    def advance(self, now: Optional[float] = None) -> None:
+        """Drops events that have fallen out of each window."""
+        if now is None:
+            now = datetime.now(timezone.utc).timestamp()
+
+        for window in self.windows:
+            cutoff = now - window * 60
+            events = self._events[window]
+            counts = self._counts[window]
+            while events and events[0][0] < cutoff:
+                _, etype = events.popleft()
+                counts[etype] -= 1
+                if not counts[etype]:
+                    del counts[etype]
+
+    def event_count(self, minutes: int) -> int:
+        return len(self._events[minutes])
+
+    def counts(self, minutes: int) -> Dict[str, int]:
+        return dict(self._counts[minutes])
+
+    def score(self, minutes: int) -> float:
+        """Returns the ScarIndex for a configured window."""
+        return score_event_counts(self._counts[minutes])
+
+    def fetch_since(self, now: Optional[datetime] = None) -> str:
+        """Lower bound for the next Supabase fetch (high-water mark or window start)."""
+        if self.high_water_mark is not None:
+            return self.high_water_mark
+        now = now or datetime.utcnow()
+        return (now - timedelta(minutes=self.max_window)).isoformat()
+
+
 class ScarIndex:
-    def __init__(self):
+    def __init__(self, windows: Iterable[int] = DEFAULT_WINDOWS):
         self.supabase = get_supabase()
+        self.stream = StreamingScarIndex(windows)
 
-    def compute_scarindex_for_window(self, minutes: int = 5) -> float:
+    def _fetch_window_events(self, minutes: int) -> Tuple[float, int]:
         """
-        Computes ScarIndex based on telemetry events in the last N minutes.
-        Persists the result to coherence_signals.
+        Returns (scarindex, event_count) for the window.
+
+        Configured windows are answered by the streaming engine after pulling
+        only rows past its high-water mark; other windows fall back to a full
+        rescan.
         """
-        try:
+        if not self.stream.supports(minutes):
             since = (datetime.utcnow() - timedelta(minutes=minutes)).isoformat()
-            
-            # Fetch telemetry events
             resp = self.supabase.table("telemetry_events") \
                 .select("*") \
                 .gte("event_timestamp", since) \
                 .execute()
-            
             events = resp.data or []
-            
-            # Calculate ScarIndex
-            scarindex_value = self._calculate_scarindex(events)
+            return self._calculate_scarindex(events), len(events)
+
+        resp = self.supabase.table("telemetry_events") \
+            .select("id, event_type, event_timestamp") \
+            .gte("event_timestamp", self.stream.fetch_since()) \
+            .execute()
+        self.stream.ingest(resp.data or [])
+        return self.stream.score(minutes), self.stream.event_count(minutes)
+
+    def compute_scarindex_for_window(self, minutes: int = 5) -> float:
+        """
+        Computes ScarIndex based on telemetry events in the last N minutes.
+        Persists the result to coherence_signals.
+        """
+        try:
+            # Fetch telemetry events and calculate ScarIndex
+            scarindex_value, event_count = self._fetch_window_events(minutes)
             
             # Determine if Panic Frame is triggered
             panic_triggered = scarindex_value < 0.3
@@ -100,7 +275,7 @@ class ScarIndex:
                 "panic_frame_triggered": panic_triggered,
                 "control_action_taken": "monitor" if not panic_triggered else "PANIC_FRAME_ACTIVATED",
                 "signal_data": {
-                    "event_count": len(events),
+                    "event_count": event_count,
                     "window_minutes": minutes
                 }
             }
@@ -120,25 +295,7 @@ class ScarIndex:
         Internal logic to calculate ScarIndex from events.
         Weighted decay model based on event types.
         """
-        if not events:
-            return 1.0
-        
-        # Weights for different event types (lower is better/neutral, higher is disruptive)
-        weights = {
-            "github_webhook": 0.01, # Normal activity
-            "guardian_heartbeat": 0.0, # Healthy
-            "error": 0.1, # System error
-            "security_alert": 0.3 # Security breach
-        }
-        
-        total_penalty = 0.0
-        for event in events:
-            etype = event.get("event_type", "unknown")
-            weight = weights.get(etype, 0.05)
-            total_penalty += weight
-            
-        # Normalize to 0.0 - 1.0
-        return max(0.0, 1.0 - total_penalty)
+        return score_event_counts(Counter(event.get("event_type", "unknown") for event in events))
 
 # Singleton instance
 scar_index = ScarIndex()
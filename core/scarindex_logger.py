@@ -13,6 +13,8 @@ from typing import Dict, Optional
 try:
     from supabase import Client, create_client
 
+    from core.supabase_registry import ROLE_ANON, get_client_registry
+
     SUPABASE_AVAILABLE = True
 except ImportError:
     SUPABASE_AVAILABLE = False
@@ -51,7 +53,7 @@ class ScarIndexLogger:
             return
 
         try:
-            self.client = create_client(self.url, self.key)
+            self.client = get_client_registry().client_for(self.url, self.key, role=ROLE_ANON, factory=create_client)
         except Exception as e:
             print(f"ERROR: Failed to initialize Supabase client: {e}")
             self.enabled = False
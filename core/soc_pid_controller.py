@@ -18,11 +18,167 @@ critical state, enabling "valley ascent dynamics" - controlled coherence dips
 necessary to escape local optima and achieve higher global coherence maxima.
 """
 
+import bisect
+import math
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 from core.ache_pid_controller import AchePIDController
+from core.controller_telemetry import TelemetrySink
+
+
+class StreamingTauEstimator:
+    """
+    Incremental power-law exponent estimator over a sliding window
+
+    Avalanche sizes live in a fixed-size ring buffer. A fixed log-binned
+    histogram (``bins`` bins between ``size_min`` and ``size_max``) and a
+    running sum of log sizes are updated as events enter and leave the
+    window, so ``tau()`` costs O(bins) and ``add()`` O(log bins).
+
+    τ follows the convention SOCMetrics.calculate_tau has always used (and
+    that ``target_tau`` = 1.5 is tuned against): the slope of avalanche
+    counts per logarithmic bin, N(log s) ~ s^(-τ). For a density
+    p(s) ~ s^(-α) this is τ = α - 1.
+
+    Methods:
+        "histogram"  least-squares slope of log counts vs log size
+        "mle"        maximum-likelihood estimate (Clauset, Shalizi & Newman 2009):
+                     τ = n / Σ ln(s_i / s_min), with s_min - 1/2 for discrete sizes
+
+    Sizes below ``size_min`` stay in the window but are ignored by both
+    estimators; sizes above ``size_max`` are ignored by the histogram only.
+    Both are counted in ``underflow`` and ``overflow`` so a range that
+    truncates the data is visible.
+    """
+
+    METHODS = ("histogram", "mle")
+
+    # Bin codes for sizes outside [size_min, size_max]
+    _UNDERFLOW = -1
+    _OVERFLOW = -2
+
+    def __init__(
+        self,
+        window: int = 1000,
+        bins: int = 30,
+        size_min: float = 1.0,
+        size_max: float = 1e6,
+        method: str = "histogram",
+        discrete: bool = False,
+        min_events: int = 10,
+        min_bins: int = 5,
+    ):
+        if method not in self.METHODS:
+            raise ValueError(f"method must be one of {self.METHODS}, got {method!r}")
+        if not 0 < size_min < size_max:
+            raise ValueError("size_min must be positive and below size_max")
+
+        self.window = window
+        self.method = method
+        self.discrete = discrete
+        self.size_min = size_min
+        self.size_max = size_max
+        self.min_events = min_events
+        self.min_bins = min_bins
+
+        self.edges = np.logspace(np.log10(size_min), np.log10(size_max), bins + 1)
+        self._edge_list = self.edges.tolist()
+        log_edges = np.log10(self.edges)
+        self._log_centers = (log_edges[:-1] + log_edges[1:]) / 2
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+        self._sizes = np.zeros(window)
+        self._bins = np.full(window, self._UNDERFLOW, dtype=np.int64)
+        self._next = 0
+        self._size = 0
+
+        # MLE running state over sizes >= size_min
+        self._xmin = size_min - 0.5 if discrete else size_min
+        self._tail_count = 0
+        self._log_sum = 0.0
+        self._evictions_since_resum = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, size: float):
+        """Push an avalanche size, evicting the oldest once the window is full"""
+        i = self._next
+        if self._size == self.window:
+            self._remove(self._sizes[i], self._bins[i])
+            self._evictions_since_resum += 1
+        else:
+            self._size += 1
+
+        b = bisect.bisect_right(self._edge_list, size) - 1
+        if b == len(self.counts) and size == self.size_max:
+            b -= 1
+        if b < 0:
+            b = self._UNDERFLOW
+            self.underflow += 1
+        elif b >= len(self.counts):
+            b = self._OVERFLOW
+            self.overflow += 1
+        else:
+            self.counts[b] += 1
+        if size >= self.size_min:
+            self._tail_count += 1
+            self._log_sum += math.log(size / self._xmin)
+
+        self._sizes[i] = size
+        self._bins[i] = b
+        self._next = (i + 1) % self.window
+
+        # Re-anchor the running log sum so add/subtract rounding cannot drift
+        if self._evictions_since_resum >= self.window:
+            self._resum()
+
+    def _remove(self, size: float, b: int):
+        if b >= 0:
+            self.counts[b] -= 1
+        elif b == self._OVERFLOW:
+            self.overflow -= 1
+        else:
+            self.underflow -= 1
+        if size >= self.size_min:
+            self._tail_count -= 1
+            self._log_sum -= math.log(size / self._xmin)
+
+    def _resum(self):
+        sizes = self._sizes[: self._size]
+        tail = sizes[sizes >= self.size_min]
+        self._log_sum = math.fsum(np.log(tail / self._xmin))
+        self._evictions_since_resum = 0
+
+    def values(self) -> np.ndarray:
+        """Sizes currently in the window, oldest first"""
+        if self._size < self.window:
+            return self._sizes[: self._size].copy()
+        return np.concatenate((self._sizes[self._next:], self._sizes[:self._next]))
+
+    def tau_histogram(self) -> float:
+        nonzero = self.counts > 0
+        if self.counts.sum() < self.min_events or nonzero.sum() < self.min_bins:
+            return 0.0
+        x = self._log_centers[nonzero]
+        y = np.log10(self.counts[nonzero])
+        x_centered = x - x.mean()
+        slope = float(np.dot(x_centered, y - y.mean()) / np.dot(x_centered, x_centered))
+        return -slope
+
+    def tau_mle(self) -> float:
+        if self._tail_count < self.min_events or self._log_sum <= 0:
+            return 0.0
+        return self._tail_count / self._log_sum
+
+    def tau(self) -> float:
+        """Current τ estimate (0.0 until enough events are in the window)"""
+        return self.tau_mle() if self.method == "mle" else self.tau_histogram()
 
 
 @dataclass
@@ -43,13 +199,31 @@ class SOCMetrics:
     is_critical: bool = False
     distance_from_criticality: float = 0.0
 
+    # Streaming estimator; when set, avalanches go here instead of avalanche_sizes
+    estimator: Optional[StreamingTauEstimator] = None
+
+    def record_avalanche(self, size: float):
+        """Record an avalanche size"""
+        if self.estimator is not None:
+            self.estimator.add(size)
+        else:
+            self.avalanche_sizes.append(size)
+
+    @property
+    def avalanche_count(self) -> int:
+        return len(self.estimator) if self.estimator is not None else len(self.avalanche_sizes)
+
     def calculate_tau(self) -> float:
         """
         Calculate power-law exponent τ from avalanche size distribution
 
-        For SOC, event sizes follow P(s) ~ s^(-τ)
-        Target: τ ≈ 1.5 for optimal criticality
+        For SOC, avalanche counts per logarithmic size bin follow N(s) ~ s^(-τ)
+        (see StreamingTauEstimator). Target: τ ≈ 1.5 for optimal criticality
         """
+        if self.estimator is not None:
+            self.tau = self.estimator.tau()
+            return self.tau
+
         if len(self.avalanche_sizes) < 10:
             return 0.0
 
@@ -92,7 +266,7 @@ class SOCMetrics:
     def to_dict(self) -> Dict:
         return {
             "tau": self.tau,
-            "avalanche_count": len(self.avalanche_sizes),
+            "avalanche_count": self.avalanche_count,
             "correlation_length": self.correlation_length,
             "susceptibility": self.susceptibility,
             "fractal_dimension": self.fractal_dimension,
@@ -155,12 +329,26 @@ class SOCPIDController(AchePIDController):
         kd: float = 0.2,
         min_guidance: float = 0.1,
         max_guidance: float = 2.0,
+        telemetry: Optional[TelemetrySink] = None,
+        tau_window: int = 1000,
+        tau_method: str = "histogram",
+        tau_refresh_every: int = 1,
     ):
-        super().__init__(target_scarindex, kp, ki, kd, min_guidance, max_guidance)
+        """
+        Initialize the SOC controller
+
+        Args:
+            tau_window: Avalanches kept for the τ estimate
+            tau_method: "histogram" (log-binned fit) or "mle" (Clauset maximum likelihood)
+            tau_refresh_every: Re-estimate τ every N avalanches
+        """
+        super().__init__(target_scarindex, kp, ki, kd, min_guidance, max_guidance, telemetry=telemetry)
 
         # SOC parameters
         self.target_tau = target_tau
-        self.soc_metrics = SOCMetrics()
+        self.tau_refresh_every = tau_refresh_every
+        self.soc_metrics = SOCMetrics(estimator=StreamingTauEstimator(window=tau_window, method=tau_method))
+        self._avalanches_seen = 0
         self.valley_ascent = ValleyAscentState()
 
         # Paradox Agent parameters
@@ -181,15 +369,12 @@ class SOCPIDController(AchePIDController):
         Returns:
             Tuple of (guidance_scale, soc_state)
         """
-        # Record avalanche size
-        self.soc_metrics.avalanche_sizes.append(event_size)
-
-        # Keep only recent avalanches (sliding window)
-        if len(self.soc_metrics.avalanche_sizes) > 1000:
-            self.soc_metrics.avalanche_sizes = self.soc_metrics.avalanche_sizes[-1000:]
+        # Record avalanche size (sliding window kept by the streaming estimator)
+        self.soc_metrics.record_avalanche(event_size)
+        self._avalanches_seen += 1
 
-        # Calculate τ periodically
-        if len(self.soc_metrics.avalanche_sizes) % 50 == 0:
+        # Refresh τ incrementally
+        if self._avalanches_seen % self.tau_refresh_every == 0:
             self.soc_metrics.calculate_tau()
             self.soc_metrics.update_criticality_state(self.target_tau)
 
@@ -208,34 +393,7 @@ class SOCPIDController(AchePIDController):
 
         self.guidance_scale = final_guidance
 
-        # Persist SOC state to Supabase
-        try:
-            from core.db import get_supabase
-            from datetime import datetime, timezone
-            supabase = get_supabase()
-            
-            soc_status = {
-                "base_guidance": base_guidance,
-                "soc_adjustment": soc_adjustment,
-                "valley_adjustment": valley_adjustment,
-                "final_guidance": final_guidance,
-                "soc_metrics": self.soc_metrics.to_dict(),
-                "valley_state": self.valley_ascent.to_dict(),
-            }
-            
-            supabase.table("coherence_signals").insert({
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "scarindex_value": current_scarindex,
-                "panic_frame_triggered": False, # Managed by ScarIndex/PanicFrameManager
-                "control_action_taken": "SOC_ADJUSTMENT",
-                "signal_data": soc_status
-            }).execute()
-            
-        except Exception as e:
-            # Log but don't fail
-            print(f"Failed to persist SOC state: {e}")
-
-        return final_guidance, {
+        soc_status = {
             "base_guidance": base_guidance,
             "soc_adjustment": soc_adjustment,
             "valley_adjustment": valley_adjustment,
@@ -244,6 +402,21 @@ class SOCPIDController(AchePIDController):
             "valley_state": self.valley_ascent.to_dict(),
         }
 
+        # Hand sampled SOC state to the telemetry sink
+        if self.telemetry.sample("coherence_signals"):
+            self.telemetry.write(
+                "coherence_signals",
+                {
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "scarindex_value": current_scarindex,
+                    "panic_frame_triggered": False,  # Managed by ScarIndex/PanicFrameManager
+                    "control_action_taken": "SOC_ADJUSTMENT",
+                    "signal_data": dict(soc_status),
+                },
+            )
+
+        return final_guidance, soc_status
+
     def _calculate_soc_adjustment(self) -> float:
         """
         Calculate SOC-based adjustment to guidance scale
@@ -268,8 +441,8 @@ class SOCPIDController(AchePIDController):
         Implements controlled coherence dips to escape local optima.
         """
         # Detect local optima (coherence plateau)
-        if len(self.error_history) >= 10:
-            recent_errors = self.error_history[-10:]
+        if len(self.history) >= 10:
+            recent_errors = self.history.tail("error", 10)
             error_variance = np.var(recent_errors)
 
             # Low variance + non-zero error = local optimum
@@ -9,11 +9,15 @@ Integrates SpiralOS with Supabase backend for:
 """
 
 import asyncio
+import bisect
+import hashlib
 import json
 import logging
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Deque, Dict, Iterable, List, Optional, Union
 
 from supabase import Client, create_client
 
@@ -21,6 +25,7 @@ from .ache_pid_controller import PIDState
 from .config import SupabaseSettings, get_supabase_settings
 from .panic_frames import PanicFrameEvent, PanicFrameManager
 from .scarindex import AcheMeasurement, CoherenceComponents, ScarIndexOracle, ScarIndexResult
+from .supabase_registry import ROLE_ANON, ROLE_SERVICE, get_client_registry
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +40,83 @@ class PersistenceResponse:
     payload: Dict[str, Any]
 
 
+@dataclass
+class BulkPersistenceResponse:
+    """Per-row outcome of a chunked bulk write."""
+
+    table: str
+    responses: List[Optional[PersistenceResponse]]  # One per input row; None when its chunk failed
+    errors: Dict[int, str]  # Input row index -> error of its chunk
+    chunks: int
+    failed_chunks: int
+    elapsed: float
+
+    @property
+    def succeeded(self) -> int:
+        return len(self.responses) - len(self.errors)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.succeeded / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (bucket bounds in milliseconds)."""
+
+    BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile (max latency for the overflow bucket)."""
+
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.BUCKETS_MS, self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return float(min(bound, self.max_ms))
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max_ms,
+            "buckets": dict(zip([f"<={b}ms" for b in self.BUCKETS_MS] + ["overflow"], self.counts)),
+        }
+
+
+@dataclass
+class AcheEventRequest:
+    """Input to SpiralOSBackend.process_ache_events."""
+
+    source: str
+    content: Dict
+    ache_level: float
+    coherence_components: CoherenceComponents
+
+
 class SupabaseClient:
     """Client for interacting with Supabase backend resources."""
 
@@ -43,12 +125,18 @@ class SupabaseClient:
         client: Optional[Client] = None,
         max_retries: int = 3,
         settings: Optional[SupabaseSettings] = None,
+        bulk_chunk_size: int = 500,
+        bulk_concurrency: int = 4,
+        retry_delay: float = 0.5,
     ) -> None:
         """Initialize Supabase client with Guardian panic logging."""
 
         self._settings = settings
         self.client: Optional[Client] = client
         self.max_retries = max_retries
+        self.bulk_chunk_size = bulk_chunk_size
+        self.bulk_concurrency = bulk_concurrency
+        self.retry_delay = retry_delay
         self.panic_manager = PanicFrameManager()
 
     @property
@@ -64,13 +152,14 @@ class SupabaseClient:
 
         url = str(self.settings.url)
         key = self.settings.service_role_key or self.settings.anon_key
+        role = ROLE_SERVICE if self.settings.service_role_key else ROLE_ANON
 
         if not url or not key:
             logger.warning("Supabase credentials missing; persistence disabled")
             return None
 
         try:
-            return create_client(url, key)
+            return get_client_registry().client_for(url, key, role=role, factory=create_client)
         except Exception as exc:  # pragma: no cover - external dependency
             logger.error("Failed to initialize Supabase client: %s", exc)
             return None
@@ -94,7 +183,7 @@ class SupabaseClient:
 
     async def _execute_with_retry(self, func: Callable[[], Any], operation: str) -> Any:
         attempt = 0
-        delay = 0.5
+        delay = self.retry_delay
 
         while True:
             try:
@@ -120,13 +209,87 @@ class SupabaseClient:
             return data
         return {}
 
-    async def insert_ache_event(
-        self, source: str, content: Dict, ache_level: float, metadata: Optional[Dict] = None
-    ) -> PersistenceResponse:
-        """Insert an Ache event into Supabase with retries and auditing."""
+    async def bulk_write(
+        self,
+        table: str,
+        rows: Iterable[Dict[str, Any]],
+        upsert: bool = False,
+        on_conflict: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> BulkPersistenceResponse:
+        """
+        Insert (or upsert) rows in chunks, running chunks concurrently.
+
+        Each chunk is one request retried on its own; a chunk that exhausts
+        its retries marks only its rows as failed.
+
+        Args:
+            table: Target table
+            rows: Rows to write
+            upsert: Upsert instead of insert
+            on_conflict: Conflict target columns for upserts
+            chunk_size: Rows per request (default: bulk_chunk_size)
+            concurrency: Chunks in flight at once (default: bulk_concurrency)
+        """
+
+        rows = list(rows)
+        size = chunk_size or self.bulk_chunk_size
+        if size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        started = time.perf_counter()
+        responses: List[Optional[PersistenceResponse]] = [None] * len(rows)
+        errors: Dict[int, str] = {}
+        if not rows:
+            return BulkPersistenceResponse(table, responses, errors, chunks=0, failed_chunks=0, elapsed=0.0)
 
         client = self._ensure_client()
-        payload = {
+        semaphore = asyncio.Semaphore(concurrency or self.bulk_concurrency)
+        operation = f"{table}.bulk_{'upsert' if upsert else 'insert'}"
+
+        async def write_chunk(start: int) -> bool:
+            chunk = rows[start:start + size]
+
+            def request():
+                query = client.table(table)
+                if not upsert:
+                    return query.insert(chunk).execute()
+                if on_conflict:
+                    return query.upsert(chunk, on_conflict=on_conflict).execute()
+                return query.upsert(chunk).execute()
+
+            async with semaphore:
+                try:
+                    result = await self._execute_with_retry(request, operation)
+                except Exception as exc:
+                    errors.update(dict.fromkeys(range(start, start + len(chunk)), str(exc)))
+                    return False
+
+            data = getattr(result, "data", None)
+            returned = data if isinstance(data, list) and len(data) == len(chunk) else chunk
+            status_code = getattr(result, "status_code", 200)
+            for offset, row in enumerate(returned):
+                responses[start + offset] = PersistenceResponse(
+                    table=table, status_code=status_code, inserted_id=row.get("id"), payload=row
+                )
+            return True
+
+        outcomes = await asyncio.gather(*(write_chunk(start) for start in range(0, len(rows), size)))
+        return BulkPersistenceResponse(
+            table=table,
+            responses=responses,
+            errors=errors,
+            chunks=len(outcomes),
+            failed_chunks=outcomes.count(False),
+            elapsed=time.perf_counter() - started,
+        )
+
+    @staticmethod
+    def _ache_event_payload(
+        source: str, content: Dict, ache_level: float, metadata: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        return {
             "source": source or "unknown",
             "source_id": content.get("commit_id"),
             "content": content or {},
@@ -134,6 +297,22 @@ class SupabaseClient:
             "metadata": metadata or {},
         }
 
+    @staticmethod
+    def _scarindex_record(result: ScarIndexResult, ache_event_id: Optional[str] = None) -> Dict[str, Any]:
+        record = result.to_dict()
+        if ache_event_id:
+            record["ache_event_id"] = ache_event_id
+        record["metadata"] = record.get("metadata", {})
+        return record
+
+    async def insert_ache_event(
+        self, source: str, content: Dict, ache_level: float, metadata: Optional[Dict] = None
+    ) -> PersistenceResponse:
+        """Insert an Ache event into Supabase with retries and auditing."""
+
+        client = self._ensure_client()
+        payload = self._ache_event_payload(source, content, ache_level, metadata)
+
         result = await self._execute_with_retry(
             lambda: client.table("ache_events").insert(payload).execute(), "ache_events.insert"
         )
@@ -151,10 +330,7 @@ class SupabaseClient:
         """Insert a ScarIndex calculation row."""
 
         client = self._ensure_client()
-        record = result.to_dict()
-        if ache_event_id:
-            record["ache_event_id"] = ache_event_id
-        record["metadata"] = record.get("metadata", {})
+        record = self._scarindex_record(result, ache_event_id)
 
         supabase_result = await self._execute_with_retry(
             lambda: client.table("scarindex_calculations").insert(record).execute(), "scarindex_calculations.insert"
@@ -167,26 +343,30 @@ class SupabaseClient:
             payload=row or record,
         )
 
+    async def insert_ache_events(self, events: List[Dict[str, Any]]) -> BulkPersistenceResponse:
+        """Bulk insert Ache events given as insert_ache_event keyword dicts."""
+
+        return await self.bulk_write("ache_events", [self._ache_event_payload(**event) for event in events])
+
+    async def insert_scarindex_calculations(
+        self, results: List[ScarIndexResult], ache_event_ids: Optional[List[Optional[str]]] = None
+    ) -> BulkPersistenceResponse:
+        """Bulk insert ScarIndex calculation rows."""
+
+        ache_event_ids = ache_event_ids or [None] * len(results)
+        records = [self._scarindex_record(result, event_id) for result, event_id in zip(results, ache_event_ids)]
+        return await self.bulk_write("scarindex_calculations", records)
+
     async def insert_verification_records(self, records: List[Dict]) -> List[PersistenceResponse]:
         """Batch insert verification records."""
 
         if not records:
             return []
 
-        client = self._ensure_client()
-        result = await self._execute_with_retry(
-            lambda: client.table("verification_records").insert(records).execute(), "verification_records.insert"
-        )
-        payloads = getattr(result, "data", []) or []
-        return [
-            PersistenceResponse(
-                table="verification_records",
-                status_code=getattr(result, "status_code", 200),
-                inserted_id=row.get("id"),
-                payload=row,
-            )
-            for row in payloads
-        ]
+        bulk = await self.bulk_write("verification_records", records)
+        if bulk.errors:
+            raise RuntimeError(next(iter(bulk.errors.values())))
+        return bulk.responses
 
     async def process_commit_batch(self, commits: List[Dict[str, Any]]) -> PersistenceResponse:
         """Invoke the process_push_batch RPC with retry semantics."""
@@ -251,15 +431,9 @@ class SupabaseClient:
         """Insert a VaultNode ledger entry."""
 
         client = self._ensure_client()
-        record = {
-            "node_type": node_type or "unknown",
-            "reference_id": reference_id or "unknown",
-            "state_hash": state_hash or "",
-            "previous_hash": previous_hash,
-            "audit_log": audit_log or {},
-            "github_commit_sha": github_commit_sha,
-            "github_path": github_path,
-        }
+        record = self._vaultnode_record(
+            node_type, reference_id, state_hash, previous_hash, audit_log, github_commit_sha, github_path
+        )
 
         result = await self._execute_with_retry(
             lambda: client.table("vaultnodes").insert(record).execute(), "vaultnodes.insert"
@@ -272,6 +446,41 @@ class SupabaseClient:
             payload=row or record,
         )
 
+    @staticmethod
+    def _vaultnode_record(
+        node_type: str,
+        reference_id: str,
+        state_hash: str,
+        previous_hash: Optional[str],
+        audit_log: Dict,
+        github_commit_sha: Optional[str] = None,
+        github_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        return {
+            "node_type": node_type or "unknown",
+            "reference_id": reference_id or "unknown",
+            "state_hash": state_hash or "",
+            "previous_hash": previous_hash,
+            "audit_log": audit_log or {},
+            "github_commit_sha": github_commit_sha,
+            "github_path": github_path,
+        }
+
+    async def insert_vaultnodes(self, records: List[Dict[str, Any]]) -> BulkPersistenceResponse:
+        """Bulk insert VaultNode entries given as insert_vaultnode keyword dicts."""
+
+        return await self.bulk_write("vaultnodes", [self._vaultnode_record(**record) for record in records])
+
+    async def insert_panic_frames(self, events: List[PanicFrameEvent]) -> BulkPersistenceResponse:
+        """Bulk insert Panic Frame events."""
+
+        return await self.bulk_write("panic_frames", [event.to_dict() for event in events])
+
+    async def upsert_pid_states(self, states: List[PIDState]) -> BulkPersistenceResponse:
+        """Bulk upsert PID controller states."""
+
+        return await self.bulk_write("pid_controller_state", [state.to_dict() for state in states], upsert=True)
+
     async def insert_smart_contract_txn(
         self,
         txn_type: str,
@@ -400,9 +609,37 @@ class SpiralOSBackend:
     Coordinates between Supabase storage and GitHub audit trails.
     """
 
-    def __init__(self):
-        self.supabase = SupabaseClient()
-        self.github = GitHubIntegration()
+    STAGES = ("ache_event", "scarindex", "vaultnode", "github_audit", "panic_check", "total")
+
+    def __init__(
+        self,
+        supabase: Optional[SupabaseClient] = None,
+        github: Optional[GitHubIntegration] = None,
+        panic_manager: Optional[PanicFrameManager] = None,
+        concurrency: int = 32,
+    ):
+        """
+        Args:
+            supabase: Supabase client (shared across events)
+            github: GitHub audit integration
+            panic_manager: Panic Frame manager (defaults to the Supabase client's)
+            concurrency: Maximum in-flight events for process_ache_events
+        """
+        self.supabase = supabase or SupabaseClient()
+        self.github = github or GitHubIntegration()
+        self.panic_manager = panic_manager or self.supabase.panic_manager
+        self.concurrency = concurrency
+
+        self.stage_latency: Dict[str, LatencyHistogram] = {stage: LatencyHistogram() for stage in self.STAGES}
+        self.events_processed = 0
+        self.events_failed = 0
+
+    async def _timed(self, stage: str, awaitable):
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.stage_latency[stage].record(time.perf_counter() - started)
 
     async def process_ache_event(
         self, source: str, content: Dict, ache_level: float, coherence_components: CoherenceComponents
@@ -417,6 +654,10 @@ class SpiralOSBackend:
         4. Commit to GitHub
         5. Update PID controller
 
+        The ScarIndex is computed up front, so the Panic Frame check runs
+        alongside the storage chain, and the VaultNode insert and GitHub
+        audit (which both only need the stored ScarIndex row) run together.
+
         Args:
             source: Source of Ache
             content: Ache content
@@ -426,13 +667,9 @@ class SpiralOSBackend:
         Returns:
             Complete processing result
         """
-        # 1. Store Ache event
-        ache_event_response = await self.supabase.insert_ache_event(
-            source=source, content=content, ache_level=ache_level
-        )
-        ache_event = ache_event_response.payload
+        started = time.perf_counter()
 
-        # 2. Calculate and store ScarIndex
+        # 2a. Calculate ScarIndex (pure computation, needed by every later stage)
         ache_measurement = AcheMeasurement(before=ache_level, after=ache_level * 0.5)  # Simplified transmutation
 
         c_i_list = [
@@ -449,50 +686,154 @@ class SpiralOSBackend:
             ache=ache_measurement,
         )
 
-        scarindex_record_response = await self.supabase.insert_scarindex_calculation(
-            result=scarindex_result, ache_event_id=ache_event_response.inserted_id
+        try:
+            storage, _ = await asyncio.gather(
+                self._store_event(source, content, ache_level, scarindex_result),
+                self._timed("panic_check", self._check_panic(scarindex_result)),
+            )
+        except Exception:
+            self.events_failed += 1
+            raise
+
+        self.stage_latency["total"].record(time.perf_counter() - started)
+        self.events_processed += 1
+
+        return {
+            **storage,
+            "scarindex_value": scarindex_result.scarindex,
+            "is_valid_transmutation": scarindex_result.is_valid,
+        }
+
+    async def _store_event(
+        self, source: str, content: Dict, ache_level: float, scarindex_result: ScarIndexResult
+    ) -> Dict:
+        # 1. Store Ache event
+        ache_event_response = await self._timed(
+            "ache_event", self.supabase.insert_ache_event(source=source, content=content, ache_level=ache_level)
+        )
+        ache_event = ache_event_response.payload
+
+        # 2b. Store ScarIndex
+        scarindex_record_response = await self._timed(
+            "scarindex",
+            self.supabase.insert_scarindex_calculation(
+                result=scarindex_result, ache_event_id=ache_event_response.inserted_id
+            ),
         )
         scarindex_record = scarindex_record_response.payload
 
-        # 3. Create VaultNode
-        import hashlib
-
+        # 3. Create VaultNode and 4. commit to GitHub, concurrently
         state_hash = hashlib.sha256(json.dumps(scarindex_record, sort_keys=True).encode()).hexdigest()
 
-        vaultnode_response = await self.supabase.insert_vaultnode(
-            node_type="scarindex",
-            reference_id=scarindex_result.id,
-            state_hash=state_hash,
-            previous_hash=None,  # Would link to previous VaultNode
-            audit_log={
-                "action": "scarindex_calculation",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "result": scarindex_record,
-            },
+        vaultnode_response, github_audit = await asyncio.gather(
+            self._timed(
+                "vaultnode",
+                self.supabase.insert_vaultnode(
+                    node_type="scarindex",
+                    reference_id=scarindex_result.id,
+                    state_hash=state_hash,
+                    previous_hash=None,  # Would link to previous VaultNode
+                    audit_log={
+                        "action": "scarindex_calculation",
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "result": scarindex_record,
+                    },
+                ),
+            ),
+            self._timed(
+                "github_audit",
+                self.github.create_audit_trail(scarindex_id=scarindex_result.id, calculation_data=scarindex_record),
+            ),
         )
-        vaultnode = vaultnode_response.payload
 
-        # 4. Commit to GitHub
-        github_audit = await self.github.create_audit_trail(
-            scarindex_id=scarindex_result.id, calculation_data=scarindex_record
-        )
+        return {
+            "ache_event": ache_event,
+            "scarindex": scarindex_record,
+            "vaultnode": vaultnode_response.payload,
+            "github_audit": github_audit,
+        }
 
+    async def _check_panic(self, scarindex_result: ScarIndexResult) -> None:
         # 5. Check for Panic Frame trigger
-        panic_manager = PanicFrameManager()
-        if panic_manager.should_trigger(scarindex_result.scarindex):
-            panic_frame = panic_manager.trigger_panic_frame(
+        if self.panic_manager.should_trigger(scarindex_result.scarindex):
+            panic_frame = self.panic_manager.trigger_panic_frame(
                 scarindex=scarindex_result.scarindex, metadata={"scarindex_id": scarindex_result.id}
             )
 
             await self.supabase.insert_panic_frame(panic_frame)
 
+    async def process_ache_events(
+        self,
+        events: Union[AsyncIterable[Union[AcheEventRequest, Dict]], Iterable[Union[AcheEventRequest, Dict]]],
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Union[Dict, BaseException]]:
+        """
+        Process a stream of Ache events with bounded concurrency
+
+        Up to ``concurrency`` events are in flight at once; results are
+        yielded in input order as soon as the oldest in-flight event
+        completes.
+
+        Args:
+            events: Sync or async iterable of AcheEventRequest (or dicts with its fields)
+            concurrency: Maximum in-flight events (default: self.concurrency)
+            return_exceptions: Yield a failed event's exception instead of raising it
+
+        Yields:
+            Processing results, in input order
+        """
+        limit = max(1, concurrency or self.concurrency)
+        in_flight: Deque[asyncio.Task] = deque()
+
+        async def _iterate():
+            if hasattr(events, "__aiter__"):
+                async for event in events:
+                    yield event
+            else:
+                for event in events:
+                    yield event
+
+        async def _result(task: asyncio.Task):
+            try:
+                return await task
+            except Exception as exc:
+                if not return_exceptions:
+                    raise
+                return exc
+
+        try:
+            async for event in _iterate():
+                request = event if isinstance(event, AcheEventRequest) else AcheEventRequest(**event)
+                in_flight.append(
+                    asyncio.create_task(
+                        self.process_ache_event(
+                            source=request.source,
+                            content=request.content,
+                            ache_level=request.ache_level,
+                            coherence_components=request.coherence_components,
+                        )
+                    )
+                )
+                if len(in_flight) >= limit:
+                    yield await _result(in_flight.popleft())
+
+            while in_flight:
+                yield await _result(in_flight.popleft())
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                # Reap the cancelled tasks so none is left pending or holding an unretrieved error
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    def get_pipeline_metrics(self) -> Dict[str, Any]:
+        """Per-stage latency histograms and event counters."""
+
         return {
-            "ache_event": ache_event,
-            "scarindex": scarindex_record,
-            "vaultnode": vaultnode,
-            "github_audit": github_audit,
-            "scarindex_value": scarindex_result.scarindex,
-            "is_valid_transmutation": scarindex_result.is_valid,
+            "events_processed": self.events_processed,
+            "events_failed": self.events_failed,
+            "stages": {stage: histogram.to_dict() for stage, histogram in self.stage_latency.items()},
         }
 
     async def get_system_status(self) -> Dict:
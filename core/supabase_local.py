@@ -0,0 +1,194 @@
+"""
+Local Supabase stand-in - In-process table store with the supabase-py surface
+
+Implements the subset of the supabase-py builder chain used by SpiralOS
+(``table().insert/upsert/select().eq().execute()`` and ``rpc().execute()``)
+against in-memory tables, so persistence paths can be tested and
+benchmarked without a live project. Requests can be given a simulated
+round-trip latency and failures can be injected to exercise retries.
+
+    client = LocalSupabaseClient(latency=0.002)
+    SupabaseClient(client=client)
+"""
+
+import itertools
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Union
+
+Rows = Union[Dict[str, Any], List[Dict[str, Any]]]
+
+
+@dataclass
+class LocalResponse:
+    """Mirrors the attributes SpiralOS reads from a postgrest APIResponse"""
+
+    data: Any = field(default_factory=list)
+    status_code: int = 200
+    error: Optional[str] = None
+    count: Optional[int] = None
+
+
+class _Query:
+    def __init__(self, client: "LocalSupabaseClient", table: str):
+        self._client = client
+        self._table = table
+        self._action: Optional[Callable[[], LocalResponse]] = None
+        self._filters: List = []
+
+    # Writes ---------------------------------------------------------------
+
+    def insert(self, rows: Rows, **_: Any) -> "_Query":
+        self._action = lambda: self._client._insert(self._table, rows, upsert=False)
+        return self
+
+    def upsert(self, rows: Rows, on_conflict: str = "id", **_: Any) -> "_Query":
+        self._action = lambda: self._client._insert(self._table, rows, upsert=True, on_conflict=on_conflict or "id")
+        return self
+
+    # Reads ----------------------------------------------------------------
+
+    def select(self, *_: Any, **__: Any) -> "_Query":
+        self._action = lambda: self._client._select(self._table, self._filters)
+        return self
+
+    def eq(self, column: str, value: Any) -> "_Query":
+        self._filters.append((column, value))
+        return self
+
+    def execute(self) -> LocalResponse:
+        if self._action is None:
+            raise RuntimeError("No operation on local query")
+        return self._client._request(self._action)
+
+
+class _RPC:
+    def __init__(self, client: "LocalSupabaseClient", name: str, params: Dict):
+        self._client = client
+        self._name = name
+        self._params = params
+
+    def execute(self) -> LocalResponse:
+        return self._client._request(lambda: self._client._rpc(self._name, self._params))
+
+
+class LocalSupabaseClient:
+    """
+    LocalSupabaseClient - Thread-safe in-memory Supabase stand-in
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        fail_every: int = 0,
+        rpc_handlers: Optional[Dict[str, Callable[[Dict], Any]]] = None,
+    ):
+        """
+        Args:
+            latency: Simulated seconds per request (slept in the calling thread)
+            fail_every: Raise on every n-th request (0 disables failure injection)
+            rpc_handlers: Functions backing ``rpc(name, params)``
+        """
+        self.latency = latency
+        self.fail_every = fail_every
+        self.rpc_handlers = rpc_handlers or {}
+
+        self.tables: Dict[str, Dict[Any, Dict[str, Any]]] = {}  # table -> id -> row
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+        # Metrics
+        self.requests = 0
+        self.failures = 0
+        self.rows_written = 0
+
+    def table(self, name: str) -> _Query:
+        return _Query(self, name)
+
+    def rpc(self, name: str, params: Optional[Dict] = None) -> _RPC:
+        return _RPC(self, name, params or {})
+
+    def rows(self, table: str) -> List[Dict[str, Any]]:
+        """Stored rows of a table, in insertion order"""
+        with self._lock:
+            return [dict(row) for row in self.tables.get(table, {}).values()]
+
+    # ------------------------------------------------------------------
+
+    def _request(self, action: Callable[[], LocalResponse]) -> LocalResponse:
+        with self._lock:
+            self.requests += 1
+            fail = self.fail_every and self.requests % self.fail_every == 0
+            if fail:
+                self.failures += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            raise ConnectionError("Injected local Supabase failure")
+        return action()
+
+    def _insert(self, table: str, rows: Rows, upsert: bool, on_conflict: str = "id") -> LocalResponse:
+        """Insert or upsert a batch atomically, like a single PostgREST request"""
+        batch = [rows] if isinstance(rows, dict) else list(rows)
+        columns = [c.strip() for c in on_conflict.split(",")] if upsert else ["id"]
+
+        with self._lock:
+            store = self.tables.setdefault(table, {})
+            # Conflict lookup; rows are stored by id, so only other columns need an index
+            by_id = columns == ["id"]
+            existing = {} if by_id else {tuple(row.get(c) for c in columns): i for i, row in store.items()}
+
+            staged: Dict[Any, Dict[str, Any]] = {}
+            order = []
+            for row in batch:
+                row = dict(row)
+                key = tuple(row.get(c) for c in columns) if all(c in row for c in columns) else None
+                if key is None:
+                    row_id = None
+                elif by_id:
+                    row_id = key[0] if key[0] in store or key[0] in staged else None
+                else:
+                    row_id = existing.get(key)
+
+                if row_id is not None:
+                    if not upsert:
+                        return LocalResponse(data=[], status_code=409, error=f"duplicate key {key} in {table}")
+                    row = {**staged.get(row_id, store[row_id]), **row}
+                else:
+                    row.setdefault("id", str(uuid.UUID(int=next(self._ids))))
+                    row_id = row["id"]
+                    if key is not None and not by_id:
+                        existing[key] = row_id
+
+                staged[row_id] = row
+                order.append(row_id)
+
+            store.update(staged)
+            self.rows_written += len(batch)
+            stored = [dict(staged[row_id]) for row_id in order]
+        return LocalResponse(data=stored, status_code=201)
+
+    def _select(self, table: str, filters: List) -> LocalResponse:
+        with self._lock:
+            rows = [
+                dict(row)
+                for row in self.tables.get(table, {}).values()
+                if all(row.get(column) == value for column, value in filters)
+            ]
+        return LocalResponse(data=rows, status_code=200, count=len(rows))
+
+    def _rpc(self, name: str, params: Dict) -> LocalResponse:
+        handler = self.rpc_handlers.get(name)
+        if handler is None:
+            return LocalResponse(data=None, status_code=404, error=f"function {name} not found")
+        return LocalResponse(data=handler(params), status_code=200)
+
+    def get_metrics(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "rows_written": self.rows_written,
+            "tables": len(self.tables),
+        }
@@ -0,0 +1,249 @@
+"""
+Supabase Client Registry - One pooled client per project and key per process
+
+Every ``create_client`` call brings its own PostgREST HTTP session, so
+subsystems that each build a client open their own connections and TLS
+handshakes. The registry hands out one shared client per (url, key) pair,
+created lazily on first use, and sizes its keep-alive connection pool.
+
+Subsystems keep their own credential resolution and ask for a client with
+``client_for(url, key)``, or use a role:
+
+    registry = get_client_registry()
+    service = registry.get("service_role")   # SUPABASE_SERVICE_ROLE_KEY
+    anon = registry.get("anon")              # SUPABASE_ANON_KEY
+
+``get_metrics()`` reports clients, lookups and the connection pool state
+of each shared client.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from supabase import Client, create_client
+
+logger = logging.getLogger(__name__)
+
+ROLE_SERVICE = "service_role"
+ROLE_ANON = "anon"
+
+# Environment variables consulted per role, in order
+ROLE_KEY_ENV = {
+    ROLE_SERVICE: ("SUPABASE_SERVICE_ROLE_KEY", "SUPABASE_KEY"),
+    ROLE_ANON: ("SUPABASE_ANON_KEY", "SUPABASE_KEY"),
+}
+
+ClientFactory = Callable[[str, str], Client]
+
+
+@dataclass
+class _Entry:
+    client: Any
+    role: Optional[str]
+    created_at: float = field(default_factory=time.time)
+    lookups: int = 0
+    last_used: float = field(default_factory=time.time)
+
+
+class SupabaseClientRegistry:
+    """
+    SupabaseClientRegistry - Process-wide, lazily created Supabase clients
+    """
+
+    def __init__(
+        self,
+        factory: Optional[ClientFactory] = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+    ):
+        """
+        Args:
+            factory: Client constructor (default: supabase.create_client)
+            max_connections: Connection cap per shared client's HTTP pool
+            max_keepalive_connections: Idle connections kept open per client
+            keepalive_expiry: Seconds an idle connection is kept alive
+        """
+        self.factory = factory
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+
+        self._clients: Dict[Tuple[str, str], _Entry] = {}
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.lookups = 0
+        self.created = 0
+        self.failures = 0
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def credentials_for(role: str) -> Tuple[Optional[str], Optional[str]]:
+        """Resolve (url, key) for a role from the environment"""
+        if role not in ROLE_KEY_ENV:
+            raise ValueError(f"Unknown Supabase role {role!r}; expected one of {sorted(ROLE_KEY_ENV)}")
+        key = next((os.getenv(name) for name in ROLE_KEY_ENV[role] if os.getenv(name)), None)
+        return os.getenv("SUPABASE_URL"), key
+
+    def client_for(
+        self, url: str, key: str, role: Optional[str] = None, factory: Optional[ClientFactory] = None
+    ) -> Client:
+        """
+        Shared client for a project URL and API key, created on first use
+
+        Args:
+            url: Supabase project URL
+            key: API key
+            role: Label reported in metrics
+            factory: Client constructor used if the client does not exist yet
+        """
+        if not url or not key:
+            raise RuntimeError("Supabase URL and key are required")
+
+        cache_key = (str(url), key)
+        with self._lock:
+            self.lookups += 1
+            entry = self._clients.get(cache_key)
+            if entry is None:
+                try:
+                    client = (factory or self.factory or create_client)(str(url), key)
+                except Exception:
+                    self.failures += 1
+                    raise
+                self._configure_pool(client)
+                entry = self._clients[cache_key] = _Entry(client=client, role=role)
+                self.created += 1
+            elif role and entry.role is None:
+                entry.role = role
+
+            entry.lookups += 1
+            entry.last_used = time.time()
+            return entry.client
+
+    def get(self, role: str = ROLE_SERVICE, factory: Optional[ClientFactory] = None) -> Client:
+        """Shared client for a role; raises RuntimeError when its credentials are not configured"""
+        url, key = self.credentials_for(role)
+        if not url or not key:
+            raise RuntimeError(f"Supabase credentials for role {role!r} are not configured")
+        return self.client_for(url, key, role=role, factory=factory)
+
+    def get_optional(self, role: str = ROLE_SERVICE, factory: Optional[ClientFactory] = None) -> Optional[Client]:
+        """Like ``get`` but returns None (and logs) when no client can be created"""
+        try:
+            return self.get(role, factory=factory)
+        except Exception as exc:
+            logger.warning("Supabase client for role %s unavailable: %s", role, exc)
+            return None
+
+    def register(self, url: str, key: str, client: Any, role: Optional[str] = None):
+        """Install a pre-built client (e.g. a local stand-in) for a URL and key"""
+        with self._lock:
+            self._clients[(str(url), key)] = _Entry(client=client, role=role)
+
+    # ------------------------------------------------------------------
+    # Connection pooling
+    # ------------------------------------------------------------------
+
+    def _configure_pool(self, client: Any):
+        """Resize the PostgREST HTTP session's keep-alive pool (best effort)"""
+        try:
+            import httpx
+
+            postgrest = client.postgrest
+            session = postgrest.session
+            if not isinstance(session, httpx.Client):
+                return
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            )
+            postgrest.session = type(session)(
+                base_url=session.base_url, headers=session.headers, timeout=session.timeout, limits=limits
+            )
+            session.close()
+        except Exception as exc:  # pragma: no cover - depends on supabase-py internals
+            logger.debug("Could not configure Supabase connection pool: %s", exc)
+
+    @staticmethod
+    def _pool_stats(client: Any) -> Dict[str, int]:
+        try:
+            pool = client.postgrest.session._transport._pool
+            connections = list(pool.connections)
+        except Exception:
+            return {}
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return {"connections": len(connections), "idle": idle, "active": len(connections) - idle}
+
+    # ------------------------------------------------------------------
+    # Lifecycle / metrics
+    # ------------------------------------------------------------------
+
+    def close(self):
+        """Close pooled HTTP sessions and forget all clients"""
+        with self._lock:
+            entries = list(self._clients.values())
+            self._clients.clear()
+        for entry in entries:
+            try:
+                entry.client.postgrest.session.close()
+            except Exception:
+                pass
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = list(self._clients.items())
+        return {
+            "clients": len(entries),
+            "lookups": self.lookups,
+            "created": self.created,
+            "reused": self.lookups - self.created,
+            "failures": self.failures,
+            "pool_limits": {
+                "max_connections": self.max_connections,
+                "max_keepalive_connections": self.max_keepalive_connections,
+                "keepalive_expiry": self.keepalive_expiry,
+            },
+            "by_client": [
+                {
+                    "url": url,
+                    "role": entry.role,
+                    "lookups": entry.lookups,
+                    "age_seconds": time.time() - entry.created_at,
+                    "idle_seconds": time.time() - entry.last_used,
+                    "pool": self._pool_stats(entry.client),
+                }
+                for (url, _), entry in entries
+            ],
+        }
+
+
+_registry: Optional[SupabaseClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> SupabaseClientRegistry:
+    """Process-wide client registry"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = SupabaseClientRegistry()
+    return _registry
+
+
+def set_client_registry(registry: Optional[SupabaseClientRegistry]):
+    """Replace the process-wide registry (None resets to a fresh default on next use)"""
+    global _registry
+    _registry = registry
@@ -0,0 +1,246 @@
+"""
+Write-Behind Queue - Bounded background batching for persistence paths
+
+Base class for writers that take rows off a hot path. Items go into a
+bounded queue; a daemon thread groups them into batches and hands each batch
+to ``_write_batch`` once ``batch_size`` items are waiting or
+``flush_interval`` seconds have passed.
+
+``flush()`` waits for everything queued so far to be written and
+``close()`` drains the queue and stops the thread. While the thread runs,
+``close`` is also registered with ``atexit`` (bounded by ``exit_timeout``),
+so short-lived scripts do not lose queued rows when the interpreter exits.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+_FLUSH = object()
+
+
+class WriteBehindQueue(ABC):
+    """
+    WriteBehindQueue - Bounded queue drained in batches by a background thread
+    """
+
+    thread_name = "write-behind"
+    exit_timeout = 10.0
+
+    def __init__(
+        self,
+        client: Any = None,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        max_queue_size: int = 10000,
+    ):
+        """
+        Args:
+            client: Supabase client (defaults to ``core.db.get_supabase()``)
+            batch_size: Items per batch handed to ``_write_batch``
+            flush_interval: Maximum seconds an item waits before being flushed
+            max_queue_size: Bound on queued items (backpressure threshold)
+        """
+        self._client = client
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()  # guards thread start, close and counters
+        self._closed = False
+
+        # Metrics
+        self.enqueued = 0
+        self.dropped = 0
+        self.batches = 0
+
+    @property
+    def client(self):
+        if self._client is None:
+            from core.db import get_supabase
+
+            self._client = get_supabase()
+        return self._client
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @abstractmethod
+    def _write_batch(self, batch: List[Any]):
+        """Persist one batch (runs on the background thread)"""
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None and not self._closed:
+                    self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+                    self._thread.start()
+                    atexit.register(self._close_at_exit)
+
+    def _enqueue(self, item: Any, block: bool = False, timeout: Optional[float] = None) -> bool:
+        """
+        Queue an item
+
+        Returns:
+            True if queued, False if dropped because the queue was full (or
+            stayed full for ``timeout`` seconds when blocking) or the writer
+            is closed
+        """
+        if self._closed:
+            with self._lock:
+                self.dropped += 1
+            return False
+
+        self._ensure_started()
+        try:
+            self._queue.put(item, block=block, timeout=timeout)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+
+        with self._lock:
+            self.enqueued += 1
+        return True
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def is_backpressured(self) -> bool:
+        """True when the queue is full and producers would block or drop"""
+        return self._queue.full()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every queued item has been handed to ``_write_batch``
+
+        Returns:
+            True if the queue drained within ``timeout``. After ``close()``
+            (or if the thread has died) nothing consumes the queue any more,
+            so this returns at once, reporting whether anything was left.
+        """
+        thread = self._thread
+        if thread is None:
+            return True
+        if self._closed or not thread.is_alive():
+            return self._queue.unfinished_tasks == 0
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # Cut the batch being collected short instead of waiting out flush_interval
+        try:
+            self._queue.put(_FLUSH, timeout=timeout)
+        except queue.Full:
+            pass
+
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flush outstanding items and stop the background thread
+
+        ``timeout`` bounds the whole call, including waiting for queue space
+        for the stop marker. Returns False if the thread did not finish in
+        time (it keeps draining in the background).
+        """
+        with self._lock:
+            if self._closed:
+                return True
+            self._closed = True
+            thread = self._thread
+
+        if thread is None:
+            return True
+        atexit.unregister(self._close_at_exit)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning(
+                "%s did not drain within %.1fs; closing with %d rows queued",
+                self.thread_name,
+                timeout,
+                self.queue_depth,
+            )
+            return False
+
+        thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        return not thread.is_alive()
+
+    def _close_at_exit(self):
+        self.close(timeout=self.exit_timeout)
+
+    # ------------------------------------------------------------------
+    # Consumer side
+    # ------------------------------------------------------------------
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is _STOP or first is _FLUSH:
+                self._queue.task_done()
+                if first is _STOP:
+                    return
+                continue
+
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            marker = None
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP or item is _FLUSH:
+                    marker = item
+                    break
+                batch.append(item)
+
+            try:
+                self._write_batch(batch)
+            except Exception:
+                logger.exception("%s failed to write a batch of %d rows", self.thread_name, len(batch))
+            with self._lock:
+                self.batches += 1
+            for _ in batch:
+                self._queue.task_done()
+
+            if marker is not None:
+                self._queue.task_done()
+                if marker is _STOP:
+                    return
+
+    def get_metrics(self) -> Dict:
+        return {
+            "queue_depth": self.queue_depth,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "batches": self.batches,
+        }
@@ -15,6 +15,7 @@ creating a dual-token economy that values both order and understanding.
 
 import sys
 import uuid
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -264,6 +265,40 @@ class BurnValidation:
         }
 
 
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """
+    MarketSnapshot - Point-in-time Empathy Market aggregates
+
+    Built from running counters, independent of how many tokens exist.
+    """
+
+    total_emp_minted: Decimal
+    total_emp_burned: Decimal
+    total_resonance_events: int
+    total_tokens: int
+    total_burns: int
+    total_participants: int
+    total_burn_validations: int
+    emp_by_role: Dict[str, Decimal] = field(default_factory=dict)
+    taken_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def to_dict(self) -> Dict:
+        return {
+            "total_emp_minted": str(self.total_emp_minted),
+            "total_emp_burned": str(self.total_emp_burned),
+            "total_resonance_events": self.total_resonance_events,
+            "total_emp_tokens": self.total_tokens,
+            "total_burns": self.total_burns,
+            "total_participants": self.total_participants,
+            "total_burn_validations": self.total_burn_validations,
+            "average_emp_per_event": str(
+                self.total_emp_minted / self.total_resonance_events if self.total_resonance_events > 0 else Decimal("0")
+            ),
+            "emp_by_role": {role: str(amount) for role, amount in self.emp_by_role.items()},
+        }
+
+
 class EmpathyMarket:
     """
     Empathy Market - Proof-of-Being-Seen Economic Engine
@@ -314,6 +349,15 @@ class EmpathyMarket:
         self.total_emp_burned = Decimal("0")
         self.total_resonance_events = 0
 
+        # Running aggregates (kept in step on mint/burn)
+        self.burn_count = 0
+        self.tokens_by_participant: Counter = Counter()
+        self.emp_by_role: Dict[str, Decimal] = {
+            "speaker": Decimal("0"),
+            "listener": Decimal("0"),
+            "witness": Decimal("0"),
+        }
+
     def create_wallet(self, participant_id: Optional[str] = None) -> EmpathyWallet:
         """Create new empathy wallet"""
         wallet = EmpathyWallet(participant_id=participant_id or str(uuid.uuid4()))
@@ -397,6 +441,10 @@ class EmpathyMarket:
 
         speaker_wallet.deposit_emp(speaker_share, "speaker")
         listener_wallet.deposit_emp(listener_share, "listener")
+        self.emp_by_role["speaker"] += speaker_share
+        self.emp_by_role["listener"] += listener_share
+        self.tokens_by_participant[resonance_event.speaker_id] += 1
+        self.tokens_by_participant[resonance_event.listener_id] += 1
 
         # Update reputations
         speaker_wallet.update_reputation(resonance_surplus)
@@ -410,6 +458,7 @@ class EmpathyMarket:
                 if not witness_wallet:
                     witness_wallet = self.create_wallet(witness_id)
                 witness_wallet.deposit_emp(witness_share, "witness")
+                self.emp_by_role["witness"] += witness_share
 
         # Update statistics
         self.total_emp_minted += emp_value
@@ -539,24 +588,38 @@ class EmpathyMarket:
                 if speaker_wallet.emp_balance >= amount:
                     speaker_wallet.emp_balance -= amount
                     self.total_emp_burned += amount
+                    self.burn_count += 1
 
         return validation
 
+    def get_market_snapshot(self) -> MarketSnapshot:
+        """Get market aggregates in O(1)"""
+        return MarketSnapshot(
+            total_emp_minted=self.total_emp_minted,
+            total_emp_burned=self.total_emp_burned,
+            total_resonance_events=self.total_resonance_events,
+            total_tokens=len(self.emp_tokens),
+            total_burns=self.burn_count,
+            total_participants=len(self.wallets),
+            total_burn_validations=len(self.burn_validations),
+            emp_by_role=dict(self.emp_by_role),
+        )
+
     def get_market_stats(self) -> Dict:
         """Get Empathy Market statistics"""
-        return {
-            "total_emp_minted": str(self.total_emp_minted),
-            "total_emp_burned": str(self.total_emp_burned),
-            "total_resonance_events": self.total_resonance_events,
-            "total_participants": len(self.wallets),
-            "total_burn_validations": len(self.burn_validations),
-            "average_emp_per_event": str(
-                self.total_emp_minted / self.total_resonance_events if self.total_resonance_events > 0 else Decimal("0")
-            ),
-            "consensus_threshold": self.consensus_threshold,
-            "min_resonance_surplus": str(self.min_resonance_surplus),
-            "burn_validation_enabled": self.enable_burn_validation,
-        }
+        stats = self.get_market_snapshot().to_dict()
+        stats.update(
+            {
+                "consensus_threshold": self.consensus_threshold,
+                "min_resonance_surplus": str(self.min_resonance_surplus),
+                "burn_validation_enabled": self.enable_burn_validation,
+            }
+        )
+        return stats
+
+    def get_participant_token_count(self, participant_id: str) -> int:
+        """Get number of EMP tokens a participant was speaker or listener on"""
+        return self.tokens_by_participant.get(participant_id, 0)
 
 
 # Constants for w_i calculation
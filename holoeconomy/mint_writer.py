@@ -0,0 +1,165 @@
+"""
+Mint Event Writer - Batched write-behind persistence for ScarCoin mints
+
+Takes mint rows off the minting hot path. Rows are queued in a bounded
+buffer and a background thread groups them into bulk Supabase inserts,
+flushing once ``batch_size`` rows are waiting or ``flush_interval``
+seconds have passed. Failed batches are retried with exponential backoff
+and parked in ``failed_rows`` once retries are exhausted.
+
+``submit`` never blocks by default: when the queue is full the row is
+dropped and counted, so callers on an event loop (the bridge API) cannot be
+stalled by a slow database.
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from core.write_behind import WriteBehindQueue
+
+logger = logging.getLogger(__name__)
+
+FlushHook = Callable[[List[Dict], float, bool], None]
+
+
+class MintEventWriter(WriteBehindQueue):
+    """
+    MintEventWriter - Bounded write-behind queue for ``scarcoin_mints`` rows
+    """
+
+    thread_name = "mint-event-writer"
+
+    def __init__(
+        self,
+        table: str = "scarcoin_mints",
+        client: Any = None,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        max_queue_size: int = 10000,
+        max_retries: int = 5,
+        backoff_base: float = 0.1,
+        backoff_max: float = 5.0,
+        block_when_full: bool = False,
+        submit_timeout: Optional[float] = 1.0,
+        on_flush: Optional[FlushHook] = None,
+        max_failed_rows: int = 10000,
+    ):
+        """
+        Initialize writer
+
+        Args:
+            table: Supabase table receiving the rows
+            client: Supabase client (defaults to ``core.db.get_supabase()``)
+            batch_size: Rows per bulk insert
+            flush_interval: Maximum seconds a row waits before being flushed
+            max_queue_size: Bound on queued rows (backpressure threshold)
+            max_retries: Retries per batch before rows are parked as failed
+            backoff_base: Initial retry delay in seconds, doubled per attempt
+            backoff_max: Cap on the retry delay
+            block_when_full: Wait for space when the queue is full instead of dropping
+            submit_timeout: Longest a blocking submit waits before dropping (None waits forever)
+            on_flush: Hook called with (rows, latency_seconds, succeeded) after each batch
+            max_failed_rows: Bound on rows kept in ``failed_rows``
+        """
+        super().__init__(
+            client=client, batch_size=batch_size, flush_interval=flush_interval, max_queue_size=max_queue_size
+        )
+        self.table = table
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.block_when_full = block_when_full
+        self.submit_timeout = submit_timeout
+        self.on_flush = on_flush
+        self.max_failed_rows = max_failed_rows
+
+        self.failed_rows: List[Dict] = []
+
+        # Metrics
+        self.written = 0
+        self.failed = 0
+        self.retries = 0
+        self.flush_count = 0
+        self.last_flush_latency = 0.0
+        self.max_flush_latency = 0.0
+        self._total_flush_latency = 0.0
+
+    def submit(self, row: Dict, timeout: Optional[float] = None) -> bool:
+        """
+        Queue a row for persistence
+
+        Args:
+            row: Row to insert
+            timeout: Seconds to wait for space when blocking on a full queue
+                (defaults to ``submit_timeout``)
+
+        Returns:
+            True if queued, False if dropped due to backpressure
+        """
+        if self.closed:
+            raise RuntimeError("MintEventWriter is closed")
+
+        queued = self._enqueue(
+            row, block=self.block_when_full, timeout=self.submit_timeout if timeout is None else timeout
+        )
+        if not queued:
+            logger.warning("Mint event queue full; dropping row %s", row.get("id"))
+        return queued
+
+    def _write_batch(self, batch: List[Dict]):
+        started = time.monotonic()
+        succeeded = False
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.client.table(self.table).insert(batch).execute()
+                succeeded = True
+                break
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.error("Failed to record %d mint events after %d attempts: %s", len(batch), attempt + 1, e)
+                    break
+                with self._lock:
+                    self.retries += 1
+                time.sleep(min(self.backoff_max, self.backoff_base * (2**attempt)))
+
+        latency = time.monotonic() - started
+        with self._lock:
+            self.flush_count += 1
+            self.last_flush_latency = latency
+            self.max_flush_latency = max(self.max_flush_latency, latency)
+            self._total_flush_latency += latency
+
+            if succeeded:
+                self.written += len(batch)
+            else:
+                self.failed += len(batch)
+                room = self.max_failed_rows - len(self.failed_rows)
+                if room > 0:
+                    self.failed_rows.extend(batch[:room])
+
+        if self.on_flush:
+            try:
+                self.on_flush(batch, latency, succeeded)
+            except Exception as e:
+                logger.warning("Mint writer flush hook raised: %s", e)
+
+    def get_metrics(self) -> Dict:
+        """Get queue and flush metrics"""
+        with self._lock:
+            metrics = super().get_metrics()
+            metrics.update(
+                {
+                    "written": self.written,
+                    "failed": self.failed,
+                    "retries": self.retries,
+                    "flush_count": self.flush_count,
+                    "last_flush_latency_ms": self.last_flush_latency * 1000,
+                    "max_flush_latency_ms": self.max_flush_latency * 1000,
+                    "avg_flush_latency_ms": (
+                        self._total_flush_latency / self.flush_count * 1000 if self.flush_count else 0.0
+                    ),
+                }
+            )
+        return metrics
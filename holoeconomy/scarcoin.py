@@ -11,12 +11,14 @@ creating a currency where value flows from coherence.
 
 import hashlib
 import uuid
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import ROUND_HALF_UP, Decimal
 from typing import Dict, List, Optional
 from uuid import UUID
 
+from .mint_writer import MintEventWriter
 from .vaultnode import VaultEvent, seal_emp_minted
 
 
@@ -197,10 +199,10 @@ class Wallet:
     last_transaction_at: Optional[datetime] = None
     metadata: Dict = field(default_factory=dict)
 
-    def deposit(self, amount: Decimal, is_minting: bool = False):
-        """Deposit ScarCoin to wallet"""
+    def deposit(self, amount: Decimal, is_minting: bool = False, transactions: int = 1):
+        """Deposit ScarCoin to wallet (``transactions`` > 1 for grouped deposits)"""
         self.balance += amount
-        self.transaction_count += 1
+        self.transaction_count += transactions
         self.last_transaction_at = datetime.now(timezone.utc)
 
         if is_minting:
@@ -231,6 +233,73 @@ class Wallet:
         }
 
 
+@dataclass(frozen=True)
+class SupplySnapshot:
+    """
+    SupplySnapshot - Point-in-time ScarCoin supply aggregates
+
+    Built from running counters, so taking one costs the same regardless of
+    how many coins have ever been minted.
+    """
+
+    total_supply: Decimal
+    total_minted: Decimal
+    total_burned: Decimal
+    minting_count: int
+    burning_count: int
+    active_wallets: int
+    total_coins: int
+    burned_coins: int
+    taken_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def active_coins(self) -> int:
+        return self.total_coins - self.burned_coins
+
+    def to_dict(self) -> Dict:
+        return {
+            "total_supply": str(self.total_supply),
+            "total_minted": str(self.total_minted),
+            "total_burned": str(self.total_burned),
+            "minting_count": self.minting_count,
+            "burning_count": self.burning_count,
+            "active_wallets": self.active_wallets,
+            "total_coins": self.total_coins,
+            "burned_coins": self.burned_coins,
+        }
+
+
+@dataclass
+class ScarCoinMintRequest:
+    """
+    ScarCoinMintRequest - One entry of a batch mint
+
+    Mirrors the arguments of ``ScarCoinMintingEngine.mint_scarcoin``.
+    """
+
+    transmutation_id: str
+    scarindex_before: Decimal
+    scarindex_after: Decimal
+    transmutation_efficiency: Decimal
+    owner_address: str
+    oracle_signatures: Optional[List[str]] = None
+
+
+@dataclass
+class MintResult:
+    """
+    MintResult - Outcome of one batch mint entry
+    """
+
+    transmutation_id: str
+    coin: Optional[ScarCoin] = None
+    reason: str = ""
+
+    @property
+    def minted(self) -> bool:
+        return self.coin is not None
+
+
 class ScarCoinMintingEngine:
     """
     ScarCoin Minting Engine
@@ -245,6 +314,7 @@ class ScarCoinMintingEngine:
         multiplier: Decimal = Decimal("1000"),
         min_delta_c: Decimal = Decimal("0.01"),
         oracle_consensus_threshold: int = 2,
+        mint_writer: Optional[MintEventWriter] = None,
     ):
         """
         Initialize ScarCoin Minting Engine
@@ -253,10 +323,13 @@ class ScarCoinMintingEngine:
             multiplier: Economic scaling factor
             min_delta_c: Minimum coherence gain for minting
             oracle_consensus_threshold: Required oracle signatures
+            mint_writer: Optional write-behind queue for mint rows; when unset,
+                each mint is inserted into Supabase synchronously
         """
         self.multiplier = multiplier
         self.min_delta_c = min_delta_c
         self.oracle_consensus_threshold = oracle_consensus_threshold
+        self.mint_writer = mint_writer
 
         # Storage
         self.coins: Dict[str, ScarCoin] = {}
@@ -270,6 +343,11 @@ class ScarCoinMintingEngine:
         self.minting_count = 0
         self.burning_count = 0
 
+        # Running aggregates (kept in step on mint/burn)
+        self.burned_coin_count = 0
+        self.coins_by_owner: Counter = Counter()
+        self.active_coins_by_owner: Counter = Counter()
+
     def create_wallet(self, address: Optional[str] = None) -> Wallet:
         """Create a new wallet"""
         wallet = Wallet(address=address) if address else Wallet()
@@ -342,6 +420,8 @@ class ScarCoinMintingEngine:
         Returns:
             Minted ScarCoin or None if validation failed
         """
+        self._ensure_mint_writer_open()
+
         # Validate Proof-of-Ache
         proof = self.validate_proof_of_ache(
             transmutation_id=transmutation_id,
@@ -392,29 +472,147 @@ class ScarCoinMintingEngine:
         self.total_supply += coin.coin_value
         self.total_minted += coin.coin_value
         self.minting_count += 1
+        self.coins_by_owner[owner_address] += 1
+        self.active_coins_by_owner[owner_address] += 1
 
         # Record to Supabase
         self.record_mint_event(coin)
 
         return coin
 
+    def mint_batch(self, requests: List[ScarCoinMintRequest]) -> List[MintResult]:
+        """
+        Mint ScarCoin for many transmutations at once
+
+        Applies the same rules as ``mint_scarcoin`` to every request, but
+        groups wallet deposits per address, updates supply counters once and
+        persists all minted rows in a single bulk call.
+
+        Args:
+            requests: Mint requests, processed in order
+
+        Returns:
+            One MintResult per request, in request order
+        """
+        self._ensure_mint_writer_open()
+
+        results: List[MintResult] = []
+        minted: List[ScarCoin] = []
+        deposits: Dict[str, List[Decimal]] = {}
+
+        for request in requests:
+            # Same Proof-of-Ache and oracle rules as mint_scarcoin
+            proof = self.validate_proof_of_ache(
+                transmutation_id=request.transmutation_id,
+                scarindex_before=request.scarindex_before,
+                scarindex_after=request.scarindex_after,
+                oracle_signatures=request.oracle_signatures,
+            )
+
+            delta_c = request.scarindex_after - request.scarindex_before
+            if not proof.validation_passed:
+                results.append(MintResult(request.transmutation_id, reason="proof_of_ache_failed"))
+                continue
+            if not proof.consensus_reached:
+                results.append(MintResult(request.transmutation_id, reason="oracle_consensus_not_reached"))
+                continue
+            if delta_c < self.min_delta_c:
+                results.append(MintResult(request.transmutation_id, reason="below_min_delta_c"))
+                continue
+
+            coin = ScarCoin(
+                transmutation_id=request.transmutation_id,
+                delta_c=delta_c,
+                scarindex_before=request.scarindex_before,
+                scarindex_after=request.scarindex_after,
+                transmutation_efficiency=request.transmutation_efficiency,
+                multiplier=self.multiplier,
+                owner=request.owner_address,
+                minted_at=proof.validated_at,
+            )
+            coin.calculate_value()
+
+            self.coins[coin.id] = coin
+            minted.append(coin)
+            deposits.setdefault(request.owner_address, []).append(coin.coin_value)
+            results.append(MintResult(request.transmutation_id, coin=coin, reason="minted"))
+
+        if not minted:
+            return results
+
+        # One deposit per wallet
+        for address, values in deposits.items():
+            wallet = self.get_wallet(address) or self.create_wallet(address)
+            wallet.deposit(sum(values, Decimal("0")), is_minting=True, transactions=len(values))
+            self.coins_by_owner[address] += len(values)
+            self.active_coins_by_owner[address] += len(values)
+
+        # Update statistics once
+        batch_value = sum((coin.coin_value for coin in minted), Decimal("0"))
+        self.total_supply += batch_value
+        self.total_minted += batch_value
+        self.minting_count += len(minted)
+
+        self.record_mint_events(minted)
+
+        return results
+
+    def _ensure_mint_writer_open(self):
+        """Refuse to mint once the write-behind queue can no longer persist the row"""
+        if self.mint_writer is not None and self.mint_writer.closed:
+            raise RuntimeError("Mint writer is closed; refusing to mint unrecorded coins")
+
+    @staticmethod
+    def build_mint_row(coin: ScarCoin) -> Dict:
+        """Build the ``scarcoin_mints`` row for a coin"""
+        return {
+            "id": coin.id,
+            "recipient_address": coin.owner,
+            "amount": float(coin.coin_value),
+            "ache_event_id": coin.transmutation_id if coin.transmutation_id else None,
+            "tx_hash": hashlib.sha256(f"{coin.id}{coin.minted_at}".encode()).hexdigest(),
+            "metadata": coin.metadata,
+        }
+
     def record_mint_event(self, coin: ScarCoin):
         """Record mint event to Supabase"""
+        row = self.build_mint_row(coin)
+
+        if self.mint_writer is not None:
+            self.mint_writer.submit(row)
+            return
+
         try:
             from core.db import get_supabase
             supabase = get_supabase()
-            
-            supabase.table("scarcoin_mints").insert({
-                "id": coin.id,
-                "recipient_address": coin.owner,
-                "amount": float(coin.coin_value),
-                "ache_event_id": coin.transmutation_id if coin.transmutation_id else None,
-                "tx_hash": hashlib.sha256(f"{coin.id}{coin.minted_at}".encode()).hexdigest(),
-                "metadata": coin.metadata
-            }).execute()
+
+            supabase.table("scarcoin_mints").insert(row).execute()
         except Exception as e:
             print(f"Failed to record mint event: {e}")
 
+    def record_mint_events(self, coins: List[ScarCoin]):
+        """Record several mint events to Supabase in one bulk call"""
+        rows = [self.build_mint_row(coin) for coin in coins]
+
+        if self.mint_writer is not None:
+            for row in rows:
+                self.mint_writer.submit(row)
+            return
+
+        try:
+            from core.db import get_supabase
+            supabase = get_supabase()
+
+            supabase.table("scarcoin_mints").insert(rows).execute()
+        except Exception as e:
+            print(f"Failed to record {len(rows)} mint events: {e}")
+
+    def flush_mint_events(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued mint rows to be persisted"""
+        if self.mint_writer is None:
+            return True
+        return self.mint_writer.flush(timeout)
+
     def burn_scarcoin(self, coin_id: str, reason: str = "Failed transmutation") -> bool:
         """
         Burn ScarCoin
@@ -446,21 +644,32 @@ class ScarCoinMintingEngine:
         self.total_supply -= coin.coin_value
         self.total_burned += coin.coin_value
         self.burning_count += 1
+        self.burned_coin_count += 1
+        self.active_coins_by_owner[coin.owner] -= 1
 
         return True
 
+    def get_supply_snapshot(self) -> SupplySnapshot:
+        """Get supply aggregates in O(1)"""
+        return SupplySnapshot(
+            total_supply=self.total_supply,
+            total_minted=self.total_minted,
+            total_burned=self.total_burned,
+            minting_count=self.minting_count,
+            burning_count=self.burning_count,
+            active_wallets=len(self.wallets),
+            total_coins=len(self.coins),
+            burned_coins=self.burned_coin_count,
+        )
+
     def get_supply_stats(self) -> Dict:
         """Get supply statistics"""
-        return {
-            "total_supply": str(self.total_supply),
-            "total_minted": str(self.total_minted),
-            "total_burned": str(self.total_burned),
-            "minting_count": self.minting_count,
-            "burning_count": self.burning_count,
-            "active_wallets": len(self.wallets),
-            "total_coins": len(self.coins),
-            "burned_coins": sum(1 for c in self.coins.values() if c.burned),
-        }
+        return self.get_supply_snapshot().to_dict()
+
+    def get_owner_coin_count(self, address: str, include_burned: bool = False) -> int:
+        """Get number of coins minted to an owner"""
+        counts = self.coins_by_owner if include_burned else self.active_coins_by_owner
+        return counts.get(address, 0)
 
     def get_wallet_balance(self, address: str) -> Optional[Decimal]:
         """Get wallet balance"""
@@ -26,6 +26,7 @@ from pydantic import BaseModel, Field
 MODULE_DIR = Path(__file__).resolve().parent
 
 try:
+    from mint_writer import MintEventWriter
     from scarcoin import ScarCoinMintingEngine
     from system_summary import SystemSummary
     from vaultnode import VaultEvent, VaultNode
@@ -38,6 +39,7 @@ except ModuleNotFoundError:  # pragma: no cover - fallback when executed directl
         sys.path.insert(0, module_root)
     if parent_root not in sys.path:
         sys.path.insert(0, parent_root)
+    from mint_writer import MintEventWriter
     from scarcoin import ScarCoinMintingEngine
     from system_summary import SystemSummary
     from vaultnode import VaultEvent, VaultNode
@@ -258,6 +260,7 @@ app.add_middleware(
 minting_engine = ScarCoinMintingEngine(
     multiplier=Decimal("1000"),
     min_delta_c=Decimal("0.01"),
+    mint_writer=MintEventWriter(),
 )
 
 vaultnode = VaultNode(vault_id=vaultnode_settings.default_id)
@@ -271,6 +274,12 @@ system_summary = SystemSummary(
 judicial_system = JudicialSystem()
 
 
+@app.on_event("shutdown")
+async def flush_mint_writer():
+    """Persist queued mint rows before the process exits"""
+    minting_engine.mint_writer.close(timeout=10.0)
+
+
 # Health check
 @app.get("/health")
 async def health_check():
@@ -280,6 +289,7 @@ async def health_check():
         "vault_id": vaultnode.vault_id,
         "total_blocks": len(vaultnode.blocks),
         "chain_valid": vaultnode.verify_chain(),
+        "mint_writer": minting_engine.mint_writer.get_metrics(),
     }
 
 
@@ -14,7 +14,7 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -38,26 +38,33 @@ class VaultEvent:
             "timestamp": self.timestamp.isoformat(),
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "VaultEvent":
+        return cls(
+            id=data["id"],
+            event_type=data["event_type"],
+            event_data=data["event_data"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+        )
+
     def hash(self) -> str:
         """Calculate SHA-256 hash of event"""
         event_json = json.dumps(self.to_dict(), sort_keys=True)
         return hashlib.sha256(event_json.encode()).hexdigest()
 
 
-@dataclass
-class MerkleNode:
-    """
-    MerkleNode - Node in Merkle tree
+MerkleProof = List[Tuple[str, bool]]
 
-    Used to construct Merkle tree for efficient event verification.
-    """
 
-    hash: str = ""
-    left: Optional["MerkleNode"] = None
-    right: Optional["MerkleNode"] = None
+def _hash_pair(left: str, right: str) -> str:
+    return hashlib.sha256((left + right).encode()).hexdigest()
+
 
-    def is_leaf(self) -> bool:
-        return self.left is None and self.right is None
+def hash_events(events: List[VaultEvent]) -> List[str]:
+    """Hash a batch of events into Merkle leaves in a single pass"""
+    dumps = json.dumps
+    sha256 = hashlib.sha256
+    return [sha256(dumps(event.to_dict(), sort_keys=True).encode()).hexdigest() for event in events]
 
 
 class MerkleTree:
@@ -65,6 +72,11 @@ class MerkleTree:
     Merkle Tree - Cryptographic event tree
 
     Constructs a Merkle tree from events for efficient verification.
+
+    The tree is stored as flat per-level hash arrays (``levels[0]`` are the
+    leaves, ``levels[-1]`` holds the root). Odd levels duplicate their last
+    node. A hash→leaf-index map lets inclusion proofs be produced and checked
+    in O(log n) without walking the tree.
     """
 
     def __init__(self, events: List[VaultEvent]):
@@ -75,56 +87,83 @@ class MerkleTree:
             events: List of VaultEvent instances
         """
         self.events = events
-        self.root: Optional[MerkleNode] = None
+        self.levels: List[List[str]] = []
+        self.leaf_index: Dict[str, int] = {}
 
         if events:
             self.build_tree()
 
+    @classmethod
+    def from_leaf_hashes(cls, leaf_hashes: List[str]) -> "MerkleTree":
+        """Build a tree directly from precomputed leaf hashes"""
+        tree = cls([])
+        tree._build_levels(list(leaf_hashes))
+        return tree
+
     def build_tree(self):
         """Build Merkle tree from events"""
-        # Create leaf nodes
-        leaves = [MerkleNode(hash=event.hash()) for event in self.events]
+        self._build_levels(hash_events(self.events))
 
-        # Build tree bottom-up
-        self.root = self._build_level(leaves)
+    def _build_levels(self, leaves: List[str]):
+        """Build every level bottom-up from the leaf hashes"""
+        self.levels = [leaves] if leaves else []
+        self.leaf_index = {}
+        for i, leaf in enumerate(leaves):
+            self.leaf_index.setdefault(leaf, i)
 
-    def _build_level(self, nodes: List[MerkleNode]) -> MerkleNode:
-        """Build one level of the tree"""
-        if len(nodes) == 1:
-            return nodes[0]
+        level = leaves
+        while len(level) > 1:
+            if len(level) % 2:
+                level = level + [level[-1]]  # Duplicate last if odd
+            level = [_hash_pair(level[i], level[i + 1]) for i in range(0, len(level), 2)]
+            self.levels.append(level)
 
-        # Pair up nodes
-        next_level = []
-        for i in range(0, len(nodes), 2):
-            left = nodes[i]
-            right = nodes[i + 1] if i + 1 < len(nodes) else nodes[i]  # Duplicate last if odd
+    def __len__(self) -> int:
+        return len(self.levels[0]) if self.levels else 0
 
-            # Create parent node
-            combined_hash = hashlib.sha256((left.hash + right.hash).encode()).hexdigest()
+    def get_root_hash(self) -> str:
+        """Get Merkle root hash"""
+        return self.levels[-1][0] if self.levels else ""
 
-            parent = MerkleNode(hash=combined_hash, left=left, right=right)
-            next_level.append(parent)
+    def index_of(self, leaf_hash: str) -> Optional[int]:
+        """Get leaf index for a hash"""
+        return self.leaf_index.get(leaf_hash)
 
-        return self._build_level(next_level)
+    def get_proof(self, index: int) -> MerkleProof:
+        """
+        Get inclusion proof for the leaf at ``index``
 
-    def get_root_hash(self) -> str:
-        """Get Merkle root hash"""
-        return self.root.hash if self.root else ""
+        Returns:
+            List of (sibling_hash, sibling_is_left) pairs from leaf to root
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(f"Leaf index {index} out of range")
+
+        proof: MerkleProof = []
+        for level in self.levels[:-1]:
+            if index % 2:
+                proof.append((level[index - 1], True))
+            else:
+                sibling = index + 1 if index + 1 < len(level) else index
+                proof.append((level[sibling], False))
+            index //= 2
+        return proof
+
+    @staticmethod
+    def verify_proof(leaf_hash: str, proof: MerkleProof, root: str) -> bool:
+        """Verify an inclusion proof against a Merkle root"""
+        current = leaf_hash
+        for sibling, sibling_is_left in proof:
+            current = _hash_pair(sibling, current) if sibling_is_left else _hash_pair(current, sibling)
+        return current == root
 
     def verify_event(self, event: VaultEvent) -> bool:
         """Verify that event is in the tree"""
         event_hash = event.hash()
-        return self._search_tree(self.root, event_hash)
-
-    def _search_tree(self, node: Optional[MerkleNode], target_hash: str) -> bool:
-        """Search tree for hash"""
-        if not node:
+        index = self.index_of(event_hash)
+        if index is None:
             return False
-
-        if node.hash == target_hash:
-            return True
-
-        return self._search_tree(node.left, target_hash) or self._search_tree(node.right, target_hash)
+        return self.verify_proof(event_hash, self.get_proof(index), self.get_root_hash())
 
 
 @dataclass
@@ -154,14 +193,16 @@ class VaultBlock:
     # Metadata
     metadata: Dict = field(default_factory=dict)
 
-    # Performance: Cache calculated hash
+    # Performance: Cache calculated hash and Merkle tree
     _cached_hash: Optional[str] = field(default=None, init=False, repr=False)
+    _merkle_tree: Optional[MerkleTree] = field(default=None, init=False, repr=False)
 
     def add_event(self, event: VaultEvent):
         """Add event to block"""
         self.events.append(event)
-        # Invalidate cached hash when block is modified
+        # Invalidate cached hash and tree when block is modified
         self._cached_hash = None
+        self._merkle_tree = None
 
     def build_merkle_tree(self) -> MerkleTree:
         """Build Merkle tree from events"""
@@ -170,10 +211,39 @@ class VaultBlock:
 
         tree = MerkleTree(self.events)
         self.merkle_root = tree.get_root_hash()
+        self._merkle_tree = tree
         # Invalidate cached hash when merkle_root changes
         self._cached_hash = None
         return tree
 
+    def _event_tree(self) -> MerkleTree:
+        """Merkle tree over the current events (cached; never touches merkle_root)"""
+        if self._merkle_tree is None:
+            self._merkle_tree = MerkleTree(self.events)
+        return self._merkle_tree
+
+    def get_event_proof(self, event: VaultEvent) -> Optional[MerkleProof]:
+        """Get Merkle inclusion proof for an event in this block"""
+        tree = self._event_tree()
+        index = tree.index_of(event.hash())
+        if index is None:
+            return None
+        return tree.get_proof(index)
+
+    def verify_event(self, event: VaultEvent) -> bool:
+        """
+        Verify an event is sealed in this block against its stored Merkle root
+
+        The proof comes from the current events but is checked against
+        ``merkle_root`` as sealed, so tampered or unsealed events fail.
+        """
+        if not self.merkle_root:
+            return False
+        proof = self.get_event_proof(event)
+        if proof is None:
+            return False
+        return MerkleTree.verify_proof(event.hash(), proof, self.merkle_root)
+
     def add_oracle_signature(self, oracle_name: str, signature: str, voting_weight: Decimal):
         """Add Oracle signature"""
         self.oracle_signatures[oracle_name] = signature
@@ -227,6 +297,21 @@ class VaultBlock:
             "block_hash": self.calculate_hash(),
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "VaultBlock":
+        return cls(
+            id=data["id"],
+            block_number=data["block_number"],
+            previous_hash=data["previous_hash"],
+            merkle_root=data["merkle_root"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            events=[VaultEvent.from_dict(event) for event in data["events"]],
+            oracle_signatures=data["oracle_signatures"],
+            consensus_reached=data["consensus_reached"],
+            ipfs_hash=data["ipfs_hash"],
+            metadata=data["metadata"],
+        )
+
 
 class VaultNode:
     """
@@ -236,19 +321,28 @@ class VaultNode:
     with Oracle Council consensus and IPFS storage.
     """
 
-    def __init__(self, vault_id: str = "ΔΩ.122.0"):
+    def __init__(self, vault_id: str = "ΔΩ.122.0", store=None):
         """
         Initialize VaultNode blockchain
 
         Args:
             vault_id: Vault designation
+            store: Optional VaultSegmentStore persisting blocks on disk.
+                An existing store is reopened as-is (including its
+                verification checkpoint); an empty one gets a genesis block.
         """
         self.vault_id = vault_id
-        self.blocks: List[VaultBlock] = []
+        self.store = store
+        self.blocks: List[VaultBlock] = store if store is not None else []
         self.pending_events: List[VaultEvent] = []
+        self.total_events = store.total_events if store is not None else 0
+
+        # Verification checkpoint: blocks up to checkpoint["block_number"] are verified
+        self.checkpoint: Optional[Dict] = store.load_checkpoint() if store is not None else None
 
         # Create genesis block
-        self._create_genesis_block()
+        if not self.blocks:
+            self._create_genesis_block()
 
     def send_heartbeat(self):
         """Send heartbeat to Supabase registry"""
@@ -289,6 +383,7 @@ class VaultNode:
         )
 
         self.blocks.append(genesis_block)
+        self.total_events += len(genesis_block.events)
 
     def add_event(self, event: VaultEvent):
         """Add event to pending queue"""
@@ -340,6 +435,7 @@ class VaultNode:
 
         # Add block to chain
         self.blocks.append(block)
+        self.total_events += len(block.events)
 
         # Clear pending events
         self.pending_events = []
@@ -356,22 +452,82 @@ class VaultNode:
         """Get latest block"""
         return self.blocks[-1]
 
-    def verify_chain(self) -> bool:
-        """Verify blockchain integrity"""
-        for i in range(1, len(self.blocks)):
-            current_block = self.blocks[i]
-            previous_block = self.blocks[i - 1]
+    def _verify_link(self, block_number: int) -> bool:
+        """Verify a block against its predecessor"""
+        current_block = self.blocks[block_number]
+        previous_block = self.blocks[block_number - 1]
 
-            # Verify previous hash
-            if current_block.previous_hash != previous_block.calculate_hash():
-                return False
+        # Verify previous hash
+        if current_block.previous_hash != previous_block.calculate_hash():
+            return False
+
+        # Verify Oracle consensus
+        return current_block.consensus_reached
+
+    def _advance_checkpoint(self, block_number: int):
+        """Record that the chain is verified up to block_number"""
+        previous = self.checkpoint["checkpoint_hash"] if self.checkpoint else "0" * 64
+        block_hash = self.blocks[block_number].calculate_hash()
+        self.checkpoint = {
+            "block_number": block_number,
+            "block_hash": block_hash,
+            "checkpoint_hash": hashlib.sha256((previous + block_hash).encode()).hexdigest(),
+        }
+        if self.store is not None:
+            self.store.save_checkpoint(self.checkpoint)
+
+    def _reset_checkpoint(self):
+        """Forget the checkpoint, on disk too, so a failed audit is not trusted after a restart"""
+        self.checkpoint = None
+        if self.store is not None:
+            self.store.save_checkpoint(None)
 
-            # Verify Oracle consensus
-            if not current_block.consensus_reached:
+    def verify_chain(self, full: bool = False) -> bool:
+        """
+        Verify blockchain integrity
+
+        Only blocks added since the last verification checkpoint are checked,
+        unless ``full`` is set, which re-audits the whole chain from genesis
+        and rebuilds the checkpoint.
+
+        Args:
+            full: Re-verify every block instead of resuming from the checkpoint
+        """
+        checkpoint = self.checkpoint
+        if (
+            full
+            or checkpoint is None
+            or checkpoint["block_number"] >= len(self.blocks)
+            or self.blocks[checkpoint["block_number"]].calculate_hash() != checkpoint["block_hash"]
+        ):
+            self._reset_checkpoint()
+            start = 1
+        else:
+            start = checkpoint["block_number"] + 1
+
+        for i in range(start, len(self.blocks)):
+            if not self._verify_link(i):
                 return False
 
+        if self.checkpoint is None:
+            self._advance_checkpoint(0)
+        if self.checkpoint["block_number"] < len(self.blocks) - 1:
+            self._advance_checkpoint(len(self.blocks) - 1)
+
         return True
 
+    def get_chain_stats(self) -> Dict:
+        """Get blockchain statistics"""
+        return {
+            "vault_id": self.vault_id,
+            "total_blocks": len(self.blocks),
+            "total_events": self.total_events,
+            "latest_block_number": self.blocks[-1].block_number,
+            "latest_block_hash": self.blocks[-1].calculate_hash()[:16] + "...",
+            "chain_valid": self.verify_chain(),
+            "verified_through": self.checkpoint["block_number"] if self.checkpoint else None,
+            "pending_events": len(self.pending_events),
+        }
 
 WITNESS_EVENT = "WITNESS_EVENT"
 EMP_MINTED = "EMP_MINTED"
@@ -409,20 +565,6 @@ def seal_emp_minted(
         },
     )
 
-    def get_chain_stats(self) -> Dict:
-        """Get blockchain statistics"""
-        total_events = sum(len(block.events) for block in self.blocks)
-
-        return {
-            "vault_id": self.vault_id,
-            "total_blocks": len(self.blocks),
-            "total_events": total_events,
-            "latest_block_number": self.blocks[-1].block_number,
-            "latest_block_hash": self.blocks[-1].calculate_hash()[:16] + "...",
-            "chain_valid": self.verify_chain(),
-            "pending_events": len(self.pending_events),
-        }
-
 
 # Example usage
 def example_vaultnode():
@@ -0,0 +1,376 @@
+"""
+VaultNode Segment Store - Persistent append-only block log
+
+Stores VaultBlocks in append-only segment files with a fixed-width block
+index, so a VaultNode survives restarts without replaying through Supabase.
+
+Layout inside the store directory:
+
+    blocks.idx          one INDEX_ENTRY record per block, in block order
+    segment-000000.log  JSON-encoded blocks, appended back to back
+    segment-000001.log  next segment once max_segment_bytes is reached
+    updates.log         blocks rewritten by update(), indexed like segments
+    checkpoint.json     VaultNode verification checkpoint
+
+Opening a store only stats the index, so startup cost does not depend on
+chain length. Random reads of block n go through mmap of the index and the
+owning segment; at most ``max_open_segments`` segments are mapped at once,
+and the last ``cache_size`` decoded blocks are kept in an LRU cache.
+
+The store behaves like the ``VaultNode.blocks`` list (len, indexing,
+iteration, append) and can be passed straight to ``VaultNode(store=...)``.
+Unlike a list, changes to a block returned by the store are not persisted
+(and are lost once it leaves the cache) until written back with
+``update(block)``.
+"""
+
+import json
+import mmap
+import os
+import struct
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from .vaultnode import VaultBlock
+
+# segment id, payload length, payload offset, cumulative event count, crc32
+INDEX_ENTRY = struct.Struct("<IIQQI")
+INDEX_FILENAME = "blocks.idx"
+SEGMENT_TEMPLATE = "segment-{:06d}.log"
+UPDATES_SEGMENT = 0xFFFFFFFF
+UPDATES_FILENAME = "updates.log"
+CHECKPOINT_FILENAME = "checkpoint.json"
+
+
+class VaultSegmentStore:
+    """
+    VaultSegmentStore - Append-only, memory-mapped VaultBlock log
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        max_open_segments: int = 8,
+        sync: bool = False,
+        cache_size: int = 256,
+    ):
+        """
+        Open (or create) a segment store
+
+        Args:
+            path: Directory holding the index and segment files
+            max_segment_bytes: Roll to a new segment once the active one exceeds this
+            max_open_segments: Maximum number of segments kept memory-mapped
+            sync: fsync segment and index after every append
+            cache_size: Number of decoded blocks kept in the LRU cache
+        """
+        self.path = path
+        self.max_segment_bytes = max_segment_bytes
+        self.max_open_segments = max_open_segments
+        self.sync = sync
+        self.cache_size = cache_size
+
+        os.makedirs(path, exist_ok=True)
+        self._index_path = os.path.join(path, INDEX_FILENAME)
+
+        self._index_map: Optional[mmap.mmap] = None
+        self._segment_maps: "OrderedDict[int, mmap.mmap]" = OrderedDict()
+        self._cache: "OrderedDict[int, VaultBlock]" = OrderedDict()
+
+        # Metrics
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        self._count = 0
+        self._total_events = 0
+        self._active_segment = 0
+        self._active_size = 0
+
+        self._recover()
+
+        self._index_file = open(self._index_path, "ab")
+        self._segment_file = open(self._segment_path(self._active_segment), "ab")
+
+    # ------------------------------------------------------------------
+    # Open / recovery
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, segment: int) -> str:
+        if segment == UPDATES_SEGMENT:
+            return os.path.join(self.path, UPDATES_FILENAME)
+        return os.path.join(self.path, SEGMENT_TEMPLATE.format(segment))
+
+    def _read_entry_from_disk(self, handle, position: int) -> Tuple[int, int, int, int, int]:
+        handle.seek(position * INDEX_ENTRY.size)
+        return INDEX_ENTRY.unpack(handle.read(INDEX_ENTRY.size))
+
+    def _recover(self):
+        """Drop torn writes left behind by a crash and locate the active segment"""
+        if not os.path.exists(self._index_path):
+            open(self._index_path, "wb").close()
+
+        index_size = os.path.getsize(self._index_path)
+        count = index_size // INDEX_ENTRY.size
+
+        with open(self._index_path, "r+b") as handle:
+            # Walk back over entries whose payload never reached disk
+            while count:
+                segment, length, offset, total_events, _ = self._read_entry_from_disk(handle, count - 1)
+                segment_path = self._segment_path(segment)
+                if os.path.exists(segment_path) and os.path.getsize(segment_path) >= offset + length:
+                    break
+                count -= 1
+
+            if index_size != count * INDEX_ENTRY.size:
+                handle.truncate(count * INDEX_ENTRY.size)
+
+            # Entries rewritten by update() point into updates.log; the active
+            # segment ends after the last entry still pointing into a segment
+            tail = count
+            while tail and segment == UPDATES_SEGMENT:
+                tail -= 1
+                segment, length, offset = self._read_entry_from_disk(handle, tail - 1)[:3] if tail else (0, 0, 0)
+
+        self._count = count
+        if count:
+            self._active_segment = segment
+            self._active_size = offset + length
+            self._total_events = total_events
+
+            # Discard any unindexed tail on the active segment
+            segment_path = self._segment_path(segment)
+            if os.path.getsize(segment_path) > self._active_size:
+                with open(segment_path, "r+b") as handle:
+                    handle.truncate(self._active_size)
+        elif os.path.exists(self._segment_path(0)):
+            open(self._segment_path(0), "wb").close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append(self, block: VaultBlock):
+        """Append a block to the log"""
+        if block.block_number != self._count:
+            raise ValueError(f"Expected block #{self._count}, got #{block.block_number}")
+
+        payload = self._encode(block)
+
+        if self._active_size and self._active_size + len(payload) > self.max_segment_bytes:
+            self._segment_file.close()
+            self._active_segment += 1
+            self._active_size = 0
+            # Truncate: any existing file here is an unindexed leftover
+            self._segment_file = open(self._segment_path(self._active_segment), "wb")
+
+        offset = self._active_size
+        self._segment_file.write(payload)
+        self._segment_file.flush()
+
+        self._total_events += len(block.events)
+        entry = INDEX_ENTRY.pack(
+            self._active_segment, len(payload), offset, self._total_events, zlib.crc32(payload)
+        )
+        self._index_file.write(entry)
+        self._index_file.flush()
+
+        if self.sync:
+            os.fsync(self._segment_file.fileno())
+            os.fsync(self._index_file.fileno())
+
+        self._active_size += len(payload)
+        self._count += 1
+        self._cache_block(block)
+
+    @staticmethod
+    def _encode(block: VaultBlock) -> bytes:
+        return json.dumps(block.to_dict(), sort_keys=True, separators=(",", ":"), default=str).encode()
+
+    def update(self, block: VaultBlock):
+        """
+        Write back a changed block
+
+        The new encoding is appended to updates.log and the block's index
+        entry is repointed at it (later entries' cumulative event counts are
+        shifted if the event count changed). The superseded payload stays in
+        its segment as dead space.
+        """
+        number = block.block_number
+        if not 0 <= number < self._count:
+            raise IndexError(f"Block #{number} is not in the store")
+
+        payload = self._encode(block)
+        with open(self._segment_path(UPDATES_SEGMENT), "ab") as handle:
+            offset = handle.tell()
+            handle.write(payload)
+            handle.flush()
+            if self.sync:
+                os.fsync(handle.fileno())
+
+        _, _, _, total_events, _ = self._index_entry(number)
+        previous_total = self._index_entry(number - 1)[3] if number else 0
+        delta = previous_total + len(block.events) - total_events
+
+        self._index_file.flush()
+        with open(self._index_path, "r+b") as handle:
+            handle.seek(number * INDEX_ENTRY.size)
+            handle.write(
+                INDEX_ENTRY.pack(UPDATES_SEGMENT, len(payload), offset, total_events + delta, zlib.crc32(payload))
+            )
+            if delta:
+                for later in range(number + 1, self._count):
+                    entry = list(self._read_entry_from_disk(handle, later))
+                    entry[3] += delta
+                    handle.seek(later * INDEX_ENTRY.size)
+                    handle.write(INDEX_ENTRY.pack(*entry))
+            handle.flush()
+            if self.sync:
+                os.fsync(handle.fileno())
+
+        self._total_events += delta
+        self._cache_block(block)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _index_entry(self, block_number: int) -> Tuple[int, int, int, int, int]:
+        end = (block_number + 1) * INDEX_ENTRY.size
+        if self._index_map is None or len(self._index_map) < end:
+            if self._index_map is not None:
+                self._index_map.close()
+            with open(self._index_path, "rb") as handle:
+                self._index_map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return INDEX_ENTRY.unpack_from(self._index_map, block_number * INDEX_ENTRY.size)
+
+    def _segment_view(self, segment: int, end: int) -> mmap.mmap:
+        view = self._segment_maps.get(segment)
+        if view is not None and len(view) >= end:
+            self._segment_maps.move_to_end(segment)
+            return view
+
+        if view is not None:
+            view.close()
+            del self._segment_maps[segment]
+
+        with open(self._segment_path(segment), "rb") as handle:
+            view = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._segment_maps[segment] = view
+        while len(self._segment_maps) > self.max_open_segments:
+            _, evicted = self._segment_maps.popitem(last=False)
+            evicted.close()
+        return view
+
+    def read_payload(self, block_number: int) -> bytes:
+        """Read the raw encoded block"""
+        segment, length, offset, _, checksum = self._index_entry(block_number)
+        payload = self._segment_view(segment, offset + length)[offset:offset + length]
+        if zlib.crc32(payload) != checksum:
+            raise ValueError(f"Checksum mismatch for block #{block_number}")
+        return payload
+
+    def _cache_block(self, block: VaultBlock):
+        if self.cache_size <= 0:
+            return
+        self._cache[block.block_number] = block
+        self._cache.move_to_end(block.block_number)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def get_block(self, block_number: int) -> Optional[VaultBlock]:
+        """Get block by number (decoded blocks are served from the LRU cache)"""
+        if not 0 <= block_number < self._count:
+            return None
+
+        block = self._cache.get(block_number)
+        if block is not None:
+            self._cache.move_to_end(block_number)
+            self.cache_hits += 1
+            return block
+
+        self.cache_misses += 1
+        block = VaultBlock.from_dict(json.loads(self.read_payload(block_number)))
+        self._cache_block(block)
+        return block
+
+    # ------------------------------------------------------------------
+    # Verification checkpoint
+    # ------------------------------------------------------------------
+
+    def load_checkpoint(self) -> Optional[Dict]:
+        """Last saved VaultNode verification checkpoint, if any"""
+        try:
+            with open(os.path.join(self.path, CHECKPOINT_FILENAME)) as handle:
+                return json.load(handle)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def save_checkpoint(self, checkpoint: Optional[Dict]):
+        """Persist the verification checkpoint atomically"""
+        path = os.path.join(self.path, CHECKPOINT_FILENAME)
+        if checkpoint is None:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+
+        temp_path = path + ".tmp"
+        with open(temp_path, "w") as handle:
+            json.dump(checkpoint, handle)
+            handle.flush()
+            if self.sync:
+                os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+
+    @property
+    def total_events(self) -> int:
+        """Total events across all stored blocks"""
+        return self._total_events
+
+    @property
+    def segment_count(self) -> int:
+        return self._active_segment + 1 if self._count else 0
+
+    # ------------------------------------------------------------------
+    # Sequence protocol (drop-in for VaultNode.blocks)
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[VaultBlock, List[VaultBlock]]:
+        if isinstance(item, slice):
+            return [self.get_block(i) for i in range(*item.indices(self._count))]
+        if item < 0:
+            item += self._count
+        if not 0 <= item < self._count:
+            raise IndexError("block index out of range")
+        return self.get_block(item)
+
+    def __iter__(self) -> Iterator[VaultBlock]:
+        for i in range(self._count):
+            yield self.get_block(i)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def close(self):
+        """Close files and memory maps"""
+        self._cache.clear()
+        for view in self._segment_maps.values():
+            view.close()
+        self._segment_maps.clear()
+        if self._index_map is not None:
+            self._index_map.close()
+            self._index_map = None
+        self._segment_file.close()
+        self._index_file.close()
+
+    def __enter__(self) -> "VaultSegmentStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
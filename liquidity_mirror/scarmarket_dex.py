@@ -10,11 +10,19 @@ principles without requiring full production blockchain deployment.
 """
 
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    from liquidity_mirror import fixed_point
+    from liquidity_mirror.trade_history import Candle, Trade, TradeHistory
+except ModuleNotFoundError:  # pragma: no cover - fallback for standalone execution
+    import fixed_point
+    from trade_history import Candle, Trade, TradeHistory
 
 
 class TokenType(Enum):
@@ -130,12 +138,11 @@ class LiquidityPool:
         Solving for Δy: Δy = y * Δx * (1 - fee) / (x + Δx * (1 - fee))
         """
         if input_is_a:
-            input_reserve = self.reserve_a
-            output_reserve = self.reserve_b
-        else:
-            input_reserve = self.reserve_b
-            output_reserve = self.reserve_a
+            return self.get_amount_out(input_amount, self.reserve_a, self.reserve_b)
+        return self.get_amount_out(input_amount, self.reserve_b, self.reserve_a)
 
+    def get_amount_out(self, input_amount: Decimal, input_reserve: Decimal, output_reserve: Decimal) -> Decimal:
+        """Constant product output for explicit reserves (used for read-only quotes)"""
         # Apply fee
         input_with_fee = input_amount * (Decimal("1") - self.fee_rate)
 
@@ -145,6 +152,19 @@ class LiquidityPool:
 
         return numerator / denominator if denominator > 0 else Decimal("0")
 
+    def apply_swap(self, amount_in: Decimal, amount_out: Decimal, input_is_a: bool):
+        """Move reserves and volume for an executed swap"""
+        if input_is_a:
+            self.reserve_a += amount_in
+            self.reserve_b -= amount_out
+            self.total_volume_a += amount_in
+            self.total_volume_b += amount_out
+        else:
+            self.reserve_b += amount_in
+            self.reserve_a -= amount_out
+            self.total_volume_b += amount_in
+            self.total_volume_a += amount_out
+
     def calculate_slippage(self, input_amount: Decimal, output_amount: Decimal, input_is_a: bool) -> Decimal:
         """Calculate slippage percentage"""
         spot_price = self.get_price_a_in_b() if input_is_a else self.get_price_b_in_a()
@@ -175,45 +195,169 @@ class LiquidityPool:
         }
 
 
+class FixedPointLiquidityPool(LiquidityPool):
+    """
+    AMM pool backed by fixed-point integer math
+
+    Reserves and the fee are held as ints scaled by ``fixed_point.SCALE``
+    (uint256-style) and the constant product, fee and slippage math is exact
+    integer arithmetic. ``reserve_a``, ``reserve_b``, ``fee_rate`` and the
+    volume totals remain Decimal at the API boundary. ScarMarketDEX swaps
+    through ``swap_fx``, which stays in ints from input amount to settled
+    reserves. See ``fixed_point`` for the rounding rule.
+    """
+
+    @property
+    def reserve_a(self) -> Decimal:
+        return fixed_point.from_fixed(self.reserve_a_fx)
+
+    @reserve_a.setter
+    def reserve_a(self, value: Decimal):
+        self.reserve_a_fx = fixed_point.to_fixed(value)
+
+    @property
+    def reserve_b(self) -> Decimal:
+        return fixed_point.from_fixed(self.reserve_b_fx)
+
+    @reserve_b.setter
+    def reserve_b(self, value: Decimal):
+        self.reserve_b_fx = fixed_point.to_fixed(value)
+
+    @property
+    def fee_rate(self) -> Decimal:
+        return fixed_point.from_fixed(self.fee_fx)
+
+    @fee_rate.setter
+    def fee_rate(self, value: Decimal):
+        self.fee_fx = fixed_point.to_fixed(value)
+
+    @property
+    def total_volume_a(self) -> Decimal:
+        return fixed_point.from_fixed(self.total_volume_a_fx)
+
+    @total_volume_a.setter
+    def total_volume_a(self, value: Decimal):
+        self.total_volume_a_fx = fixed_point.to_fixed(value)
+
+    @property
+    def total_volume_b(self) -> Decimal:
+        return fixed_point.from_fixed(self.total_volume_b_fx)
+
+    @total_volume_b.setter
+    def total_volume_b(self, value: Decimal):
+        self.total_volume_b_fx = fixed_point.to_fixed(value)
+
+    def _reserves_fx(self, input_is_a: bool) -> Tuple[int, int]:
+        if input_is_a:
+            return self.reserve_a_fx, self.reserve_b_fx
+        return self.reserve_b_fx, self.reserve_a_fx
+
+    def calculate_output_amount_fx(self, input_amount_fx: int, input_is_a: bool) -> int:
+        """Integer-only constant product output"""
+        reserve_in, reserve_out = self._reserves_fx(input_is_a)
+        return fixed_point.get_amount_out(input_amount_fx, reserve_in, reserve_out, self.fee_fx)
+
+    def calculate_output_amount(self, input_amount: Decimal, input_is_a: bool) -> Decimal:
+        return fixed_point.from_fixed(self.calculate_output_amount_fx(fixed_point.to_fixed(input_amount), input_is_a))
+
+    def get_amount_out(self, input_amount: Decimal, input_reserve: Decimal, output_reserve: Decimal) -> Decimal:
+        return fixed_point.from_fixed(
+            fixed_point.get_amount_out(
+                fixed_point.to_fixed(input_amount),
+                fixed_point.to_fixed(input_reserve),
+                fixed_point.to_fixed(output_reserve),
+                self.fee_fx,
+            )
+        )
+
+    def calculate_slippage(self, input_amount: Decimal, output_amount: Decimal, input_is_a: bool) -> Decimal:
+        reserve_in, reserve_out = self._reserves_fx(input_is_a)
+        return fixed_point.from_fixed(
+            fixed_point.get_slippage(
+                fixed_point.to_fixed(input_amount), fixed_point.to_fixed(output_amount), reserve_in, reserve_out
+            )
+        )
+
+    def apply_swap(self, amount_in: Decimal, amount_out: Decimal, input_is_a: bool):
+        self.apply_swap_fx(fixed_point.to_fixed(amount_in), fixed_point.to_fixed(amount_out), input_is_a)
+
+    def apply_swap_fx(self, amount_in_fx: int, amount_out_fx: int, input_is_a: bool):
+        """Move reserves and volume for an executed swap, amounts scaled by SCALE"""
+        if input_is_a:
+            self.reserve_a_fx += amount_in_fx
+            self.reserve_b_fx -= amount_out_fx
+            self.total_volume_a_fx += amount_in_fx
+            self.total_volume_b_fx += amount_out_fx
+        else:
+            self.reserve_b_fx += amount_in_fx
+            self.reserve_a_fx -= amount_out_fx
+            self.total_volume_b_fx += amount_in_fx
+            self.total_volume_a_fx += amount_out_fx
+
+    def swap_fx(
+        self, amount_in_fx: int, input_is_a: bool, min_amount_out_fx: int, max_slippage_fx: int
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Price, check and settle a swap entirely in fixed point
+
+        Returns:
+            (amount_out_fx, slippage_fx), or None if the minimum output or
+            maximum slippage check rejects the swap (reserves untouched)
+        """
+        reserve_in, reserve_out = self._reserves_fx(input_is_a)
+        amount_out_fx = fixed_point.get_amount_out(amount_in_fx, reserve_in, reserve_out, self.fee_fx)
+        if amount_out_fx < min_amount_out_fx:
+            return None
+
+        slippage_fx = fixed_point.get_slippage(amount_in_fx, amount_out_fx, reserve_in, reserve_out)
+        if slippage_fx > max_slippage_fx:
+            return None
+
+        self.apply_swap_fx(amount_in_fx, amount_out_fx, input_is_a)
+        return amount_out_fx, slippage_fx
+
+
 @dataclass
-class Trade:
-    """DEX trade record"""
+class SwapRequest:
+    """Single entry of a batched swap"""
+
+    trader_address: str
+    token_in_id: str
+    token_out_id: str
+    amount_in: Decimal
+    min_amount_out: Decimal = Decimal("0")
+    max_slippage: Decimal = Decimal("5.0")
 
-    trade_id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
-    pool_id: str = ""
-    trader_address: str = ""
+@dataclass
+class RouteQuote:
+    """Read-only quote for a (possibly multi-hop) swap route"""
 
-    # Trade details
-    token_in_id: str = ""
-    token_out_id: str = ""
+    path: List[str] = field(default_factory=list)  # token ids, input first
+    pool_ids: List[str] = field(default_factory=list)
+    hop_amounts: List[Decimal] = field(default_factory=list)  # amount entering each hop, then final output
     amount_in: Decimal = Decimal("0")
     amount_out: Decimal = Decimal("0")
 
-    # Pricing
-    price: Decimal = Decimal("0")
-    slippage: Decimal = Decimal("0")
-
-    # VaultNode linkage
-    vault_block_id: Optional[str] = None
+    @property
+    def price(self) -> Decimal:
+        return self.amount_out / self.amount_in if self.amount_in > 0 else Decimal("0")
 
     def to_dict(self) -> Dict:
         return {
-            "trade_id": self.trade_id,
-            "timestamp": self.timestamp.isoformat(),
-            "pool_id": self.pool_id,
-            "trader_address": self.trader_address,
-            "token_in_id": self.token_in_id,
-            "token_out_id": self.token_out_id,
+            "path": self.path,
+            "pool_ids": self.pool_ids,
+            "hop_amounts": [str(amount) for amount in self.hop_amounts],
             "amount_in": str(self.amount_in),
             "amount_out": str(self.amount_out),
             "price": str(self.price),
-            "slippage": str(self.slippage),
-            "vault_block_id": self.vault_block_id,
         }
 
 
+def _pair_key(token_a_id: str, token_b_id: str) -> Tuple[str, str]:
+    return (token_a_id, token_b_id) if token_a_id <= token_b_id else (token_b_id, token_a_id)
+
+
 class ScarMarketDEX:
     """
     ScarMarket Decentralized Exchange
@@ -222,20 +366,28 @@ class ScarMarketDEX:
     enabling atomic exchange of SCAR, EMP, and VaultNode assets.
     """
 
-    def __init__(self):
-        """Initialize ScarMarket DEX"""
+    def __init__(self, trade_capacity: int = 10000, trade_spill_path: Optional[str] = None):
+        """
+        Initialize ScarMarket DEX
+
+        Args:
+            trade_capacity: Recent trades kept in memory
+            trade_spill_path: Columnar file receiving older trades (None discards them)
+        """
         # Token registry
         self.tokens: Dict[str, Token] = {}
 
         # Liquidity pools
         self.pools: Dict[str, LiquidityPool] = {}
         self.pool_lookup: Dict[Tuple[str, str], str] = {}  # (token_a, token_b) -> pool_id
+        self.pool_index: Dict[Tuple[str, str], LiquidityPool] = {}  # sorted token pair -> pool
+        self.token_neighbors: Dict[str, Set[str]] = {}  # token -> tokens it has a pool with
 
         # Balances: address -> token_id -> amount
         self.balances: Dict[str, Dict[str, Decimal]] = {}
 
-        # Trade history
-        self.trades: Dict[str, Trade] = {}
+        # Trade history (recent trades in memory, older ones spilled to disk)
+        self.trades = TradeHistory(capacity=trade_capacity, spill_path=trade_spill_path)
 
         # Statistics
         self.total_trades = 0
@@ -295,14 +447,21 @@ class ScarMarketDEX:
         initial_b: Decimal,
         provider_address: str,
         fee_rate: Decimal = Decimal("0.003"),
+        fixed_point_math: bool = False,
     ) -> Optional[LiquidityPool]:
-        """Create new liquidity pool"""
+        """
+        Create new liquidity pool
+
+        Args:
+            fixed_point_math: Back the pool with integer fixed-point math
+                (FixedPointLiquidityPool) instead of Decimal
+        """
         # Validate tokens exist
         if not self.get_token(token_a_id) or not self.get_token(token_b_id):
             return None
 
         # Check if pool already exists
-        pool_key = tuple(sorted([token_a_id, token_b_id]))
+        pool_key = _pair_key(token_a_id, token_b_id)
         if pool_key in self.pool_lookup:
             return None
 
@@ -313,7 +472,8 @@ class ScarMarketDEX:
             return None
 
         # Create pool
-        pool = LiquidityPool(
+        pool_class = FixedPointLiquidityPool if fixed_point_math else LiquidityPool
+        pool = pool_class(
             token_a_id=token_a_id, token_b_id=token_b_id, reserve_a=initial_a, reserve_b=initial_b, fee_rate=fee_rate
         )
 
@@ -328,14 +488,15 @@ class ScarMarketDEX:
         # Register pool
         self.pools[pool.pool_id] = pool
         self.pool_lookup[pool_key] = pool.pool_id
+        self.pool_index[pool_key] = pool
+        self.token_neighbors.setdefault(token_a_id, set()).add(token_b_id)
+        self.token_neighbors.setdefault(token_b_id, set()).add(token_a_id)
 
         return pool
 
     def get_pool(self, token_a_id: str, token_b_id: str) -> Optional[LiquidityPool]:
         """Get liquidity pool for token pair"""
-        pool_key = tuple(sorted([token_a_id, token_b_id]))
-        pool_id = self.pool_lookup.get(pool_key)
-        return self.pools.get(pool_id) if pool_id else None
+        return self.pool_index.get(_pair_key(token_a_id, token_b_id))
 
     def execute_swap(
         self,
@@ -378,41 +539,59 @@ class ScarMarketDEX:
         if not token_in.transferable or not token_out.transferable:
             return None
 
+        return self._apply_swap(
+            pool, trader_address, token_in_id, token_out_id, amount_in, min_amount_out, max_slippage
+        )
+
+    def _apply_swap(
+        self,
+        pool: LiquidityPool,
+        trader_address: str,
+        token_in_id: str,
+        token_out_id: str,
+        amount_in: Decimal,
+        min_amount_out: Decimal,
+        max_slippage: Decimal,
+        record_trade: bool = True,
+    ) -> Optional[Trade]:
+        """Price and settle a swap whose pool, tokens and balance are already validated"""
         # Determine direction
         input_is_a = token_in_id == pool.token_a_id
 
-        # Calculate output amount
-        amount_out = pool.calculate_output_amount(amount_in, input_is_a)
+        if isinstance(pool, FixedPointLiquidityPool):
+            # Integer path: convert at the boundary only
+            settled = pool.swap_fx(
+                fixed_point.to_fixed(amount_in),
+                input_is_a,
+                fixed_point.to_fixed(min_amount_out),
+                fixed_point.to_fixed(max_slippage),
+            )
+            if settled is None:
+                return None
+            amount_out = fixed_point.from_fixed(settled[0])
+            slippage = fixed_point.from_fixed(settled[1])
+        else:
+            # Calculate output amount
+            amount_out = pool.calculate_output_amount(amount_in, input_is_a)
 
-        # Check minimum output
-        if amount_out < min_amount_out:
-            return None
+            # Check minimum output
+            if amount_out < min_amount_out:
+                return None
 
-        # Calculate slippage
-        slippage = pool.calculate_slippage(amount_in, amount_out, input_is_a)
+            # Calculate slippage
+            slippage = pool.calculate_slippage(amount_in, amount_out, input_is_a)
 
-        # Check maximum slippage
-        if slippage > max_slippage:
-            return None
+            # Check maximum slippage
+            if slippage > max_slippage:
+                return None
 
-        # Update pool reserves
-        if input_is_a:
-            pool.reserve_a += amount_in
-            pool.reserve_b -= amount_out
-            pool.total_volume_a += amount_in
-            pool.total_volume_b += amount_out
-        else:
-            pool.reserve_b += amount_in
-            pool.reserve_a -= amount_out
-            pool.total_volume_b += amount_in
-            pool.total_volume_a += amount_out
+            # Update pool reserves
+            pool.apply_swap(amount_in, amount_out, input_is_a)
 
         # Update balances
-        self.balances[trader_address][token_in_id] -= amount_in
-
-        if token_out_id not in self.balances[trader_address]:
-            self.balances[trader_address][token_out_id] = Decimal("0")
-        self.balances[trader_address][token_out_id] += amount_out
+        balances = self.balances[trader_address]
+        balances[token_in_id] -= amount_in
+        balances[token_out_id] = balances.get(token_out_id, Decimal("0")) + amount_out
 
         # Calculate price
         price = amount_out / amount_in if amount_in > 0 else Decimal("0")
@@ -435,10 +614,166 @@ class ScarMarketDEX:
         self.total_trades += 1
 
         # Store trade
-        self.trades[trade.trade_id] = trade
+        if record_trade:
+            self.trades.append(trade, pool.token_a_id)
+        else:
+            self.trades.update_candles(trade, pool.token_a_id)
 
         return trade
 
+    def execute_swap_batch(self, swaps: List[SwapRequest], record_trades: bool = True) -> List[Optional[Trade]]:
+        """
+        Execute an ordered list of swaps
+
+        Pools and token transferability are resolved once per token pair for
+        the whole batch instead of once per swap. Swaps are applied in order,
+        so each one prices against the reserves left by the previous one.
+
+        Args:
+            swaps: Swaps to apply, in order
+            record_trades: Store Trade records in ``self.trades``
+
+        Returns:
+            One Trade (or None if rejected) per swap, in order
+        """
+        pools: Dict[Tuple[str, str], Optional[LiquidityPool]] = {}
+        results: List[Optional[Trade]] = []
+
+        for swap in swaps:
+            pair = (swap.token_in_id, swap.token_out_id)
+            if pair not in pools:
+                pool = self.get_pool(*pair)
+                token_in = self.tokens.get(swap.token_in_id)
+                token_out = self.tokens.get(swap.token_out_id)
+                tradable = bool(token_in and token_out and token_in.transferable and token_out.transferable)
+                pools[pair] = pool if tradable else None
+
+            pool = pools[pair]
+            if pool is None:
+                results.append(None)
+                continue
+
+            trader_balances = self.balances.get(swap.trader_address)
+            if not trader_balances or trader_balances.get(swap.token_in_id, Decimal("0")) < swap.amount_in:
+                results.append(None)
+                continue
+
+            results.append(
+                self._apply_swap(
+                    pool,
+                    swap.trader_address,
+                    swap.token_in_id,
+                    swap.token_out_id,
+                    swap.amount_in,
+                    swap.min_amount_out,
+                    swap.max_slippage,
+                    record_trade=record_trades,
+                )
+            )
+
+        return results
+
+    def quote_route(self, path: List[str], amount_in: Decimal) -> Optional[RouteQuote]:
+        """
+        Quote a swap along a token path without touching reserves
+
+        Args:
+            path: Token ids from input to output, e.g. [SCAR, VAULT, EMP]
+            amount_in: Input amount of ``path[0]``
+
+        Returns:
+            RouteQuote, or None if a hop has no pool or a token is not transferable
+        """
+        if len(path) < 2:
+            return None
+
+        quote = RouteQuote(path=list(path), amount_in=amount_in)
+        # Virtual reserves, so a route that revisits a pool prices against its own earlier hops
+        reserves: Dict[str, Tuple[Decimal, Decimal]] = {}
+        amount = amount_in
+
+        for token_in_id, token_out_id in zip(path, path[1:]):
+            pool = self.get_pool(token_in_id, token_out_id)
+            token_in = self.tokens.get(token_in_id)
+            token_out = self.tokens.get(token_out_id)
+            if pool is None or not token_in or not token_out:
+                return None
+            if not token_in.transferable or not token_out.transferable:
+                return None
+
+            reserve_a, reserve_b = reserves.get(pool.pool_id, (pool.reserve_a, pool.reserve_b))
+            input_is_a = token_in_id == pool.token_a_id
+
+            quote.pool_ids.append(pool.pool_id)
+            quote.hop_amounts.append(amount)
+
+            if input_is_a:
+                amount_out = pool.get_amount_out(amount, reserve_a, reserve_b)
+                reserves[pool.pool_id] = (reserve_a + amount, reserve_b - amount_out)
+            else:
+                amount_out = pool.get_amount_out(amount, reserve_b, reserve_a)
+                reserves[pool.pool_id] = (reserve_a - amount_out, reserve_b + amount)
+            amount = amount_out
+
+        quote.hop_amounts.append(amount)
+        quote.amount_out = amount
+        return quote
+
+    def find_best_route(
+        self, token_in_id: str, token_out_id: str, amount_in: Decimal, max_hops: int = 3
+    ) -> Optional[RouteQuote]:
+        """
+        Find the route with the highest output using the token-pair pool index
+
+        Enumerates simple paths of up to ``max_hops`` pools and quotes each
+        one read-only.
+        """
+        best: Optional[RouteQuote] = None
+        frontier = deque([[token_in_id]])
+
+        while frontier:
+            path = frontier.popleft()
+            for neighbor in self.token_neighbors.get(path[-1], ()):
+                if neighbor in path:
+                    continue
+                candidate = path + [neighbor]
+                if neighbor == token_out_id:
+                    quote = self.quote_route(candidate, amount_in)
+                    if quote and (best is None or quote.amount_out > best.amount_out):
+                        best = quote
+                elif len(candidate) <= max_hops:
+                    frontier.append(candidate)
+
+        return best
+
+    def get_trades(
+        self,
+        pool_id: Optional[str] = None,
+        trader_address: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[Trade]:
+        """Query trade history across memory and spill, oldest first"""
+        return self.trades.query(pool_id=pool_id, trader_address=trader_address, start=start, end=end, limit=limit)
+
+    def get_ohlcv(self, token_a_id: str, token_b_id: str, limit: Optional[int] = None) -> List[Candle]:
+        """Get OHLCV candles for a pool, priced as the pool's token B per token A"""
+        pool = self.get_pool(token_a_id, token_b_id)
+        if not pool:
+            return []
+        return self.trades.get_candles(pool.pool_id, limit)
+
+    def close(self):
+        """Persist in-memory trade history (partial spill chunk and recent trades)"""
+        self.trades.close()
+
+    def __enter__(self) -> "ScarMarketDEX":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def get_market_stats(self) -> Dict:
         """Get DEX market statistics"""
         return {
@@ -447,6 +782,7 @@ class ScarMarketDEX:
             "total_trades": self.total_trades,
             "total_volume_usd": str(self.total_volume_usd),
             "total_liquidity_providers": sum(len(pool.liquidity_providers) for pool in self.pools.values()),
+            "trade_history": self.trades.get_stats(),
         }
 
 
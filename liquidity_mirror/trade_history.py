@@ -0,0 +1,539 @@
+"""
+Trade History - Bounded in-memory ring with columnar on-disk spill
+
+Keeps the most recent ``capacity`` trades in memory. Older trades are
+evicted into a spill buffer and written to an append-only columnar file
+in chunks of ``spill_chunk_size`` rows, so process memory stays flat no
+matter how long the market runs.
+
+Spill file layout, one record per chunk:
+
+    CHUNK_HEADER   rows, payload bytes, min/max timestamp (µs), crc32
+    payload        for each column in COLUMNS: u32 length + zlib block
+
+Timestamps are stored as an int64 microsecond array; every other column
+is NUL-joined UTF-8, so ``append`` rejects IDs containing NUL. Queries only decompress the columns they filter on
+until a chunk is known to contain matches, and chunks outside the
+requested time range are skipped from the header alone.
+
+Per-pool OHLCV candles are maintained incrementally as trades arrive
+and are independent of which tier a trade currently lives in.
+
+``close()`` writes the partial spill chunk and the in-memory ring to the
+spill file, so a restarted process sees every trade. Histories with a
+spill file that are still open at interpreter exit are closed by one
+module-level ``atexit`` hook; the hook only holds weak references, so a
+history that is dropped without ``close()`` is collected (and loses its
+unspilled trades) rather than kept alive for the life of the process.
+"""
+
+import atexit
+import os
+import struct
+import uuid
+import weakref
+import zlib
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+# rows, payload length, min timestamp, max timestamp, crc32
+CHUNK_HEADER = struct.Struct("<IIqqI")
+COLUMN_LENGTH = struct.Struct("<I")
+
+STRING_COLUMNS = (
+    "trade_id",
+    "pool_id",
+    "trader_address",
+    "token_in_id",
+    "token_out_id",
+    "amount_in",
+    "amount_out",
+    "price",
+    "slippage",
+    "vault_block_id",
+)
+DECIMAL_COLUMNS = ("amount_in", "amount_out", "price", "slippage")
+# Free-form string columns; NUL is the spill separator so it may not appear in them
+ID_COLUMNS = tuple(name for name in STRING_COLUMNS if name not in DECIMAL_COLUMNS)
+COLUMNS = ("timestamp",) + STRING_COLUMNS
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Spilling histories not yet closed; closed at interpreter exit
+_open_histories: "weakref.WeakSet[TradeHistory]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_histories():
+    for history in list(_open_histories):
+        history.close()
+
+
+@dataclass
+class Trade:
+    """DEX trade record"""
+
+    trade_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    pool_id: str = ""
+    trader_address: str = ""
+
+    # Trade details
+    token_in_id: str = ""
+    token_out_id: str = ""
+    amount_in: Decimal = Decimal("0")
+    amount_out: Decimal = Decimal("0")
+
+    # Pricing
+    price: Decimal = Decimal("0")
+    slippage: Decimal = Decimal("0")
+
+    # VaultNode linkage
+    vault_block_id: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "trade_id": self.trade_id,
+            "timestamp": self.timestamp.isoformat(),
+            "pool_id": self.pool_id,
+            "trader_address": self.trader_address,
+            "token_in_id": self.token_in_id,
+            "token_out_id": self.token_out_id,
+            "amount_in": str(self.amount_in),
+            "amount_out": str(self.amount_out),
+            "price": str(self.price),
+            "slippage": str(self.slippage),
+            "vault_block_id": self.vault_block_id,
+        }
+
+
+@dataclass
+class Candle:
+    """OHLCV bucket for one pool, priced as token B per token A"""
+
+    bucket_start: datetime
+    open: Decimal
+    high: Decimal
+    low: Decimal
+    close: Decimal
+    volume_a: Decimal = Decimal("0")
+    volume_b: Decimal = Decimal("0")
+    trades: int = 0
+
+    def update(self, price: Decimal, volume_a: Decimal, volume_b: Decimal):
+        if price > self.high:
+            self.high = price
+        if price < self.low:
+            self.low = price
+        self.close = price
+        self.volume_a += volume_a
+        self.volume_b += volume_b
+        self.trades += 1
+
+    def to_dict(self) -> Dict:
+        return {
+            "bucket_start": self.bucket_start.isoformat(),
+            "open": str(self.open),
+            "high": str(self.high),
+            "low": str(self.low),
+            "close": str(self.close),
+            "volume_a": str(self.volume_a),
+            "volume_b": str(self.volume_b),
+            "trades": self.trades,
+        }
+
+
+def _to_micros(timestamp: datetime) -> int:
+    delta = timestamp - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _from_micros(micros: int) -> datetime:
+    return datetime.fromtimestamp(micros // 1_000_000, timezone.utc).replace(microsecond=micros % 1_000_000)
+
+
+class TradeHistory:
+    """
+    TradeHistory - Ring buffer of recent trades with columnar spill and OHLCV
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        spill_path: Optional[str] = None,
+        spill_chunk_size: int = 1024,
+        candle_seconds: int = 60,
+        max_candles: int = 1440,
+    ):
+        """
+        Initialize history
+
+        Args:
+            capacity: Trades kept in memory
+            spill_path: Columnar file receiving evicted trades (None discards them)
+            spill_chunk_size: Evicted trades buffered per written chunk
+            candle_seconds: OHLCV bucket width
+            max_candles: Closed candles kept per pool
+        """
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.spill_chunk_size = spill_chunk_size
+        self.candle_seconds = candle_seconds
+        self.max_candles = max_candles
+
+        self._ring: Deque[Trade] = deque()
+        self._by_id: Dict[str, Trade] = {}
+        self._spill_buffer: List[Trade] = []
+
+        # (offset, rows, min timestamp µs, max timestamp µs)
+        self._chunks: List[Tuple[int, int, int, int]] = []
+        self._spill_size = 0
+
+        self.candles: Dict[str, Deque[Candle]] = {}
+
+        self.total_recorded = 0
+        self.spilled_count = 0
+        self.discarded_count = 0
+
+        if spill_path:
+            self._recover()
+            _open_histories.add(self)
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def append(self, trade: Trade, base_token_id: str):
+        """
+        Record a trade
+
+        Args:
+            trade: Trade to store
+            base_token_id: Token A of the trade's pool (candles are priced in B per A)
+
+        Raises:
+            ValueError: If an ID column contains NUL, which would corrupt the spill file
+        """
+        for name in ID_COLUMNS:
+            value = getattr(trade, name)
+            if value and "\0" in value:
+                raise ValueError(f"Trade {name} may not contain NUL characters")
+
+        self._ring.append(trade)
+        self._by_id[trade.trade_id] = trade
+        self.total_recorded += 1
+
+        if len(self._ring) > self.capacity:
+            evicted = self._ring.popleft()
+            del self._by_id[evicted.trade_id]
+            if self.spill_path:
+                self._spill_buffer.append(evicted)
+                if len(self._spill_buffer) >= self.spill_chunk_size:
+                    self.flush()
+            else:
+                self.discarded_count += 1
+
+        self.update_candles(trade, base_token_id)
+
+    def update_candles(self, trade: Trade, base_token_id: str):
+        """Fold a trade into its pool's current OHLCV candle"""
+        if trade.amount_in <= 0 or trade.amount_out <= 0:
+            return
+
+        if trade.token_in_id == base_token_id:
+            volume_a, volume_b = trade.amount_in, trade.amount_out
+        else:
+            volume_a, volume_b = trade.amount_out, trade.amount_in
+        price = volume_b / volume_a
+
+        bucket = _to_micros(trade.timestamp) // (self.candle_seconds * 1_000_000) * self.candle_seconds
+        series = self.candles.get(trade.pool_id)
+        if series is None:
+            # One extra slot for the open candle
+            series = self.candles[trade.pool_id] = deque(maxlen=self.max_candles + 1)
+
+        current = series[-1] if series else None
+        if current is not None and _to_micros(current.bucket_start) // 1_000_000 >= bucket:
+            current.update(price, volume_a, volume_b)
+            return
+
+        series.append(
+            Candle(
+                bucket_start=_from_micros(bucket * 1_000_000),
+                open=price,
+                high=price,
+                low=price,
+                close=price,
+                volume_a=volume_a,
+                volume_b=volume_b,
+                trades=1,
+            )
+        )
+
+    def get_candles(self, pool_id: str, limit: Optional[int] = None) -> List[Candle]:
+        """Get OHLCV candles for a pool, oldest first (the last one may still be open)"""
+        series = list(self.candles.get(pool_id, ()))
+        return series[-limit:] if limit else series
+
+    # ------------------------------------------------------------------
+    # Spill file
+    # ------------------------------------------------------------------
+
+    def _recover(self):
+        """Index existing chunks and drop a torn tail left by a crash"""
+        if not os.path.exists(self.spill_path):
+            open(self.spill_path, "wb").close()
+            return
+
+        size = os.path.getsize(self.spill_path)
+        offset = 0
+        with open(self.spill_path, "rb") as handle:
+            while offset + CHUNK_HEADER.size <= size:
+                handle.seek(offset)
+                rows, length, min_ts, max_ts, _ = CHUNK_HEADER.unpack(handle.read(CHUNK_HEADER.size))
+                if offset + CHUNK_HEADER.size + length > size:
+                    break
+                self._chunks.append((offset, rows, min_ts, max_ts))
+                self.spilled_count += rows
+                offset += CHUNK_HEADER.size + length
+
+        if offset != size:
+            with open(self.spill_path, "r+b") as handle:
+                handle.truncate(offset)
+        self._spill_size = offset
+
+    def flush(self):
+        """Write buffered evicted trades to the spill file as one chunk"""
+        if not self._spill_buffer:
+            return
+
+        trades = self._spill_buffer
+        self._spill_buffer = []
+
+        timestamps = array("q", (_to_micros(t.timestamp) for t in trades))
+        blocks = [zlib.compress(timestamps.tobytes())]
+        for name in STRING_COLUMNS:
+            values = ("" if getattr(t, name) is None else str(getattr(t, name)) for t in trades)
+            blocks.append(zlib.compress("\0".join(values).encode()))
+
+        payload = b"".join(COLUMN_LENGTH.pack(len(block)) + block for block in blocks)
+        header = CHUNK_HEADER.pack(len(trades), len(payload), min(timestamps), max(timestamps), zlib.crc32(payload))
+
+        with open(self.spill_path, "ab") as handle:
+            handle.write(header + payload)
+
+        self._chunks.append((self._spill_size, len(trades), min(timestamps), max(timestamps)))
+        self._spill_size += len(header) + len(payload)
+        self.spilled_count += len(trades)
+
+    def close(self, spill_recent: bool = True):
+        """
+        Persist trades that only live in memory
+
+        Args:
+            spill_recent: Also move the in-memory ring to the spill file (not
+                just the partial chunk of evicted trades), so the history
+                has no gap after a restart
+        """
+        if not self.spill_path:
+            return
+
+        if spill_recent and self._ring:
+            self._spill_buffer.extend(self._ring)
+            self._ring.clear()
+            self._by_id.clear()
+        self.flush()
+        _open_histories.discard(self)
+
+    def _read_chunk(self, offset: int) -> Dict[str, bytes]:
+        with open(self.spill_path, "rb") as handle:
+            handle.seek(offset)
+            rows, length, _, _, checksum = CHUNK_HEADER.unpack(handle.read(CHUNK_HEADER.size))
+            payload = handle.read(length)
+
+        if zlib.crc32(payload) != checksum:
+            raise ValueError(f"Checksum mismatch for trade chunk at offset {offset}")
+
+        blocks = {}
+        position = 0
+        for name in COLUMNS:
+            (size,) = COLUMN_LENGTH.unpack_from(payload, position)
+            position += COLUMN_LENGTH.size
+            blocks[name] = payload[position:position + size]
+            position += size
+        return blocks
+
+    @staticmethod
+    def _decode_column(blocks: Dict[str, bytes], name: str) -> List:
+        raw = zlib.decompress(blocks[name])
+        if name == "timestamp":
+            values = array("q")
+            values.frombytes(raw)
+            return list(values)
+        return raw.decode().split("\0")
+
+    def _iter_chunk(
+        self,
+        offset: int,
+        pool_id: Optional[str],
+        trader_address: Optional[str],
+        start_us: Optional[int],
+        end_us: Optional[int],
+    ) -> List[Trade]:
+        blocks = self._read_chunk(offset)
+        decoded: Dict[str, List] = {}
+
+        # Narrow rows with the filter columns before decoding the rest
+        rows = None
+        for name, wanted in (("pool_id", pool_id), ("trader_address", trader_address)):
+            if wanted is None:
+                continue
+            decoded[name] = self._decode_column(blocks, name)
+            candidates = range(len(decoded[name])) if rows is None else rows
+            rows = [i for i in candidates if decoded[name][i] == wanted]
+            if not rows:
+                return []
+
+        decoded["timestamp"] = self._decode_column(blocks, "timestamp")
+        if rows is None:
+            rows = range(len(decoded["timestamp"]))
+        if start_us is not None or end_us is not None:
+            timestamps = decoded["timestamp"]
+            rows = [
+                i
+                for i in rows
+                if (start_us is None or timestamps[i] >= start_us) and (end_us is None or timestamps[i] < end_us)
+            ]
+            if not rows:
+                return []
+
+        for name in STRING_COLUMNS:
+            if name not in decoded:
+                decoded[name] = self._decode_column(blocks, name)
+
+        trades = []
+        for i in rows:
+            trades.append(
+                Trade(
+                    trade_id=decoded["trade_id"][i],
+                    timestamp=_from_micros(decoded["timestamp"][i]),
+                    pool_id=decoded["pool_id"][i],
+                    trader_address=decoded["trader_address"][i],
+                    token_in_id=decoded["token_in_id"][i],
+                    token_out_id=decoded["token_out_id"][i],
+                    amount_in=Decimal(decoded["amount_in"][i]),
+                    amount_out=Decimal(decoded["amount_out"][i]),
+                    price=Decimal(decoded["price"][i]),
+                    slippage=Decimal(decoded["slippage"][i]),
+                    vault_block_id=decoded["vault_block_id"][i] or None,
+                )
+            )
+        return trades
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        pool_id: Optional[str] = None,
+        trader_address: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[Trade]:
+        """
+        Query trades across the in-memory and spilled tiers
+
+        Args:
+            pool_id: Only trades in this pool
+            trader_address: Only trades by this trader
+            start: Inclusive lower timestamp bound
+            end: Exclusive upper timestamp bound
+            limit: Return only the most recent ``limit`` matches
+
+        Returns:
+            Matching trades, oldest first
+        """
+
+        def matches(trade: Trade) -> bool:
+            return (
+                (pool_id is None or trade.pool_id == pool_id)
+                and (trader_address is None or trade.trader_address == trader_address)
+                and (start is None or trade.timestamp >= start)
+                and (end is None or trade.timestamp < end)
+            )
+
+        # Walk newest to oldest so a limit can stop early
+        found: List[Trade] = []
+        for tier in (self._ring, self._spill_buffer):
+            for trade in reversed(tier):
+                if limit and len(found) >= limit:
+                    return found[::-1]
+                if matches(trade):
+                    found.append(trade)
+
+        start_us = _to_micros(start) if start is not None else None
+        end_us = _to_micros(end) if end is not None else None
+        for offset, _, min_ts, max_ts in reversed(self._chunks):
+            if limit and len(found) >= limit:
+                break
+            if (start_us is not None and max_ts < start_us) or (end_us is not None and min_ts >= end_us):
+                continue
+            chunk = self._iter_chunk(offset, pool_id, trader_address, start_us, end_us)
+            found.extend(reversed(chunk))
+
+        found = found[:limit] if limit else found
+        return found[::-1]
+
+    def get(self, trade_id: str, search_spill: bool = False) -> Optional[Trade]:
+        """Get a trade by id; spilled trades are only searched when asked"""
+        trade = self._by_id.get(trade_id)
+        if trade is not None or not search_spill:
+            return trade
+
+        for trade in self._spill_buffer:
+            if trade.trade_id == trade_id:
+                return trade
+        for offset, _, _, _ in reversed(self._chunks):
+            blocks = self._read_chunk(offset)
+            if trade_id in self._decode_column(blocks, "trade_id"):
+                return next(t for t in self._iter_chunk(offset, None, None, None, None) if t.trade_id == trade_id)
+        return None
+
+    def get_stats(self) -> Dict:
+        """Get tier sizes and counters"""
+        return {
+            "in_memory": len(self._ring),
+            "capacity": self.capacity,
+            "pending_spill": len(self._spill_buffer),
+            "spilled": self.spilled_count,
+            "spill_chunks": len(self._chunks),
+            "spill_bytes": self._spill_size,
+            "discarded": self.discarded_count,
+            "total_recorded": self.total_recorded,
+        }
+
+    # ------------------------------------------------------------------
+    # Mapping-style access to the in-memory tier
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    def __contains__(self, trade_id: object) -> bool:
+        return trade_id in self._by_id
+
+    def __getitem__(self, trade_id: str) -> Trade:
+        return self._by_id[trade_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return (trade.trade_id for trade in self._ring)
+
+    def values(self) -> List[Trade]:
+        return list(self._ring)
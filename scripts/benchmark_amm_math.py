@@ -0,0 +1,81 @@
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from liquidity_mirror import fixed_point
+from liquidity_mirror.scarmarket_dex import FixedPointLiquidityPool, LiquidityPool, ScarMarketDEX, TokenType
+
+
+def _time(label, func, iterations):
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<28} {elapsed * 1000:9.2f} ms  ({iterations / elapsed:,.0f} swaps/s)")
+    return elapsed
+
+
+def benchmark_amm_math(iterations: int = 100000):
+    print(f"🔹 [BENCHMARK] Constant product output, {iterations:,} quotes")
+
+    rng = random.Random(7)
+    amounts = [Decimal(rng.randint(1, 10**6)) / 1000 for _ in range(iterations)]
+    amounts_fx = [fixed_point.to_fixed(a) for a in amounts]
+
+    decimal_pool = LiquidityPool(
+        token_a_id="a", token_b_id="b", reserve_a=Decimal("1000000"), reserve_b=Decimal("5000")
+    )
+    fixed_pool = FixedPointLiquidityPool(
+        token_a_id="a", token_b_id="b", reserve_a=Decimal("1000000"), reserve_b=Decimal("5000")
+    )
+
+    decimal_time = _time(
+        "Decimal", lambda: [decimal_pool.calculate_output_amount(a, True) for a in amounts], iterations
+    )
+    _time(
+        "Fixed point (Decimal I/O)", lambda: [fixed_pool.calculate_output_amount(a, True) for a in amounts], iterations
+    )
+    fixed_time = _time(
+        "Fixed point (int I/O)",
+        lambda: [fixed_pool.calculate_output_amount_fx(a, True) for a in amounts_fx],
+        iterations,
+    )
+
+    worst = max(
+        abs(decimal_pool.calculate_output_amount(a, True) - fixed_pool.calculate_output_amount(a, True))
+        for a in amounts[:1000]
+    )
+    print(f"  Speedup (int I/O): {decimal_time / fixed_time:.1f}x, max deviation on sample: {worst}")
+
+
+def benchmark_dex_swaps(iterations: int = 50000):
+    print(f"🔹 [BENCHMARK] ScarMarketDEX.execute_swap, {iterations:,} swaps")
+
+    for label, fixed_point_math in (("Decimal pool", False), ("Fixed-point pool", True)):
+        dex = ScarMarketDEX(trade_capacity=1000)
+        scar = dex.register_token("SCAR", "ScarCoin", TokenType.FUNGIBLE).token_id
+        vault = dex.register_token("VAULT", "VaultNode Asset", TokenType.FUNGIBLE).token_id
+        for address in ("alice", "bob"):
+            dex.mint_tokens(scar, address, Decimal(10**9))
+            dex.mint_tokens(vault, address, Decimal(10**9))
+        dex.create_liquidity_pool(
+            scar, vault, Decimal(10**7), Decimal(5 * 10**6), "alice", fixed_point_math=fixed_point_math
+        )
+
+        def swaps():
+            for i in range(iterations):
+                if i % 2:
+                    dex.execute_swap("bob", scar, vault, Decimal("1.5"))
+                else:
+                    dex.execute_swap("bob", vault, scar, Decimal("0.75"))
+
+        _time(label, swaps, iterations)
+
+
+if __name__ == "__main__":
+    benchmark_amm_math()
+    benchmark_dex_swaps()
@@ -0,0 +1,80 @@
+import os
+import random
+import sys
+import time
+import uuid
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.glyphic_binding_engine import BindingStrength, GlyphicBindingEngine, GlyphType
+
+GLYPH_COUNTS = (10_000, 100_000)
+BINDINGS_PER_GLYPH = 8
+CHURN_ROUNDS = 20
+
+
+def _set_bytes_per_binding(bindings: int) -> float:
+    """Approximate cost of the old per-glyph set/dict representation"""
+    bound_to = {str(uuid.uuid4()) for _ in range(bindings)}
+    strengths = dict.fromkeys(bound_to, BindingStrength.WEAK)
+    keys = sum(sys.getsizeof(key) for key in bound_to)
+    # Each binding is stored on both glyphs
+    return 2 * (sys.getsizeof(bound_to) + sys.getsizeof(strengths) + keys) / bindings
+
+
+def benchmark_glyph_bindings():
+    print("🔹 [BENCHMARK] Glyph binding adjacency")
+    rng = random.Random(11)
+
+    for count in GLYPH_COUNTS:
+        engine = GlyphicBindingEngine(max_glyphs=count * 2)
+        ids = [engine.create_glyph(GlyphType.CONCEPT, f"G{i}", {}).id for i in range(count)]
+        for _ in range(count * BINDINGS_PER_GLYPH // 2):
+            engine.bind_glyphs(rng.choice(ids), rng.choice(ids), BindingStrength.MODERATE)
+
+        started = time.perf_counter()
+        bindings = engine.bindings.num_bindings
+        merge = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for i in range(100):
+            engine.create_sigil(f"S{i}", rng.sample(ids, 500))
+        sigil_rate = 100 / (time.perf_counter() - started)
+
+        print(
+            f"  {count:>9,} glyphs  {bindings:>9,} bindings  merge {merge * 1000:>7.1f} ms  "
+            f"{engine.bindings.nbytes / bindings:>5.1f} B/binding "
+            f"(sets ~{_set_bytes_per_binding(BINDINGS_PER_GLYPH):.0f})  "
+            f"sigils(500) {sigil_rate:>8,.0f}/s"
+        )
+
+
+def benchmark_glyph_churn():
+    print("🔹 [BENCHMARK] Glyph binding merge under store churn")
+
+    for count in GLYPH_COUNTS[:1]:
+        # Push CHURN_ROUNDS full stores through a capped engine; evicted slots are recycled
+        engine = GlyphicBindingEngine(max_glyphs=count)
+        recent = []
+        for i in range(count * CHURN_ROUNDS):
+            recent.append(engine.create_glyph(GlyphType.CONCEPT, f"G{i}", {}).id)
+            if len(recent) == BINDINGS_PER_GLYPH:
+                for glyph_id in recent[1:]:
+                    engine.bind_glyphs(recent[0], glyph_id, BindingStrength.MODERATE)
+                recent.clear()
+
+        started = time.perf_counter()
+        for _ in range(100):
+            engine.bindings.compact()
+        merge = (time.perf_counter() - started) / 100
+
+        print(
+            f"  {count:>9,} live glyphs  {count * CHURN_ROUNDS:>9,} created  "
+            f"{engine.registry.num_slots:>9,} slots  merge {merge * 1000:>7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_glyph_bindings()
+    benchmark_glyph_churn()
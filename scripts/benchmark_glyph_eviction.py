@@ -0,0 +1,41 @@
+import os
+import random
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.glyphic_binding_engine import GlyphicBindingEngine, GlyphType
+
+STORE_SIZES = (10_000, 100_000, 1_000_000)
+
+
+def benchmark_glyph_eviction():
+    print("🔹 [BENCHMARK] Glyph store eviction")
+    rng = random.Random(5)
+
+    for size in STORE_SIZES:
+        engine = GlyphicBindingEngine(max_glyphs=size)
+        for i in range(size):
+            engine.create_glyph(GlyphType.CONCEPT, f"G{i}", {})
+        glyph_ids = list(engine.glyphs)
+
+        started = time.perf_counter()
+        for glyph_id in rng.sample(glyph_ids, size // 2):
+            engine.glyphs[glyph_id].access(rng.randint(1, 10))
+        access_rate = (size // 2) / (time.perf_counter() - started)
+
+        # Store is full: the next glyph triggers a 10% eviction round
+        engine.create_glyph(GlyphType.CONCEPT, "overflow", {})
+        metrics = engine.get_eviction_metrics()
+
+        print(
+            f"  {size:>9,} glyphs  access {access_rate:>12,.0f}/s  "
+            f"evicted {metrics['glyphs_evicted']:>7,} in {metrics['last_eviction_ms']:>8.1f} ms  "
+            f"heap {metrics['heap_size']:>9,}"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_glyph_eviction()
@@ -0,0 +1,52 @@
+import os
+import random
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.glyphic_binding_engine import GlyphicBindingEngine, GlyphType
+
+STREAM_SIZES = (10_000, 100_000, 1_000_000)
+GLYPH_POOL = 10_000
+
+
+def _engine(workers: int) -> GlyphicBindingEngine:
+    engine = GlyphicBindingEngine(max_threads=8, max_glyphs=GLYPH_POOL * 2, workers=workers)
+    for i in range(7):
+        engine.create_thread(f"Worker Thread {i + 1}")
+    for i in range(GLYPH_POOL):
+        engine.create_glyph(GlyphType.CONCEPT, f"G{i}", {"index": i}, source="benchmark")
+    return engine
+
+
+def benchmark_glyph_streams():
+    print("🔹 [BENCHMARK] SigilThread glyph stream throughput")
+    rng = random.Random(3)
+
+    for workers in (1, 4):
+        engine = _engine(workers=workers)
+        glyph_ids = list(engine.glyphs)
+        for size in STREAM_SIZES:
+            stream = [rng.choice(glyph_ids) for _ in range(size)]
+
+            started = time.perf_counter()
+            engine.process_glyph_stream(stream)
+            single = time.perf_counter() - started
+
+            # Same glyph count split over 8 SigilThreads
+            chunks = [stream[i::8] for i in range(8)]
+            started = time.perf_counter()
+            engine.process_glyph_streams(chunks)
+            fan_out = time.perf_counter() - started
+
+            print(
+                f"  workers={workers}  {size:>9,} glyphs  single stream {size / single:>12,.0f} glyphs/s  "
+                f"8 threads {size / fan_out:>12,.0f} glyphs/s"
+            )
+        engine.shutdown()
+
+
+if __name__ == "__main__":
+    benchmark_glyph_streams()
@@ -0,0 +1,42 @@
+import asyncio
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.paradox_network import ParadoxNetwork
+
+SCENARIOS = ((10, 1_000), (1_000, 10_000), (5_000, 20_000))
+
+
+def _network(agents: int, operations: int) -> ParadoxNetwork:
+    network = ParadoxNetwork(max_agents=agents + 3, seed=42)
+    for i in range(agents):
+        network.add_agent(f"Agent {i}", intensity=(i % 10) / 10, creativity=(i % 5) / 5)
+
+    agent_ids = list(network.agents)
+    for i in range(operations):
+        asyncio.run(network.propose_operation(agent_ids[i % len(agent_ids)], "gbe", 0.3 + (i % 7) / 10, 1.2))
+    return network
+
+
+def benchmark_paradox_voting():
+    print("🔹 [BENCHMARK] ParadoxNetwork batched voting")
+    for agents, operations in SCENARIOS:
+        network = _network(agents, operations)
+
+        started = time.perf_counter()
+        results = asyncio.run(network.process_pending_operations(0.5, 1.3))
+        elapsed = time.perf_counter() - started
+
+        approved = sum(result["approved"] for result in results)
+        print(
+            f"  {agents:>5,} agents  {operations:>7,} operations  {elapsed * 1000:>8.1f} ms/tick  "
+            f"{agents * operations / elapsed:>14,.0f} votes/s  approved {approved:,}"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_paradox_voting()
@@ -0,0 +1,51 @@
+import asyncio
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.config import SupabaseSettings
+from core.supabase_integration import SupabaseClient
+from core.supabase_local import LocalSupabaseClient
+
+ROWS = 5_000
+LATENCY = 0.005  # Simulated round trip per request
+SETTINGS = SupabaseSettings(url="https://example.supabase.co", service_role_key="local-benchmark")
+
+
+def _events(count):
+    return [{"source": "benchmark", "content": {"commit_id": f"c{i}"}, "ache_level": 0.5} for i in range(count)]
+
+
+async def _single_rows(supabase, events):
+    for event in events:
+        await supabase.insert_ache_event(**event)
+
+
+def benchmark_supabase_bulk():
+    print("🔹 [BENCHMARK] SupabaseClient bulk writes (local stand-in, 5 ms round trip)")
+
+    single_rows = ROWS // 10
+    supabase = SupabaseClient(client=LocalSupabaseClient(latency=LATENCY), settings=SETTINGS)
+    started = time.perf_counter()
+    asyncio.run(_single_rows(supabase, _events(single_rows)))
+    print(f"  single-row inserts             {single_rows / (time.perf_counter() - started):>12,.0f} rows/s")
+
+    for chunk_size, concurrency in ((100, 1), (500, 1), (500, 4), (1000, 8)):
+        supabase = SupabaseClient(
+            client=LocalSupabaseClient(latency=LATENCY),
+            settings=SETTINGS,
+            bulk_chunk_size=chunk_size,
+            bulk_concurrency=concurrency,
+        )
+        result = asyncio.run(supabase.insert_ache_events(_events(ROWS)))
+        print(
+            f"  bulk chunk={chunk_size:<5} concurrency={concurrency:<2} {result.rows_per_second:>12,.0f} rows/s  "
+            f"({result.chunks} requests)"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_supabase_bulk()
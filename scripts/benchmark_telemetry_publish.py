@@ -0,0 +1,86 @@
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from spiralos.core.external.coercion import coerce_utc_timestamp
+from spiralos.core.telemetry.bus import QueuedTelemetryBus, TelemetryBus, TelemetryEnvelope
+from spiralos.core.telemetry.router import TelemetryRouter
+
+EVENTS = 200_000
+NOW = datetime.now(timezone.utc)
+PAYLOAD = {"coherence": 0.82, "ache": 0.31, "phase": "expansion", "agents": 12}
+METADATA = {"witness_id": "bench", "signature": None}
+
+TIMESTAMPS = {
+    "aware datetime": NOW,
+    "epoch seconds": NOW.timestamp(),
+    "epoch millis": int(NOW.timestamp() * 1000),
+    "naive datetime": NOW.replace(tzinfo=None),
+    "iso string": NOW.isoformat(),
+}
+
+
+def _rate(label: str, count: int, elapsed: float):
+    print(f"  {label:<34} {count / elapsed:>12,.0f} ops/s  {elapsed / count * 1e9:>8,.0f} ns/op")
+
+
+def benchmark_coercion():
+    print("🔹 [BENCHMARK] coerce_utc_timestamp")
+    for label, value in TIMESTAMPS.items():
+        started = time.perf_counter()
+        for _ in range(EVENTS):
+            coerce_utc_timestamp(value)
+        _rate(label, EVENTS, time.perf_counter() - started)
+
+
+def benchmark_envelopes():
+    print("🔹 [BENCHMARK] Envelope hand-off (view vs. copied dict)")
+    for label, handoff in (("mapping view", lambda e: e), ("as_dict copy", TelemetryEnvelope.as_dict)):
+        started = time.perf_counter()
+        for _ in range(EVENTS):
+            envelope = TelemetryEnvelope("heartbeat", "guardian", "beat", PAYLOAD, NOW, METADATA)
+            handoff(envelope)["payload"]
+        _rate(label, EVENTS, time.perf_counter() - started)
+
+
+def benchmark_publish():
+    print("🔹 [BENCHMARK] TelemetryBus.publish throughput")
+    router = TelemetryRouter()
+    router.register("heartbeat", lambda envelope: envelope["timestamp"])
+    bus = TelemetryBus(router)
+    for label in ("aware datetime", "epoch seconds"):
+        timestamp = TIMESTAMPS[label]
+        started = time.perf_counter()
+        for _ in range(EVENTS):
+            bus.publish(
+                kind="heartbeat", source="guardian", event_type="beat", payload=PAYLOAD, timestamp=timestamp,
+                metadata=METADATA,
+            )
+        _rate(f"sync, {label}", EVENTS, time.perf_counter() - started)
+
+    with QueuedTelemetryBus(router, max_queue_size=EVENTS, batch_size=256) as queued:
+        started = time.perf_counter()
+        for _ in range(EVENTS):
+            queued.publish(
+                kind="heartbeat", source="guardian", event_type="beat", payload=PAYLOAD, timestamp=NOW,
+                metadata=METADATA,
+            )
+        publish_elapsed = time.perf_counter() - started
+        queued.flush()
+        drained_elapsed = time.perf_counter() - started
+        metrics = queued.get_metrics()["kinds"]["heartbeat"]
+
+    _rate("queued, publish only", EVENTS, publish_elapsed)
+    _rate("queued, publish + delivery", EVENTS, drained_elapsed)
+    latency = metrics["publish_latency_ms"]
+    print(f"  queued publish latency p50 {latency['p50'] * 1000:.1f} µs  p99 {latency['p99'] * 1000:.1f} µs")
+
+
+if __name__ == "__main__":
+    benchmark_coercion()
+    benchmark_envelopes()
+    benchmark_publish()
@@ -5,6 +5,8 @@ import json
 from datetime import datetime, timedelta
 from supabase import create_client, Client
 
+from core.supabase_registry import ROLE_SERVICE, get_client_registry
+
 
 class AnomalyDetector:
     """
@@ -22,7 +24,7 @@ class AnomalyDetector:
                 "Missing SUPABASE_URL or SUPABASE_SERVICE_ROLE_KEY in environment variables."
             )
 
-        self.supabase: Client = create_client(url, key)
+        self.supabase: Client = get_client_registry().client_for(url, key, role=ROLE_SERVICE, factory=create_client)
 
     # -----------------------------------------------------
     # CORE: Record Anomaly
@@ -29,10 +29,12 @@ def coerce_utc_timestamp(value: Any, *, now: datetime | None = None) -> datetime
         ValueError: When the input string/number is malformed.
     """
 
-    reference = now or datetime.now(timezone.utc)
+    # Fast path: aware datetimes are the common input on the publish path
+    if type(value) is datetime and value.tzinfo is not None:
+        return value
 
     if value is None:
-        return reference
+        return now or datetime.now(timezone.utc)
 
     if isinstance(value, datetime):
         return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
@@ -46,7 +48,7 @@ def coerce_utc_timestamp(value: Any, *, now: datetime | None = None) -> datetime
         normalized = value.strip()
 
         if normalized.isdigit():
-            return coerce_utc_timestamp(int(normalized), now=reference)
+            return coerce_utc_timestamp(int(normalized), now=now)
 
         normalized = normalized.replace("Z", "+00:00")
         try:
@@ -1,23 +1,80 @@
-"""Unified telemetry bus that merges internal, external, and heartbeat flows."""
+"""Unified telemetry bus that merges internal, external, and heartbeat flows.
+
+``TelemetryBus`` routes each envelope synchronously to the single handler
+registered for its kind. ``QueuedTelemetryBus`` decouples publishers from
+handlers: every kind gets a bounded queue drained by its own worker thread,
+which fans batches out to all subscribers of that kind. A full queue either
+drops events or blocks the publisher, depending on the overflow policy.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+import threading
+import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Mapping, MutableMapping
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping, MutableMapping
 
 from ..external.coercion import coerce_utc_timestamp
 from .router import TelemetryRouter
 
+logger = logging.getLogger(__name__)
+
+OVERFLOW_DROP_NEWEST = "drop_newest"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_BLOCK = "block"
+OVERFLOW_POLICIES = (OVERFLOW_DROP_NEWEST, OVERFLOW_DROP_OLDEST, OVERFLOW_BLOCK)
+
+LATENCY_SAMPLES = 4096  # recent publish latencies kept per kind for percentiles
+
+
+class TelemetryEnvelope(Mapping[str, Any]):
+    """One telemetry event, consumed by handlers as a read-only mapping.
+
+    Envelopes are slotted and hand handlers the publisher's ``payload`` and
+    ``metadata`` without copying them; item access returns read-only views
+    (``MappingProxyType``) of dict values. Publishers must therefore not
+    mutate those mappings after publishing. ``as_dict()`` returns a
+    detached copy for handlers that need to keep or modify the event.
+    """
+
+    __slots__ = ("kind", "source", "event_type", "payload", "timestamp", "metadata")
+
+    _FIELDS = ("kind", "source", "event_type", "payload", "timestamp", "metadata")
+
+    def __init__(
+        self,
+        kind: str,
+        source: str,
+        event_type: str,
+        payload: Mapping[str, Any],
+        timestamp: datetime,
+        metadata: Mapping[str, Any],
+    ) -> None:
+        self.kind = kind
+        self.source = source
+        self.event_type = event_type
+        self.payload = payload
+        self.timestamp = timestamp
+        self.metadata = metadata
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        value = getattr(self, key)
+        return MappingProxyType(value) if type(value) is dict else value
 
-@dataclass
-class TelemetryEnvelope:
-    kind: str
-    source: str
-    event_type: str
-    payload: Mapping[str, Any]
-    timestamp: datetime
-    metadata: MutableMapping[str, Any]
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._FIELDS)
+
+    def __len__(self) -> int:
+        return len(self._FIELDS)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._FIELDS)
+        return f"TelemetryEnvelope({fields})"
 
     def as_dict(self) -> dict[str, Any]:
         return {
@@ -30,6 +87,9 @@ class TelemetryEnvelope:
         }
 
 
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
 class TelemetryBus:
     def __init__(self, router: TelemetryRouter | None = None) -> None:
         self.router = router or TelemetryRouter()
@@ -50,10 +110,309 @@ class TelemetryBus:
             event_type=event_type,
             payload=payload,
             timestamp=coerce_utc_timestamp(timestamp),
-            metadata=metadata or {},
+            metadata=metadata or _EMPTY_METADATA,
         )
 
-        return self.router.route(kind, envelope.as_dict())
+        return self.router.route(kind, envelope)
+
+
+class _KindQueue:
+    """Bounded queue, worker thread and counters for one telemetry kind."""
+
+    def __init__(self, kind: str, max_size: int, overflow: str) -> None:
+        self.kind = kind
+        self.max_size = max_size
+        self.overflow = overflow
+
+        self.items: deque[TelemetryEnvelope] = deque()
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+        self.idle = threading.Condition(self.lock)
+        self.in_flight = 0
+        self.closed = False
+        self.worker: threading.Thread | None = None
+
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.batches = 0
+        self.handler_errors = 0
+        self.max_depth = 0
+        self.latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def put(self, envelope: TelemetryEnvelope, block_timeout: float | None) -> bool:
+        with self.lock:
+            if self.closed:
+                raise RuntimeError(f"Telemetry queue for kind '{self.kind}' is closed")
+
+            if len(self.items) >= self.max_size:
+                if self.overflow == OVERFLOW_DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                if self.overflow == OVERFLOW_DROP_OLDEST:
+                    self.items.popleft()
+                    self.dropped += 1
+                elif not self.not_full.wait_for(
+                    lambda: len(self.items) < self.max_size or self.closed, timeout=block_timeout
+                ) or self.closed:
+                    self.dropped += 1
+                    return False
+
+            self.items.append(envelope)
+            self.published += 1
+            self.max_depth = max(self.max_depth, len(self.items))
+            self.not_empty.notify()
+            return True
+
+    def take(self, batch_size: int) -> list[TelemetryEnvelope] | None:
+        """Wait for a batch; None once the queue is closed and drained."""
+
+        with self.lock:
+            self.not_empty.wait_for(lambda: self.items or self.closed)
+            if not self.items:
+                return None
+            batch = [self.items.popleft() for _ in range(min(batch_size, len(self.items)))]
+            self.in_flight = len(batch)
+            self.not_full.notify_all()
+            return batch
+
+    def done(self, delivered: int, errors: int) -> None:
+        with self.lock:
+            self.in_flight = 0
+            self.batches += 1
+            self.delivered += delivered
+            self.handler_errors += errors
+            if not self.items:
+                self.idle.notify_all()
+
+    def close(self) -> None:
+        with self.lock:
+            self.closed = True
+            self.not_empty.notify_all()
+            self.not_full.notify_all()
+
+    def wait_idle(self, timeout: float | None) -> bool:
+        with self.lock:
+            return self.idle.wait_for(lambda: not self.items and not self.in_flight, timeout=timeout)
+
+
+class QueuedTelemetryBus:
+    """Asynchronous telemetry bus with per-kind bounded queues and fan-out.
+
+    ``publish`` enqueues the envelope and returns immediately (or blocks
+    under the ``block`` policy while the kind's queue is full). A worker
+    thread per kind delivers up to ``batch_size`` envelopes at a time to
+    every subscriber of the kind: subscribers exposing ``handle_batch`` get
+    the whole batch, plain callables are called once per envelope. Handler
+    exceptions are logged and counted; they never reach the publisher.
+
+    Because delivery happens after ``publish`` returns, the top level of
+    ``payload`` and ``metadata`` is copied at enqueue time; publishers may
+    reuse or mutate those mappings afterwards, but not the nested values
+    they contain.
+    """
+
+    def __init__(
+        self,
+        router: TelemetryRouter | None = None,
+        *,
+        max_queue_size: int = 1024,
+        overflow: str = OVERFLOW_DROP_NEWEST,
+        block_timeout: float | None = None,
+        batch_size: int = 64,
+        queue_sizes: Mapping[str, int] | None = None,
+        overflow_policies: Mapping[str, str] | None = None,
+    ) -> None:
+        """
+        Args:
+            router: Router holding handlers and subscribers per kind.
+            max_queue_size: Default queue bound per kind.
+            overflow: Default policy when a queue is full: ``drop_newest``
+                rejects the incoming event, ``drop_oldest`` evicts the head of
+                the queue, ``block`` waits for space.
+            block_timeout: Longest a ``block`` publisher waits before the
+                event is dropped (``None`` waits indefinitely).
+            batch_size: Most envelopes handed to subscribers per delivery.
+            queue_sizes: Per-kind overrides of ``max_queue_size``.
+            overflow_policies: Per-kind overrides of ``overflow``.
+        """
+        for policy in [overflow, *(overflow_policies or {}).values()]:
+            if policy not in OVERFLOW_POLICIES:
+                raise ValueError(f"Unknown overflow policy '{policy}'; expected one of {OVERFLOW_POLICIES}")
+        if max_queue_size < 1 or batch_size < 1:
+            raise ValueError("max_queue_size and batch_size must be positive")
+
+        self.router = router or TelemetryRouter()
+        self.max_queue_size = max_queue_size
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.batch_size = batch_size
+        self.queue_sizes = dict(queue_sizes or {})
+        self.overflow_policies = dict(overflow_policies or {})
+
+        self._queues: dict[str, _KindQueue] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def publish(
+        self,
+        *,
+        kind: str,
+        source: str,
+        event_type: str,
+        payload: Mapping[str, Any],
+        timestamp: Any | None = None,
+        metadata: MutableMapping[str, Any] | None = None,
+    ) -> bool:
+        """Enqueue an event; returns False when the overflow policy dropped it.
+
+        ``payload`` and ``metadata`` are shallow-copied, so later changes by
+        the publisher do not reach subscribers.
+        """
+
+        started = time.perf_counter()
+        if not self.router.subscribers(kind):
+            raise KeyError(f"No handler registered for telemetry kind '{kind}'")
+
+        envelope = TelemetryEnvelope(
+            kind=kind,
+            source=source,
+            event_type=event_type,
+            payload=dict(payload),
+            timestamp=coerce_utc_timestamp(timestamp),
+            metadata=dict(metadata) if metadata else _EMPTY_METADATA,
+        )
+        queue = self._queues.get(kind) or self._start_queue(kind)
+        accepted = queue.put(envelope, self.block_timeout)
+        queue.latencies.append(time.perf_counter() - started)
+        return accepted
+
+    def _start_queue(self, kind: str) -> _KindQueue:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Telemetry bus is closed")
+            queue = self._queues.get(kind)
+            if queue is None:
+                queue = _KindQueue(
+                    kind,
+                    self.queue_sizes.get(kind, self.max_queue_size),
+                    self.overflow_policies.get(kind, self.overflow),
+                )
+                queue.worker = threading.Thread(
+                    target=self._drain, args=(queue,), name=f"telemetry-{kind}", daemon=True
+                )
+                queue.worker.start()
+                self._queues[kind] = queue
+            return queue
+
+    def _drain(self, queue: _KindQueue) -> None:
+        while True:
+            batch = queue.take(self.batch_size)
+            if batch is None:
+                return
+
+            errors = 0
+            for subscriber in self.router.subscribers(queue.kind):
+                errors += self._deliver(subscriber, batch)
+            queue.done(len(batch), errors)
+
+    @staticmethod
+    def _deliver(subscriber: Any, records: list[TelemetryEnvelope]) -> int:
+        handle_batch = getattr(subscriber, "handle_batch", None)
+        try:
+            if handle_batch is not None:
+                handle_batch(records)
+                return 0
+        except Exception:
+            logger.exception("Telemetry batch handler %r failed", subscriber)
+            return 1
+
+        errors = 0
+        for record in records:
+            try:
+                subscriber(record)
+            except Exception:
+                logger.exception("Telemetry handler %r failed", subscriber)
+                errors += 1
+        return errors
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued event has been delivered."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for queue in list(self._queues.values()):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not queue.wait_idle(remaining):
+                return False
+        return True
+
+    def close(self, *, drain: bool = True, timeout: float | None = None) -> None:
+        """Stop accepting events and stop the workers (after draining by default)."""
+
+        if drain:
+            self.flush(timeout)
+        with self._lock:
+            self._closed = True
+            queues = list(self._queues.values())
+        for queue in queues:
+            if not drain:
+                with queue.lock:
+                    queue.dropped += len(queue.items)
+                    queue.items.clear()
+            queue.close()
+        for queue in queues:
+            if queue.worker is not None:
+                queue.worker.join(timeout)
+
+    def __enter__(self) -> "QueuedTelemetryBus":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def get_metrics(self) -> dict[str, Any]:
+        kinds = {}
+        for kind, queue in list(self._queues.items()):
+            samples = sorted(queue.latencies)
+            kinds[kind] = {
+                "queue_depth": len(queue.items),
+                "max_queue_depth": queue.max_depth,
+                "queue_size": queue.max_size,
+                "overflow": queue.overflow,
+                "published": queue.published,
+                "delivered": queue.delivered,
+                "dropped": queue.dropped,
+                "batches": queue.batches,
+                "handler_errors": queue.handler_errors,
+                "publish_latency_ms": _latency_summary(samples),
+            }
+        return {
+            "kinds": kinds,
+            "published": sum(k["published"] for k in kinds.values()),
+            "delivered": sum(k["delivered"] for k in kinds.values()),
+            "dropped": sum(k["dropped"] for k in kinds.values()),
+            "queue_depth": sum(k["queue_depth"] for k in kinds.values()),
+        }
+
+
+def _latency_summary(samples: list[float]) -> dict[str, float]:
+    if not samples:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "count": len(samples),
+        "mean": 1000 * sum(samples) / len(samples),
+        "p50": 1000 * samples[len(samples) // 2],
+        "p99": 1000 * samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+        "max": 1000 * samples[-1],
+    }
 
 
-__all__ = ["TelemetryBus", "TelemetryEnvelope"]
+__all__ = [
+    "OVERFLOW_BLOCK",
+    "OVERFLOW_DROP_NEWEST",
+    "OVERFLOW_DROP_OLDEST",
+    "QueuedTelemetryBus",
+    "TelemetryBus",
+    "TelemetryEnvelope",
+]
@@ -2,25 +2,52 @@
 
 from __future__ import annotations
 
-from typing import Callable, Dict, Mapping
+from typing import Any, Callable, Dict, List, Mapping, Protocol, Sequence, Union, runtime_checkable
 
 Handler = Callable[[Mapping[str, object]], object]
 
 
+@runtime_checkable
+class BatchHandler(Protocol):
+    """Subscriber that consumes queued envelopes in batches."""
+
+    def handle_batch(self, envelopes: Sequence[Mapping[str, object]]) -> Any: ...
+
+
+Subscriber = Union[Handler, BatchHandler]
+
+
 class TelemetryRouter:
     def __init__(self) -> None:
         self._handlers: Dict[str, Handler] = {}
+        self._subscribers: Dict[str, List[Subscriber]] = {}
 
     def register(self, kind: str, handler: Handler) -> None:
         self._handlers[kind] = handler
 
+    def subscribe(self, kind: str, subscriber: Subscriber) -> None:
+        """Add a fan-out subscriber for ``kind`` (delivered by the queued bus)."""
+
+        self._subscribers.setdefault(kind, []).append(subscriber)
+
+    def unsubscribe(self, kind: str, subscriber: Subscriber) -> None:
+        subscribers = self._subscribers.get(kind, [])
+        if subscriber in subscribers:
+            subscribers.remove(subscriber)
+
     def route(self, kind: str, payload: Mapping[str, object]):
         if kind not in self._handlers:
             raise KeyError(f"No handler registered for telemetry kind '{kind}'")
         return self._handlers[kind](payload)
 
+    def subscribers(self, kind: str) -> list[Subscriber]:
+        """The registered handler (if any) followed by fan-out subscribers."""
+
+        handler = self._handlers.get(kind)
+        return ([handler] if handler is not None else []) + self._subscribers.get(kind, [])
+
     def registered_kinds(self) -> list[str]:
-        return sorted(self._handlers)
+        return sorted(set(self._handlers) | {kind for kind, subs in self._subscribers.items() if subs})
 
 
-__all__ = ["TelemetryRouter", "Handler"]
+__all__ = ["TelemetryRouter", "Handler", "BatchHandler", "Subscriber"]
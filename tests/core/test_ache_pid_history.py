@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from core.ache_pid_controller import AchePIDController, PIDHistory
+
+
+def _reference_metrics(errors, scarindexes, target):
+    errors = np.asarray(errors)
+    settled = np.where(np.abs(errors) < 0.05 * target)[0]
+    return {
+        "mean_error": float(np.mean(np.abs(errors))),
+        "rmse": float(np.sqrt(np.mean(errors**2))),
+        "max_error": float(np.max(np.abs(errors))),
+        "settling_time": int(len(errors) if len(settled) == 0 else settled[0]),
+        "overshoot": float(np.max(np.asarray(scarindexes) - target) / target),
+        "samples": len(errors),
+    }
+
+
+def test_ring_buffer_wraps_in_order():
+    history = PIDHistory(capacity=4)
+    for i in range(6):
+        history.append(float(i), 0.0, 0.0, 0.0)
+
+    assert len(history) == 4
+    assert history.values("error").tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert history.tail("error", 3).tolist() == [3.0, 4.0, 5.0]
+    assert history.tail("error", 10).tolist() == [2.0, 3.0, 4.0, 5.0]
+
+    history.clear()
+    assert len(history) == 0 and history.values("error").size == 0
+
+
+def test_incremental_metrics_match_full_recomputation():
+    rng = np.random.default_rng(3)
+    controller = AchePIDController(target_scarindex=0.7, history_capacity=64)
+    readings = np.clip(0.7 + rng.normal(0, 0.1, 200), 0, 1)
+    errors = []
+    for value in readings:
+        controller.update(float(value))
+        errors.append(controller.error)
+
+    expected = _reference_metrics(errors, readings, 0.7)
+    metrics = controller.get_performance_metrics()
+    assert metrics == pytest.approx(expected)
+
+    # Memory stays bounded while metrics still cover every tick
+    assert len(controller.error_history) == 64
+    np.testing.assert_allclose(controller.error_history, errors[-64:])
+    assert controller.timestamp_history.dtype == np.float64
+
+
+def test_reset_clears_metrics():
+    controller = AchePIDController()
+    controller.update(0.2)
+    controller.reset()
+    assert controller.get_performance_metrics()["rmse"] == 0.0
+    assert len(controller.history) == 0
+
+
+def test_history_arrays_are_read_only():
+    history = PIDHistory(capacity=4)
+    history.append(1.0, 0.0, 0.0, 0.0)
+    history.append(2.0, 0.0, 0.0, 0.0)
+
+    for array in (history.values("error"), history.tail("error", 1)):
+        with pytest.raises(ValueError):
+            array[0] = 99.0
+
+    # Writes through the ring still work after views were handed out
+    history.append(3.0, 0.0, 0.0, 0.0)
+    assert history.values("error").tolist() == [1.0, 2.0, 3.0]
@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+from core.coherence_harness import FakeProvider, FakeProviderHarness, deterministic_scores
+from core.coherence_protocol import DistributedCoherenceProtocol, LLMProvider
+
+MINI, NANO, GEMINI = LLMProvider.GPT_4_1_MINI, LLMProvider.GPT_4_1_NANO, LLMProvider.GEMINI_2_5_FLASH
+
+
+def _verify(protocol):
+    return asyncio.run(protocol.verify_consensus(ache_content={"content": "ache"}, ache_before=0.5))
+
+
+def test_providers_run_concurrently():
+    harness = FakeProviderHarness({p: FakeProvider(latency=0.2) for p in (MINI, NANO, GEMINI)})
+    protocol = harness.build_protocol(early_return=False)
+
+    started = time.monotonic()
+    result = _verify(protocol)
+
+    assert time.monotonic() - started < 0.45
+    assert result.achieved and result.consensus_count == 3
+    assert result.final_output == deterministic_scores({"content": "ache"})
+
+
+def test_early_return_cancels_stragglers():
+    harness = FakeProviderHarness(
+        {MINI: FakeProvider(latency=0.01), NANO: FakeProvider(latency=0.02), GEMINI: FakeProvider(latency=5)}
+    )
+    started = time.monotonic()
+    result = _verify(harness.build_protocol())
+
+    assert time.monotonic() - started < 1
+    assert result.achieved and result.provider_count == 2
+    assert result.cancelled == 1 and harness.cancelled[GEMINI] == 1
+
+
+def test_early_return_when_consensus_is_unreachable():
+    harness = FakeProviderHarness(
+        {
+            MINI: FakeProvider(latency=0.01, failure_rate=1.0),
+            NANO: FakeProvider(latency=5),
+            GEMINI: FakeProvider(latency=5),
+        }
+    )
+    started = time.monotonic()
+    result = _verify(harness.build_protocol(consensus_threshold=3))
+
+    assert time.monotonic() - started < 1
+    assert not result.achieved and result.final_output is None
+    assert result.cancelled == 2 and len(result.failures) == 1
+
+
+def test_timeouts_and_failures_are_recorded():
+    harness = FakeProviderHarness(
+        {MINI: FakeProvider(latency=0.01), NANO: FakeProvider(latency=0.01), GEMINI: FakeProvider(latency=5)}
+    )
+    protocol = harness.build_protocol(provider_timeout=0.05, early_return=False)
+    result = _verify(protocol)
+
+    assert result.achieved and result.consensus_count == 2
+    assert list(result.failures) == [f"{GEMINI.value}#2"]
+    assert protocol.timed_out_requests == 1
+
+    failing = FakeProviderHarness({p: FakeProvider(latency=0.01, failure_rate=1.0) for p in (MINI, NANO, GEMINI)})
+    result = _verify(failing.build_protocol())
+    assert not result.achieved and result.consensus_count == 0 and len(result.failures) == 3
+
+
+def test_hedged_request_wins_over_slow_primary():
+    calls = []
+
+    async def analyzer(provider, instance, ache_content, system_prompt):
+        calls.append(provider)
+        # Only the first request to each provider is slow
+        await asyncio.sleep(2 if calls.count(provider) == 1 else 0.01)
+        return deterministic_scores(ache_content)
+
+    protocol = DistributedCoherenceProtocol(analyzer=analyzer, hedge_delay=0.05)
+    started = time.monotonic()
+    result = _verify(protocol)
+
+    assert time.monotonic() - started < 1
+    assert result.achieved
+    assert protocol.hedged_requests >= 2
@@ -0,0 +1,98 @@
+import asyncio
+
+from core.coherence_harness import FakeProvider, FakeProviderHarness
+from core.coherence_protocol import LLMProvider
+from core.consensus_cache import ConsensusCache, decode_result, encode_result
+
+PROVIDERS = [LLMProvider.GPT_4_1_MINI, LLMProvider.GPT_4_1_NANO, LLMProvider.GEMINI_2_5_FLASH]
+
+
+def _verify(protocol, content, **kwargs):
+    return asyncio.run(protocol.verify_consensus(ache_content=content, ache_before=0.5, **kwargs))
+
+
+def _protocol(cache, **profiles):
+    harness = FakeProviderHarness({p: FakeProvider(latency=0.001, **profiles) for p in PROVIDERS})
+    return harness, harness.build_protocol(cache=cache, early_return=False)
+
+
+def test_key_is_canonical():
+    a = ConsensusCache.key({"x": 1, "y": [1, 2]}, "prompt", PROVIDERS, 2)
+    assert a == ConsensusCache.key({"y": [1, 2], "x": 1}, "prompt", PROVIDERS, 2)
+    assert a != ConsensusCache.key({"x": 1, "y": [1, 2]}, "prompt", PROVIDERS, 3)
+    assert a != ConsensusCache.key({"x": 1, "y": [1, 2]}, "prompt", PROVIDERS[:2], 2)
+    assert a != ConsensusCache.key({"x": 1, "y": [1, 2]}, "other prompt", PROVIDERS, 2)
+
+
+def test_repeated_round_is_served_from_cache():
+    cache = ConsensusCache()
+    harness, protocol = _protocol(cache)
+
+    first = _verify(protocol, {"content": "ache"})
+    second = _verify(protocol, {"content": "ache"})
+
+    assert not first.cached and second.cached
+    assert second.consensus_group != first.consensus_group
+    assert second.cached_from == first.consensus_group and first.cached_from is None
+    third = _verify(protocol, {"content": "ache"})
+    assert third.consensus_group not in (first.consensus_group, second.consensus_group)
+    assert third.cached_from == first.consensus_group
+    assert sum(harness.calls.values()) == 3
+    assert cache.get_stats()["hits"] == 2 and cache.get_stats()["misses"] == 1
+
+    forced = _verify(protocol, {"content": "ache"}, bypass_cache=True)
+    assert not forced.cached and forced.cached_from is None and sum(harness.calls.values()) == 6
+    assert cache.bypasses == 1
+
+
+def test_cached_records_keep_their_own_consensus_group():
+    _, protocol = _protocol(ConsensusCache())
+    first = _verify(protocol, {"content": "ache"})
+    second = _verify(protocol, {"content": "ache"})
+
+    first_records = protocol.create_verification_records(first, "scar-1")
+    second_records = protocol.create_verification_records(second, "scar-2")
+    assert {r["consensus_group"] for r in first_records} == {first.consensus_group}
+    assert {r["consensus_group"] for r in second_records} == {second.consensus_group}
+    assert all("cached_from" not in r["metadata"] for r in first_records)
+    assert all(r["metadata"]["cached_from"] == first.consensus_group for r in second_records)
+
+
+def test_failed_rounds_are_not_cached():
+    cache = ConsensusCache()
+    harness, protocol = _protocol(cache, failure_rate=1.0)
+    _verify(protocol, {"content": "ache"})
+    _verify(protocol, {"content": "ache"})
+    assert sum(harness.calls.values()) == 6 and len(cache) == 0
+
+
+def test_ttl_and_lru_eviction(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("core.consensus_cache.time.time", lambda: clock[0])
+    cache = ConsensusCache(max_entries=2, ttl=10)
+    _, protocol = _protocol(cache)
+
+    for i in range(3):
+        _verify(protocol, {"i": i})
+    assert len(cache) == 2 and cache.evictions == 1
+
+    clock[0] += 11
+    assert _verify(protocol, {"i": 2}).cached is False
+    assert cache.expirations == 1
+
+
+def test_sqlite_tier_survives_restart(tmp_path):
+    db_path = str(tmp_path / "consensus.db")
+    cache = ConsensusCache(db_path=db_path)
+    _, protocol = _protocol(cache)
+    original = _verify(protocol, {"content": "ache"})
+    cache.close()
+
+    reopened = ConsensusCache(db_path=db_path)
+    harness, protocol = _protocol(reopened)
+    restored = _verify(protocol, {"content": "ache"})
+
+    assert restored.cached and sum(harness.calls.values()) == 0
+    assert reopened.disk_hits == 1
+    assert encode_result(decode_result(encode_result(original))) == encode_result(original)
+    assert restored.outputs[0].provider == original.outputs[0].provider
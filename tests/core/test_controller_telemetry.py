@@ -0,0 +1,98 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.ache_pid_controller import AchePIDController
+from core.controller_telemetry import (
+    BatchedTelemetrySink,
+    InMemoryTelemetrySink,
+    NullTelemetrySink,
+    TelemetrySink,
+)
+from core.soc_pid_controller import SOCPIDController
+
+
+def test_decimation_is_per_table():
+    sink = InMemoryTelemetrySink(sample_every=10)
+    for i in range(100):
+        sink.emit("a", {"i": i})
+        sink.emit("b", {"i": i})
+
+    assert [row["i"] for row in sink.rows_for("a")] == list(range(0, 100, 10))
+    assert len(sink.rows_for("b")) == 10
+    assert sink.get_metrics() == {"offered": 200, "sampled": 20}
+
+
+def test_sample_rate_is_seeded():
+    first = InMemoryTelemetrySink(sample_rate=0.25, seed=5)
+    second = InMemoryTelemetrySink(sample_rate=0.25, seed=5)
+    for i in range(2000):
+        first.emit("t", {"i": i})
+        second.emit("t", {"i": i})
+
+    assert first.rows_for("t") == second.rows_for("t")
+    assert 400 < len(first.rows) < 600
+
+    with pytest.raises(ValueError):
+        InMemoryTelemetrySink(sample_every=0)
+    with pytest.raises(TypeError):
+        TelemetrySink()
+
+
+def test_controllers_write_only_to_their_sink(monkeypatch):
+    monkeypatch.setattr("core.db.get_supabase", MagicMock(side_effect=AssertionError("no direct I/O")))
+
+    sink = InMemoryTelemetrySink(sample_every=5)
+    controller = SOCPIDController(telemetry=sink)
+    for _ in range(20):
+        controller.update_soc(0.6, 2.0)
+
+    assert len(sink.rows_for("ache_values")) == 4
+    assert len(sink.rows_for("coherence_signals")) == 4
+    assert sink.rows_for("ache_values")[0]["metadata"]["target"] == 0.7
+
+    null = NullTelemetrySink()
+    AchePIDController(telemetry=null).update(0.5)
+    assert null.get_metrics() == {"offered": 1, "sampled": 0}
+
+
+def test_batched_sink_bulk_inserts_per_table():
+    client = MagicMock()
+    sink = BatchedTelemetrySink(client=client, batch_size=50, flush_interval=5)
+    for i in range(30):
+        sink.emit("ache_values", {"i": i})
+    sink.emit("coherence_signals", {"i": 0})
+
+    assert sink.flush(timeout=5)
+    assert sorted(call.args[0] for call in client.table.call_args_list) == ["ache_values", "coherence_signals"]
+    batches = [call.args[0] for call in client.table.return_value.insert.call_args_list]
+    assert sorted(len(rows) for rows in batches) == [1, 30]
+    assert sink.get_metrics()["written"] == 31
+    sink.close(timeout=5)
+
+
+def test_batched_sink_counts_failures_and_drops():
+    client = MagicMock()
+    client.table.return_value.insert.return_value.execute.side_effect = RuntimeError("offline")
+    sink = BatchedTelemetrySink(client=client, batch_size=10, flush_interval=0.01, max_queue_size=1000)
+    for i in range(5):
+        sink.emit("ache_values", {"i": i})
+    assert sink.flush(timeout=5)
+    assert sink.failed == 5 and sink.written == 0
+    sink.close(timeout=5)
+
+
+def test_batched_sink_drains_on_exit_hook():
+    client = MagicMock()
+    sink = BatchedTelemetrySink(client=client, batch_size=100, flush_interval=60)
+    for i in range(3):
+        sink.emit("ache_values", {"i": i})
+
+    # What atexit runs: the partial batch is written instead of dying with the daemon thread
+    sink._close_at_exit()
+    assert sink.closed
+    assert sink.get_metrics()["written"] == 3
+
+    sink.emit("ache_values", {"i": 3})
+    assert sink.get_metrics()["dropped"] == 1
+    assert sink.flush(timeout=1)
@@ -0,0 +1,75 @@
+import pytest
+
+from core.glyphic_binding_engine import BindingStrength, Glyph, GlyphEvictionIndex, GlyphicBindingEngine, GlyphType
+
+
+def _glyph(name):
+    return Glyph(id=name, glyph_type=GlyphType.CONCEPT, symbol=name)
+
+
+def test_lfu_pops_least_accessed_then_least_recent():
+    index = GlyphEvictionIndex()
+    glyphs = {name: _glyph(name) for name in "abcd"}
+    for glyph in glyphs.values():
+        glyph.on_access = index.touch
+        index.add(glyph)
+
+    glyphs["a"].access(3)
+    glyphs["c"].access()
+    glyphs["b"].access()
+
+    assert index.pop_victims(3) == ["d", "c", "b"]
+    assert len(index) == 1
+
+
+def test_lru_k_prefers_glyphs_with_fewer_than_k_accesses():
+    index = GlyphEvictionIndex(policy="lru-k", k=2)
+    glyphs = {name: _glyph(name) for name in "abc"}
+    for glyph in glyphs.values():
+        glyph.on_access = index.touch
+        index.add(glyph)
+
+    glyphs["c"].access()
+    glyphs["a"].access()
+    glyphs["a"].access()
+
+    # b has a single reference; c's second-most-recent is older than a's
+    assert index.pop_victims(2) == ["b", "c"]
+
+    with pytest.raises(ValueError):
+        GlyphEvictionIndex(policy="random")
+
+
+def test_stale_heap_entries_are_compacted():
+    index = GlyphEvictionIndex()
+    glyph = _glyph("hot")
+    glyph.on_access = index.touch
+    index.add(glyph)
+    for _ in range(500):
+        glyph.access()
+
+    assert index.compactions > 0
+    assert index.heap_size <= 2 * len(index) + 65
+    assert index.pop_victims(5) == ["hot"]
+
+
+def test_engine_evicts_cold_glyphs_and_their_bindings():
+    engine = GlyphicBindingEngine(max_glyphs=20)
+    ids = [engine.create_glyph(GlyphType.CONCEPT, f"G{i}", {}).id for i in range(20)]
+    hot = ids[10:]
+    for glyph_id in hot:
+        engine.glyphs[glyph_id].access(5)
+    engine.bind_glyphs(ids[0], ids[15], BindingStrength.STRONG)
+
+    engine.create_glyph(GlyphType.CONCEPT, "new", {})
+
+    assert len(engine.glyphs) == 19
+    assert ids[0] not in engine.glyphs
+    assert engine.get_bindings(ids[15]) == {}
+    assert all(glyph_id in engine.glyphs for glyph_id in hot)
+
+    metrics = engine.get_engine_status()["eviction"]
+    assert metrics["eviction_rounds"] == 1
+    assert metrics["glyphs_evicted"] == 2
+    assert metrics["bindings_removed"] == 1
+    assert metrics["indexed_glyphs"] == len(engine.glyphs)
@@ -0,0 +1,163 @@
+import numpy as np
+
+from core.glyph_graph import BindingGraph, GlyphRegistry
+from core.glyphic_binding_engine import BindingStrength, Glyph, GlyphicBindingEngine, GlyphType
+
+
+def _graph(count):
+    registry = GlyphRegistry(capacity=2)
+    for i in range(count):
+        registry.intern(f"g{i}", 0.5 + i / 10)
+    return registry, BindingGraph(registry)
+
+
+def test_registry_interns_in_order_and_tracks_coherence_sum():
+    registry, _ = _graph(5)
+
+    assert registry.slot("g3") == 3
+    assert registry.slots(["g4", "missing", "g0"]).tolist() == [4, 0]
+    assert np.isclose(registry.mean_coherence, 0.7)
+
+    registry.set_coherence(0, 1.0)
+    registry.remove(["g4", "missing"])
+    assert len(registry) == 4
+    assert "g4" not in registry and registry.ids[4] is None
+    assert np.isclose(registry.coherence_total, 1.0 + 0.6 + 0.7 + 0.8)
+
+
+def test_last_write_per_pair_wins_and_unbind_removes():
+    _, graph = _graph(4)
+    graph.bind(0, 1, 1)
+    graph.bind(1, 0, 3)
+    graph.bind(2, 3, 2)
+    graph.bind(1, 2, 2)
+    graph.unbind(3, 2)
+
+    neighbours, codes = graph.neighbours(1)
+    assert neighbours.tolist() == [0, 2]
+    assert codes.tolist() == [3, 2]
+    assert graph.neighbours(3)[0].tolist() == []
+    assert graph.num_bindings == 2
+
+    graph.unbind(0, 1)
+    graph.bind(2, 3, 1)
+    assert graph.neighbours(1)[0].tolist() == [2]
+    assert graph.neighbours(2)[0].tolist() == [1, 3]
+
+
+def test_subgraph_and_dead_slots():
+    registry, graph = _graph(5)
+    for a, b in [(0, 1), (1, 2), (2, 3), (3, 4), (0, 4)]:
+        graph.bind(a, b, 1)
+
+    src, dst = graph.subgraph(np.array([4, 0, 1]))
+    assert list(zip(src.tolist(), dst.tolist())) == [(4, 0), (0, 1), (0, 4), (1, 0)]
+    assert graph.count_edges_touching(np.array([0, 1])) == 2
+
+    # Glyphs created after the last merge have empty rows
+    registry.intern("g5", 1.0)
+    assert graph.neighbours(5)[0].tolist() == []
+
+    registry.remove(["g0"])
+    graph.invalidate()
+    assert graph.neighbours(1)[0].tolist() == [2]
+    assert graph.num_bindings == 3
+
+
+def test_engine_bindings_and_sigil_coherence_match_glyph_dicts():
+    engine = GlyphicBindingEngine()
+    ids = [engine.create_glyph(GlyphType.CONCEPT, f"G{i}", {}).id for i in range(4)]
+    engine.set_glyph_coherence(ids[3], 0.2)
+    engine.bind_glyphs(ids[0], ids[1], BindingStrength.STRONG)
+    engine.bind_glyphs(ids[1], ids[2], BindingStrength.WEAK)
+    engine.bind_glyphs(ids[2], ids[3], BindingStrength.ABSOLUTE)
+    engine.unbind_glyphs(ids[3], ids[2])
+
+    assert engine.get_bindings(ids[1]) == {ids[0]: BindingStrength.STRONG, ids[2]: BindingStrength.WEAK}
+    assert engine.get_bindings("missing") == {}
+
+    sigil = engine.create_sigil("S", [ids[2], ids[1], ids[3], ids[1], "missing"])
+    assert sigil.binding_graph == {ids[2]: [ids[1]], ids[1]: [ids[2]]}
+
+    expected = sigil.calculate_coherence(engine.glyphs)
+    engine.create_sigil("S2", [ids[2], ids[1], ids[3], ids[1], "missing"])
+    assert np.isclose(expected, list(engine.sigils.values())[-1].coherence_score)
+
+    status = engine.get_engine_status()
+    assert status["total_bindings"] == 2
+    assert np.isclose(status["symbolic_coherence"], (0.8 * 3 + 0.2) / 4)
+
+
+def test_removed_slots_are_recycled_only_after_their_edges_are_dropped():
+    registry, graph = _graph(3)
+    graph.bind(0, 1, 2)
+    registry.remove(["g1"])
+
+    # Not merged yet: the dead slot still has a logged edge, so it is not reused
+    assert registry.intern("g3", 1.0) == 3
+
+    graph.compact()
+    assert registry.intern("g4", 1.0) == 1
+    assert registry.ids[1] == "g4" and registry.alive[1]
+    # The old g0-g1 binding did not carry over to the new occupant
+    assert graph.neighbours(1)[0].tolist() == []
+    assert graph.neighbours(0)[0].tolist() == []
+
+
+def test_engine_churn_keeps_slot_range_bounded_and_exports_bindings():
+    engine = GlyphicBindingEngine(max_glyphs=100)
+    previous = None
+    for i in range(1000):
+        glyph = engine.create_glyph(GlyphType.CONCEPT, f"G{i}", {})
+        if previous is not None and previous.id in engine.glyphs:
+            engine.bind_glyphs(previous.id, glyph.id, BindingStrength.STRONG)
+        previous = glyph
+
+    assert len(engine.glyphs) <= 100
+    assert engine.registry.num_slots <= 110
+    for glyph_id, glyph in engine.glyphs.items():
+        assert engine.get_bindings(glyph_id).keys() <= engine.glyphs.keys()
+
+    exported = previous.to_dict()
+    assert exported["bound_to"] == list(engine.get_bindings(previous.id))
+    assert exported["binding_strengths"] == {k: v.value for k, v in engine.get_bindings(previous.id).items()}
+    assert exported["bound_to"]
+
+
+def test_reads_between_writes_use_the_overlay_without_rebuilding():
+    registry, graph = _graph(6)
+    graph.bind(0, 1, 1)
+    graph.compact()
+    merges = graph.merges
+
+    graph.bind(2, 1, 3)
+    graph.unbind(0, 1)
+    graph.bind(4, 5, 2)
+    assert graph.neighbours(1)[0].tolist() == [2]
+    assert graph.degrees([0, 1, 2]).tolist() == [0, 1, 1]
+    src, dst = graph.subgraph(np.array([2, 1, 0]))
+    assert list(zip(src.tolist(), dst.tolist())) == [(2, 1), (1, 2)]
+    assert graph.num_bindings == 2
+    assert graph.merges == merges
+
+    # Removing glyphs still rebuilds on the next read
+    registry.remove(["g5"])
+    graph.invalidate()
+    assert graph.neighbours(4)[0].tolist() == []
+    assert graph.merges == merges + 1 and graph.num_bindings == 1
+
+
+def test_glyph_binding_attributes_read_through_the_engine():
+    engine = GlyphicBindingEngine()
+    first, second = (engine.create_glyph(GlyphType.CONCEPT, f"G{i}", {}) for i in range(2))
+
+    first.bind_to(second.id, BindingStrength.STRONG)
+    assert second.bound_to == {first.id}
+    assert first.binding_strengths == {second.id: BindingStrength.STRONG}
+    first.unbind_from(second.id)
+    assert engine.get_bindings(second.id) == {}
+
+    standalone = Glyph()
+    standalone.bind_to("other", BindingStrength.WEAK)
+    assert standalone.bound_to == {"other"}
+    assert standalone.to_dict()["binding_strengths"] == {"other": BindingStrength.WEAK.value}
@@ -0,0 +1,74 @@
+import pytest
+
+from core.glyphic_binding_engine import BindingStrength, GlyphicBindingEngine, GlyphType, SigilThread
+
+
+def _engine(workers, glyphs=50, threads=4):
+    engine = GlyphicBindingEngine(max_threads=threads, workers=workers)
+    for i in range(threads - 1):
+        engine.create_thread(f"T{i}")
+    ids = [engine.create_glyph(GlyphType.CONCEPT, f"G{i}", {"i": i}).id for i in range(glyphs)]
+    engine.bind_glyphs(ids[0], ids[1], BindingStrength.STRONG)
+    return engine, ids
+
+
+def _streams(ids):
+    return [[ids[(i * 7 + j) % len(ids)] for j in range(200)] + ["missing"] for i in range(10)]
+
+
+def _symbols(engine, glyph_ids):
+    return [engine.glyphs[glyph_id].symbol for glyph_id in glyph_ids]
+
+
+def test_thread_queue_is_fifo_and_drain_filters_unknown():
+    thread = SigilThread()
+    thread.enqueue_glyphs(["a", "b", "zzz", "c"])
+    assert thread.dequeue_glyph() == "a"
+    assert thread.drain({"b": None, "c": None}) == ["b", "c"]
+    assert thread.dequeue_glyph() is None
+    assert thread.glyphs_processed == 2
+
+
+@pytest.mark.parametrize("workers", [2, 4])
+def test_parallel_streams_merge_deterministically(workers):
+    serial, serial_ids = _engine(workers=1)
+    parallel, parallel_ids = _engine(workers=workers)
+
+    expected = serial.process_glyph_streams(_streams(serial_ids))
+    actual = parallel.process_glyph_streams(_streams(parallel_ids))
+    parallel.shutdown()
+
+    assert [_symbols(parallel, s.component_glyphs) for s in actual] == [
+        _symbols(serial, s.component_glyphs) for s in expected
+    ]
+    assert [len(s.binding_graph) for s in actual] == [len(s.binding_graph) for s in expected]
+    assert [s.name for s in actual] == [s.name for s in expected]
+    assert {g.symbol: g.access_count for g in parallel.glyphs.values()} == {
+        g.symbol: g.access_count for g in serial.glyphs.values()
+    }
+    assert [t.glyphs_processed for t in parallel.threads.values()] == [
+        t.glyphs_processed for t in serial.threads.values()
+    ]
+    assert len({s.thread_id for s in actual}) == 4
+
+
+def test_single_stream_counts_repeated_access():
+    engine, ids = _engine(workers=1)
+    sigil = engine.process_glyph_stream([ids[0], ids[1], ids[0], "missing"])
+
+    assert sigil.component_glyphs == [ids[0], ids[1], ids[0]]
+    assert sigil.binding_graph == {ids[0]: [ids[1]], ids[1]: [ids[0]]}
+    assert engine.glyphs[ids[0]].access_count == 2
+    assert sigil.thread_id == next(iter(engine.threads))
+
+
+def test_workers_default_to_serial_drain():
+    engine = GlyphicBindingEngine(max_threads=4)
+    for i in range(3):
+        engine.create_thread(f"T{i}")
+    glyph = engine.create_glyph(GlyphType.CONCEPT, "G", {})
+    engine.process_glyph_streams([[glyph.id]] * 4)
+
+    assert engine.workers == 1 and engine._executor is None
+    with pytest.raises(ValueError):
+        GlyphicBindingEngine(workers=0)
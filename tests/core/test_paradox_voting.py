@@ -0,0 +1,100 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from core.paradox_network import ParadoxAgent, ParadoxNetwork, ParadoxOperation, ParadoxPriority
+
+
+def _network(agents=20, operations=50, seed=0, **kwargs):
+    network = ParadoxNetwork(max_agents=agents + 3, seed=seed, **kwargs)
+    for i in range(agents):
+        agent = network.add_agent(f"Agent {i}", intensity=(i % 10) / 10, creativity=(i % 5) / 5)
+        agent.reputation = 0.1 + (i % 7) / 10
+    agent_ids = list(network.agents)
+    for i in range(operations):
+        scarindex, tau = 0.3 + (i % 7) / 10, 1.0 + (i % 3) / 5
+        asyncio.run(network.propose_operation(agent_ids[i % len(agent_ids)], "gbe", scarindex, tau))
+    return network
+
+
+def test_without_creativity_batch_matches_scalar_votes():
+    network = _network()
+    for agent in network.agents.values():
+        agent.creativity = 0.0
+    network.operations[next(iter(network.pending_operations))].priority = ParadoxPriority.CRITICAL
+
+    active = [a for a in network.agents.values() if a.active]
+    expected = {}
+    for operation_id in network.pending_operations:
+        operation = network.operations[operation_id]
+        votes = [agent.vote_on_operation(operation) for agent in active]
+        weighted_for = sum(a.reputation for a, v in zip(active, votes) if v)
+        expected[operation_id] = (sum(votes), weighted_for / sum(a.reputation for a in active))
+
+    results = asyncio.run(network.process_pending_operations(0.5, 1.3))
+
+    assert len(network.pending_operations) == 0
+    assert [r["operation_id"] for r in results] == list(expected)
+    for result in results:
+        votes_for, ratio = expected[result["operation_id"]]
+        assert result["votes_for"] == votes_for
+        assert result["votes_against"] == len(active) - votes_for
+        assert np.isclose(result["approval_ratio"], ratio)
+        assert result["approved"] == (ratio >= network.consensus_threshold)
+
+
+def test_agents_back_their_own_operations():
+    network = ParadoxNetwork(seed=1)
+    for agent in network.agents.values():
+        agent.creativity = 5.0  # every non-owner vote flips
+    owner = next(iter(network.agents))
+    operation = ParadoxOperation(agent_id=owner, disruption_magnitude=0.5)
+    network.operations[operation.id] = operation
+    network.pending_operations[operation.id] = None
+
+    result = asyncio.run(network.vote_on_operation(operation.id))
+
+    assert result["votes_for"] == 1
+    assert operation.consensus_reached and not operation.approved
+    with pytest.raises(ValueError):
+        network.vote_on_operations(["missing"])
+
+
+def test_chunking_does_not_change_results():
+    whole = asyncio.run(_network(seed=7).process_pending_operations(0.5, 1.3))
+    chunked = asyncio.run(_network(seed=7, vote_chunk_cells=30).process_pending_operations(0.5, 1.3))
+
+    assert [(r["votes_for"], r["approved"]) for r in whole] == [(r["votes_for"], r["approved"]) for r in chunked]
+    assert np.allclose([r["approval_ratio"] for r in whole], [r["approval_ratio"] for r in chunked])
+
+
+def test_pending_operations_are_ordered_and_approval_counts_agree():
+    network = _network(operations=30)
+    order = list(network.pending_operations)
+    network.vote_on_operations(order[10:12])
+
+    assert list(network.pending_operations) == order[:10] + order[12:]
+    network.vote_on_operations(network.pending_operations)
+    assert network.approved_operations == sum(op.approved for op in network.operations.values())
+    assert network.approved_operations == sum(a.operations_approved for a in network.agents.values())
+    assert isinstance(ParadoxAgent().vote_on_operation(ParadoxOperation()), bool)
+
+
+def test_seed_makes_scalar_and_single_operation_votes_reproducible():
+    def scalar_votes(seed):
+        network = _network(operations=5, seed=seed)
+        return [
+            agent.vote_on_operation(network.operations[operation_id])
+            for operation_id in network.pending_operations
+            for agent in network.agents.values()
+        ]
+
+    assert scalar_votes(3) == scalar_votes(3)
+
+    single, batch = _network(operations=5, seed=3), _network(operations=5, seed=3)
+    single_results = [asyncio.run(single.vote_on_operation(op_id)) for op_id in list(single.pending_operations)]
+    batch_results = [batch.vote_on_operations([op_id])[0] for op_id in list(batch.pending_operations)]
+    assert [(r["votes_for"], r["approved"]) for r in single_results] == [
+        (r["votes_for"], r["approved"]) for r in batch_results
+    ]
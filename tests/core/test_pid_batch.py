@@ -0,0 +1,66 @@
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from core.ache_pid_controller import (
+    AchePIDController,
+    pid_gain_grid,
+    simulate_pid_batch,
+    simulate_pid_response,
+    ziegler_nichols_neighbourhood,
+)
+from core.controller_telemetry import NullTelemetrySink
+
+GAINS = [(1.0, 0.5, 0.2), (1.5, 0.1, 0.0), (0.4, 0.9, 0.6)]
+
+
+def _scalar_run(kp, ki, kd, steps):
+    """Noise-free reference run through AchePIDController"""
+    controller = AchePIDController(kp=kp, ki=ki, kd=kd, telemetry=NullTelemetrySink())
+    current = 0.3
+    for _ in range(steps):
+        guidance = controller.update(current, dt=1.0)
+        current = float(np.clip(current + 0.1 * (0.7 - current) * guidance, 0, 1))
+    return controller.get_performance_metrics()
+
+
+def test_batch_matches_scalar_controllers():
+    kp, ki, kd = (np.array(g) for g in zip(*GAINS))
+    result = simulate_pid_batch(kp, ki, kd, steps=80, noise_std=0)
+
+    with mock.patch("numpy.random.normal", return_value=0.0):
+        scarindex, guidance, errors = simulate_pid_response(kp=1.0, ki=0.5, kd=0.2, steps=80)
+    np.testing.assert_allclose(result.scarindex[0], scarindex)
+    np.testing.assert_allclose(result.guidance[0], guidance)
+    np.testing.assert_allclose(result.error[0], errors)
+
+    for index, gains in enumerate(GAINS):
+        assert result.metrics_for(index) == pytest.approx(_scalar_run(*gains, steps=80))
+
+
+def test_seeded_noise_is_reproducible():
+    first = simulate_pid_batch([1.0, 2.0], 0.5, 0.2, seed=9, keep_trajectories=False)
+    second = simulate_pid_batch([1.0, 2.0], 0.5, 0.2, seed=9, keep_trajectories=False)
+    assert first.scarindex is None
+    np.testing.assert_array_equal(first.metrics["rmse"], second.metrics["rmse"])
+
+    common = simulate_pid_batch([1.0, 1.0], 0.5, 0.2, seed=9, common_noise=True)
+    np.testing.assert_array_equal(common.scarindex[0], common.scarindex[1])
+
+
+def test_gain_grids_and_best():
+    kp, ki, kd = pid_gain_grid([0.5, 1.0], [0.1, 0.2, 0.3], 0.2)
+    assert len(kp) == 6 and set(kd) == {0.2}
+
+    kp, ki, kd = ziegler_nichols_neighbourhood(1.6, 10.0, spread=0.5, points=3)
+    assert len(kp) == 27
+    assert 0.96 in np.round(kp, 6) and 0.192 in np.round(ki, 6) and 1.2 in np.round(kd, 6)
+
+    result = simulate_pid_batch(kp, ki, kd, steps=60, seed=2)
+    parameters, metrics = result.best("rmse")
+    assert metrics["rmse"] == pytest.approx(result.metrics["rmse"].min())
+    assert parameters.kp in kp
+
+    with pytest.raises(ValueError):
+        simulate_pid_batch(-1.0, 0.5, 0.2)
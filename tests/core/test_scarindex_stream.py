@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.scarindex import ScarIndex, StreamingScarIndex
+
+NOW = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+
+
+def _row(event_id, event_type, minutes_ago):
+    return {
+        "id": event_id,
+        "event_type": event_type,
+        "event_timestamp": (NOW - timedelta(minutes=minutes_ago)).isoformat(),
+    }
+
+
+ROWS = [
+    _row("a", "error", 50),
+    _row("b", "github_webhook", 12),
+    _row("c", "security_alert", 4),
+    _row("d", "unknown_kind", 1),
+    _row("e", "error", 0.5),
+]
+
+
+def test_stream_matches_batch_scorer_per_window():
+    engine = StreamingScarIndex()
+    engine.ingest(ROWS, now=NOW.timestamp())
+    batch = ScarIndex.__new__(ScarIndex)
+
+    for minutes in (5, 15, 60):
+        cutoff = NOW - timedelta(minutes=minutes)
+        in_window = [r for r in ROWS if datetime.fromisoformat(r["event_timestamp"]) >= cutoff]
+        assert engine.event_count(minutes) == len(in_window)
+        assert engine.score(minutes) == batch._calculate_scarindex(in_window)
+
+
+def test_stream_expires_events_and_dedupes_high_water_mark():
+    engine = StreamingScarIndex()
+    engine.ingest(ROWS, now=NOW.timestamp())
+    assert engine.high_water_mark == ROWS[-1]["event_timestamp"]
+
+    # A gte re-fetch returns the row at the high-water mark again.
+    assert engine.ingest([ROWS[-1]], now=NOW.timestamp()) == 0
+    assert engine.event_count(5) == 3
+
+    engine.advance((NOW + timedelta(minutes=10)).timestamp())
+    assert engine.event_count(5) == 0
+    assert engine.score(5) == 1.0
+    assert engine.counts(15) == {"security_alert": 1, "unknown_kind": 1, "error": 1}
+
+
+def test_stream_rejects_empty_windows():
+    with pytest.raises(ValueError):
+        StreamingScarIndex(windows=())
@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from core.controller_telemetry import NullTelemetrySink
+from core.soc_pid_controller import SOCPIDController, StreamingTauEstimator
+
+
+def _pareto(count, seed=0, alpha=1.5):
+    # pdf ~ s^-(alpha + 1) for s >= 1, so counts per log bin ~ s^-alpha
+    return np.random.default_rng(seed).pareto(alpha, count) + 1.0
+
+
+def test_window_histogram_tracks_adds_and_evictions():
+    data = _pareto(3000)
+    estimator = StreamingTauEstimator(window=500)
+    for size in data:
+        estimator.add(size)
+
+    window = data[-500:]
+    np.testing.assert_array_equal(estimator.values(), window)
+    in_range = window[window <= estimator.size_max]
+    np.testing.assert_array_equal(estimator.counts, np.histogram(in_range, bins=estimator.edges)[0])
+    assert estimator.overflow == len(window) - len(in_range)
+
+
+def test_out_of_range_sizes_are_counted_and_evicted():
+    estimator = StreamingTauEstimator(window=3, size_min=1.0, size_max=100.0)
+    for size in (0.5, 1e3, 10.0):
+        estimator.add(size)
+    assert (estimator.underflow, estimator.overflow, estimator.counts.sum()) == (1, 1, 1)
+
+    for size in (10.0, 10.0):
+        estimator.add(size)
+    assert (estimator.underflow, estimator.overflow, estimator.counts.sum()) == (0, 0, 3)
+
+
+@pytest.mark.parametrize("method", ["histogram", "mle"])
+def test_streaming_matches_fresh_estimate_over_window(method):
+    data = _pareto(4000, seed=1)
+    streaming = StreamingTauEstimator(window=1000, method=method)
+    fresh = StreamingTauEstimator(window=1000, method=method)
+    for size in data:
+        streaming.add(size)
+    for size in data[-1000:]:
+        fresh.add(size)
+
+    assert streaming.tau() == pytest.approx(fresh.tau(), rel=1e-9)
+
+
+def test_estimators_recover_known_exponent():
+    data = _pareto(20000, seed=2)
+    mle = StreamingTauEstimator(window=20000, method="mle")
+    histogram = StreamingTauEstimator(window=20000, method="histogram")
+    for size in data:
+        mle.add(size)
+        histogram.add(size)
+
+    assert mle.tau() == pytest.approx(1.5, abs=0.05)
+    assert histogram.tau() == pytest.approx(1.5, abs=0.3)
+
+
+def test_discrete_mle_and_warmup():
+    estimator = StreamingTauEstimator(method="mle", discrete=True)
+    for size in range(1, 5):
+        estimator.add(size)
+    assert estimator.tau() == 0.0
+
+    # Discrete power law; the s_min - 1/2 approximation holds for s_min of about 6 and up
+    data = np.random.default_rng(3).zipf(2.5, 50000)
+    discrete = StreamingTauEstimator(window=50000, method="mle", discrete=True, size_min=6)
+    continuous = StreamingTauEstimator(window=50000, method="mle", size_min=6)
+    for size in data:
+        discrete.add(size)
+        continuous.add(size)
+    assert discrete.tau() == pytest.approx(1.5, abs=0.1)
+    assert abs(discrete.tau() - 1.5) < abs(continuous.tau() - 1.5)
+
+    with pytest.raises(ValueError):
+        StreamingTauEstimator(method="ols")
+
+
+def test_controller_refreshes_tau_every_event():
+    controller = SOCPIDController(tau_window=200, tau_method="mle", telemetry=NullTelemetrySink())
+    taus = []
+    for size in _pareto(300, seed=4):
+        _, state = controller.update_soc(0.6, size)
+        taus.append(state["soc_metrics"]["tau"])
+
+    assert taus[5] == 0.0 and taus[-1] > 0.5
+    assert len(set(taus[20:])) > 200
+    assert state["soc_metrics"]["avalanche_count"] == 200
+
+
+@pytest.mark.parametrize("method", ["histogram", "mle"])
+def test_controller_steers_toward_target_tau(method):
+    def run(alpha):
+        controller = SOCPIDController(tau_window=2000, tau_method=method, telemetry=NullTelemetrySink())
+        for size in _pareto(2000, seed=5, alpha=alpha):
+            _, state = controller.update_soc(0.7, size)
+        return controller, state
+
+    # Counts per log bin ~ s^-1.5 is the critical state the default target describes
+    critical, state = run(1.5)
+    assert state["soc_metrics"]["is_critical"]
+    assert abs(state["soc_adjustment"]) < 0.05
+
+    # τ above target lowers guidance and paradox intensity; τ below target raises them
+    steep, state = run(2.5)
+    assert not state["soc_metrics"]["is_critical"] and state["soc_adjustment"] < 0
+    assert steep.adjust_paradox_parameters()["paradox_intensity"] < 0.5
+    shallow, state = run(0.8)
+    assert not state["soc_metrics"]["is_critical"] and state["soc_adjustment"] > 0
+    assert shallow.adjust_paradox_parameters()["paradox_intensity"] > 0.5
@@ -0,0 +1,127 @@
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from spiralos.core.telemetry.bus import QueuedTelemetryBus
+from spiralos.core.telemetry.router import TelemetryRouter
+
+FIXED_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _publish(bus, kind="heartbeat", count=1):
+    return [
+        bus.publish(kind=kind, source="guardian", event_type="beat", payload={"n": n}, timestamp=FIXED_NOW)
+        for n in range(count)
+    ]
+
+
+class _Recorder:
+    def __init__(self):
+        self.batches = []
+
+    def handle_batch(self, envelopes):
+        self.batches.append([envelope["payload"]["n"] for envelope in envelopes])
+
+
+def test_fans_out_batches_and_single_handlers_in_order():
+    router = TelemetryRouter()
+    seen = []
+    batch_subscriber = _Recorder()
+    router.register("heartbeat", lambda envelope: seen.append(envelope["payload"]["n"]))
+    router.subscribe("heartbeat", batch_subscriber)
+
+    with QueuedTelemetryBus(router, batch_size=8) as bus:
+        assert all(_publish(bus, count=50))
+        assert bus.flush(timeout=5)
+        metrics = bus.get_metrics()
+
+    assert seen == list(range(50))
+    assert [n for batch in batch_subscriber.batches for n in batch] == list(range(50))
+    assert max(len(batch) for batch in batch_subscriber.batches) <= 8
+    assert metrics["kinds"]["heartbeat"]["delivered"] == 50
+    assert metrics["kinds"]["heartbeat"]["publish_latency_ms"]["count"] == 50
+
+
+def _gated_bus(router, **options):
+    """Bus whose subscriber blocks until ``release`` is set, so the queue fills up."""
+    release = threading.Event()
+    started = threading.Event()
+    delivered = []
+
+    def handler(envelope):
+        started.set()
+        release.wait(5)
+        delivered.append(envelope["payload"]["n"])
+
+    router.register("external", handler)
+    bus = QueuedTelemetryBus(router, max_queue_size=2, batch_size=1, **options)
+    _publish(bus, kind="external")
+    assert started.wait(5)
+    return bus, release, delivered
+
+
+def test_drop_policies_bound_the_queue():
+    bus, release, delivered = _gated_bus(TelemetryRouter())
+    assert _publish(bus, kind="external", count=4)[2:] == [False, False]
+    release.set()
+    bus.close()
+    assert delivered == [0, 0, 1]
+    assert bus.get_metrics()["dropped"] == 2
+
+    bus, release, delivered = _gated_bus(TelemetryRouter(), overflow="drop_oldest")
+    assert all(_publish(bus, kind="external", count=4))
+    release.set()
+    bus.close()
+    assert delivered == [0, 2, 3]
+
+
+def test_block_policy_waits_then_times_out():
+    bus, release, delivered = _gated_bus(TelemetryRouter(), overflow="block", block_timeout=0.05)
+    assert _publish(bus, kind="external", count=3) == [True, True, False]
+    assert bus.get_metrics()["kinds"]["external"]["queue_depth"] == 2
+    release.set()
+    bus.close()
+    assert delivered == [0, 0, 1]
+
+
+def test_handler_errors_are_isolated():
+    router = TelemetryRouter()
+    router.register("internal", lambda envelope: 1 / 0)
+    healthy = _Recorder()
+    router.subscribe("internal", healthy)
+
+    with QueuedTelemetryBus(router) as bus:
+        _publish(bus, kind="internal", count=3)
+        bus.flush(timeout=5)
+        assert bus.get_metrics()["kinds"]["internal"]["handler_errors"] == 3
+    assert sum(healthy.batches, []) == [0, 1, 2]
+
+
+def test_rejects_unknown_kinds_and_policies():
+    with pytest.raises(ValueError):
+        QueuedTelemetryBus(overflow="spill")
+    bus = QueuedTelemetryBus()
+    with pytest.raises(KeyError):
+        _publish(bus, kind="unknown")
+    bus.close()
+
+
+def test_publisher_may_reuse_payload_and_metadata_after_publish():
+    router = TelemetryRouter()
+    seen = []
+    router.register("heartbeat", lambda envelope: seen.append((envelope["payload"]["n"], envelope["metadata"]["seq"])))
+    release = threading.Event()
+    router.subscribe("heartbeat", lambda envelope: release.wait(5))
+
+    payload, metadata = {"n": 0}, {"seq": 0}
+    with QueuedTelemetryBus(router) as bus:
+        for n in range(3):
+            payload["n"], metadata["seq"] = n, n
+            bus.publish(kind="heartbeat", source="guardian", event_type="beat", payload=payload, metadata=metadata)
+        payload.clear()
+        metadata.clear()
+        release.set()
+        assert bus.flush(timeout=5)
+
+    assert seen == [(0, 0), (1, 1), (2, 2)]
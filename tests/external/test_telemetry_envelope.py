@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from spiralos.core.external.coercion import coerce_utc_timestamp
+from spiralos.core.telemetry.bus import TelemetryBus, TelemetryEnvelope
+from spiralos.core.telemetry.router import TelemetryRouter
+
+FIXED_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def test_handlers_receive_a_read_only_view_without_copies():
+    payload = {"count": 1}
+    received = []
+    router = TelemetryRouter()
+    router.register("internal", received.append)
+
+    TelemetryBus(router).publish(kind="internal", source="core", event_type="health", payload=payload)
+    envelope = received[0]
+
+    assert isinstance(envelope, TelemetryEnvelope)
+    assert envelope.payload is payload
+    assert envelope["payload"] == payload and envelope["metadata"] == {}
+    with pytest.raises(TypeError):
+        envelope["payload"]["count"] = 2
+    with pytest.raises(AttributeError):
+        envelope.extra = True
+    with pytest.raises(KeyError):
+        envelope["missing"]
+
+
+def test_as_dict_is_a_detached_copy():
+    envelope = TelemetryEnvelope("heartbeat", "guardian", "beat", {"n": 1}, FIXED_NOW, {"seq": 3})
+    snapshot = envelope.as_dict()
+    snapshot["payload"]["n"] = 2
+
+    assert dict(envelope) == {**snapshot, "payload": {"n": 1}}
+    assert envelope.payload == {"n": 1}
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (FIXED_NOW, FIXED_NOW),
+        (FIXED_NOW.astimezone(timezone(timedelta(hours=2))), FIXED_NOW),
+        (FIXED_NOW.replace(tzinfo=None), FIXED_NOW),
+        (1735689600, FIXED_NOW),
+        (1735689600.0, FIXED_NOW),
+        (1735689600000, FIXED_NOW),
+        ("1735689600", FIXED_NOW),
+        ("2025-01-01T00:00:00Z", FIXED_NOW),
+        (None, FIXED_NOW),
+    ],
+)
+def test_coercion_fast_paths_match_general_rules(value, expected):
+    coerced = coerce_utc_timestamp(value, now=FIXED_NOW)
+    assert coerced == expected and coerced.tzinfo is not None
+
+
+def test_aware_datetimes_are_returned_unchanged():
+    assert coerce_utc_timestamp(FIXED_NOW) is FIXED_NOW
@@ -0,0 +1,129 @@
+import threading
+import time
+import uuid
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from holoeconomy.mint_writer import MintEventWriter
+from holoeconomy.scarcoin import ScarCoinMintingEngine
+
+
+def _mint(engine, wallet):
+    return engine.mint_scarcoin(
+        transmutation_id=str(uuid.uuid4()),
+        scarindex_before=Decimal("0.65"),
+        scarindex_after=Decimal("0.80"),
+        transmutation_efficiency=Decimal("0.95"),
+        owner_address=wallet,
+        oracle_signatures=["oracle_1", "oracle_2"],
+    )
+
+
+def test_mints_are_grouped_into_bulk_inserts():
+    client = MagicMock()
+    writer = MintEventWriter(client=client, batch_size=10, flush_interval=5.0)
+    engine = ScarCoinMintingEngine(mint_writer=writer)
+
+    coins = [_mint(engine, "wallet_a") for _ in range(25)]
+    assert engine.flush_mint_events(timeout=5.0)
+    writer.close(timeout=5.0)
+
+    inserted = [call.args[0] for call in client.table.return_value.insert.call_args_list]
+    assert [len(batch) for batch in inserted] == [10, 10, 5]
+    assert [row["id"] for batch in inserted for row in batch] == [coin.id for coin in coins]
+
+    metrics = writer.get_metrics()
+    assert metrics["written"] == 25
+    assert metrics["queue_depth"] == 0
+    assert metrics["flush_count"] == 3
+
+
+def test_failed_batches_retry_then_park():
+    client = MagicMock()
+    client.table.return_value.insert.return_value.execute.side_effect = RuntimeError("network down")
+    flushes = []
+    writer = MintEventWriter(
+        client=client,
+        batch_size=2,
+        flush_interval=0.01,
+        max_retries=2,
+        backoff_base=0.001,
+        on_flush=lambda rows, latency, ok: flushes.append((len(rows), ok)),
+    )
+
+    writer.submit({"id": "a"})
+    writer.submit({"id": "b"})
+    assert writer.flush(timeout=5.0)
+
+    assert client.table.return_value.insert.return_value.execute.call_count == 3
+    assert writer.retries == 2
+    assert writer.failed_rows == [{"id": "a"}, {"id": "b"}]
+    assert flushes == [(2, False)]
+    writer.close()
+
+
+def test_full_queue_drops_when_not_blocking():
+    release = threading.Event()
+    client = MagicMock()
+    client.table.return_value.insert.return_value.execute.side_effect = lambda: release.wait(5.0)
+    writer = MintEventWriter(client=client, batch_size=1, flush_interval=0.01, max_queue_size=1, block_when_full=False)
+
+    results = [writer.submit({"id": str(i)}) for i in range(5)]
+    assert writer.is_backpressured() or writer.dropped
+    assert results.count(False) == writer.dropped
+    assert writer.dropped >= 1
+
+    release.set()
+    writer.close(timeout=5.0)
+
+
+def test_full_queue_drops_by_default_without_blocking():
+    release = threading.Event()
+    client = MagicMock()
+    client.table.return_value.insert.return_value.execute.side_effect = lambda: release.wait(5.0)
+    writer = MintEventWriter(client=client, batch_size=1, flush_interval=0.01, max_queue_size=1)
+
+    started = time.monotonic()
+    results = [writer.submit({"id": str(i)}) for i in range(5)]
+    assert time.monotonic() - started < 1.0
+    assert results.count(False) == writer.dropped >= 1
+
+    release.set()
+    assert writer.close(timeout=5.0)
+
+
+def test_close_honours_timeout_and_engine_refuses_to_mint_after_close():
+    release = threading.Event()
+    client = MagicMock()
+    client.table.return_value.insert.return_value.execute.side_effect = lambda: release.wait(5.0)
+    writer = MintEventWriter(client=client, batch_size=1, flush_interval=0.01, max_queue_size=1)
+    engine = ScarCoinMintingEngine(mint_writer=writer)
+    _mint(engine, "wallet_a")
+    _mint(engine, "wallet_a")
+
+    started = time.monotonic()
+    assert not writer.close(timeout=0.1)
+    assert time.monotonic() - started < 1.0
+
+    supply = engine.total_supply
+    with pytest.raises(RuntimeError):
+        _mint(engine, "wallet_a")
+    assert engine.total_supply == supply
+    release.set()
+
+
+def test_flush_after_close_returns_immediately():
+    client = MagicMock()
+    writer = MintEventWriter(client=client, batch_size=10, flush_interval=5.0)
+    writer.submit({"id": "a"})
+    assert writer.close(timeout=5.0)
+
+    # Nothing consumes the queue after close; flush must not wait on it
+    results = []
+    flusher = threading.Thread(target=lambda: results.append(writer.flush()), daemon=True)
+    flusher.start()
+    flusher.join(2.0)
+    assert results == [True]
+    assert writer.written == 1
@@ -0,0 +1,70 @@
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from holoeconomy.scarcoin import ScarCoinMintingEngine, ScarCoinMintRequest
+
+SIGS = ["oracle_1", "oracle_2"]
+
+
+def _requests():
+    return [
+        ScarCoinMintRequest("t1", Decimal("0.65"), Decimal("0.80"), Decimal("0.95"), "wallet_a", SIGS),
+        ScarCoinMintRequest("t2", Decimal("0.80"), Decimal("0.70"), Decimal("0.95"), "wallet_a", SIGS),
+        ScarCoinMintRequest("t3", Decimal("0.50"), Decimal("0.90"), Decimal("0.50"), "wallet_b", SIGS),
+        ScarCoinMintRequest("t4", Decimal("0.50"), Decimal("0.90"), Decimal("0.50"), "wallet_b", ["oracle_1"]),
+        ScarCoinMintRequest("t5", Decimal("0.500"), Decimal("0.505"), Decimal("0.90"), "wallet_a", SIGS),
+        ScarCoinMintRequest("t6", Decimal("0.10"), Decimal("0.95"), Decimal("1.00"), "wallet_a", SIGS),
+    ]
+
+
+@pytest.fixture
+def supabase(monkeypatch):
+    client = MagicMock()
+    monkeypatch.setattr("core.db.get_supabase", lambda: client)
+    return client
+
+
+def test_batch_matches_sequential_minting(supabase):
+    sequential = ScarCoinMintingEngine()
+    expected = [
+        sequential.mint_scarcoin(
+            transmutation_id=r.transmutation_id,
+            scarindex_before=r.scarindex_before,
+            scarindex_after=r.scarindex_after,
+            transmutation_efficiency=r.transmutation_efficiency,
+            owner_address=r.owner_address,
+            oracle_signatures=r.oracle_signatures,
+        )
+        for r in _requests()
+    ]
+
+    batched = ScarCoinMintingEngine()
+    results = batched.mint_batch(_requests())
+
+    assert [r.minted for r in results] == [coin is not None for coin in expected]
+    assert [r.reason for r in results] == [
+        "minted",
+        "proof_of_ache_failed",
+        "minted",
+        "oracle_consensus_not_reached",
+        "below_min_delta_c",
+        "minted",
+    ]
+    assert [r.coin.coin_value for r in results if r.coin] == [c.coin_value for c in expected if c]
+
+    for address in ("wallet_a", "wallet_b"):
+        assert batched.get_wallet(address).balance == sequential.get_wallet(address).balance
+        assert batched.get_wallet(address).transaction_count == sequential.get_wallet(address).transaction_count
+    assert batched.total_supply == sequential.total_supply
+    assert batched.minting_count == sequential.minting_count == 3
+
+
+def test_batch_persists_in_one_bulk_insert(supabase):
+    engine = ScarCoinMintingEngine()
+    results = engine.mint_batch(_requests())
+
+    insert = supabase.table.return_value.insert
+    assert insert.call_count == 1
+    assert [row["id"] for row in insert.call_args.args[0]] == [r.coin.id for r in results if r.coin]
@@ -0,0 +1,49 @@
+from decimal import Decimal
+
+from holoeconomy.empathy_market import EmpathyMarket, ResonanceEvent
+from holoeconomy.scarcoin import ScarCoinMintingEngine, ScarCoinMintRequest
+
+
+def test_scarcoin_running_aggregates_track_mints_and_burns(monkeypatch):
+    monkeypatch.setattr(ScarCoinMintingEngine, "record_mint_event", lambda self, coin: None)
+    monkeypatch.setattr(ScarCoinMintingEngine, "record_mint_events", lambda self, coins: None)
+    engine = ScarCoinMintingEngine()
+
+    coins = [
+        engine.mint_scarcoin(f"t{i}", Decimal("0.6"), Decimal("0.8"), Decimal("0.9"), owner, ["o1", "o2"])
+        for i, owner in enumerate(["alice", "alice", "bob"])
+    ]
+    engine.mint_batch([ScarCoinMintRequest("t9", Decimal("0.6"), Decimal("0.8"), Decimal("0.9"), "bob", ["o1", "o2"])])
+    engine.burn_scarcoin(coins[0].id)
+
+    snapshot = engine.get_supply_snapshot()
+    assert snapshot.total_coins == 4
+    assert snapshot.burned_coins == 1 == sum(1 for c in engine.coins.values() if c.burned)
+    assert snapshot.active_coins == 3
+    assert engine.get_owner_coin_count("alice") == 1
+    assert engine.get_owner_coin_count("alice", include_burned=True) == 2
+    assert engine.get_owner_coin_count("bob") == 2
+    assert engine.get_supply_stats()["burned_coins"] == 1
+
+
+def test_empathy_market_snapshot_tracks_roles_and_burns():
+    market = EmpathyMarket(enable_burn_validation=False)
+    tokens = []
+    for _ in range(3):
+        event = ResonanceEvent(
+            speaker_id="speaker",
+            listener_id="listener",
+            semantic_alignment=Decimal("0.95"),
+            emotional_resonance=Decimal("0.95"),
+            contextual_depth=Decimal("0.95"),
+        )
+        tokens.append(market.mint_emp_token(event, ["w1", "w2"]))
+    market.burn_emp_token(tokens[0].id, Decimal("1"), [], {})
+
+    snapshot = market.get_market_snapshot()
+    assert snapshot.total_tokens == 3
+    assert snapshot.total_burns == 1
+    assert snapshot.emp_by_role["speaker"] == snapshot.emp_by_role["listener"] == market.total_emp_minted / 2
+    assert snapshot.emp_by_role["witness"] == market.total_emp_minted * Decimal("0.1")
+    assert market.get_participant_token_count("speaker") == 3
+    assert market.get_market_stats()["total_burns"] == 1
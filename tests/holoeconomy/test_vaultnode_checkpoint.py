@@ -0,0 +1,54 @@
+import hashlib
+
+from holoeconomy.vaultnode import VaultEvent, VaultNode
+
+SIGNATURES = {
+    "chief_oracle_sigma": hashlib.sha256(b"chief_oracle_sigma").hexdigest(),
+    "senior_oracle_alpha": hashlib.sha256(b"senior_oracle_alpha").hexdigest(),
+    "senior_oracle_beta": hashlib.sha256(b"senior_oracle_beta").hexdigest(),
+}
+
+
+def _grow(vault, blocks, events_per_block=2):
+    for i in range(blocks):
+        for j in range(events_per_block):
+            vault.add_event(VaultEvent(event_type="scarcoin_minted", event_data={"block": i, "n": j}))
+        vault.create_block(oracle_signatures=SIGNATURES)
+
+
+def test_verify_chain_resumes_from_checkpoint():
+    vault = VaultNode(vault_id="test-vault")
+    _grow(vault, 3)
+
+    assert vault.verify_chain()
+    first = dict(vault.checkpoint)
+    assert first["block_number"] == 3
+
+    _grow(vault, 2)
+    assert vault.verify_chain()
+    assert vault.checkpoint["block_number"] == 5
+    expected = hashlib.sha256((first["checkpoint_hash"] + vault.blocks[5].calculate_hash()).encode()).hexdigest()
+    assert vault.checkpoint["checkpoint_hash"] == expected
+
+
+def test_full_audit_detects_tampering_behind_checkpoint():
+    vault = VaultNode(vault_id="test-vault")
+    _grow(vault, 4)
+    assert vault.verify_chain()
+
+    vault.blocks[2].add_event(VaultEvent(event_type="forged"))
+    vault.blocks[2].build_merkle_tree()
+
+    assert not vault.verify_chain(full=True)
+    assert vault.checkpoint is None
+
+
+def test_chain_stats_use_running_event_total():
+    vault = VaultNode(vault_id="test-vault")
+    _grow(vault, 3, events_per_block=4)
+
+    stats = vault.get_chain_stats()
+    assert stats["total_blocks"] == 4
+    assert stats["total_events"] == 13
+    assert stats["chain_valid"] is True
+    assert stats["verified_through"] == 3
@@ -0,0 +1,88 @@
+import pytest
+
+from holoeconomy.vaultnode import (
+    MerkleTree,
+    VaultBlock,
+    VaultEvent,
+    hash_events,
+    seal_emp_minted,
+    seal_witness_event,
+)
+
+
+def _events(count):
+    return [VaultEvent(event_type="event", event_data={"data": i}) for i in range(count)]
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 7, 16, 33])
+def test_every_leaf_has_valid_proof(count):
+    events = _events(count)
+    tree = MerkleTree(events)
+    root = tree.get_root_hash()
+
+    assert len(tree) == count
+    for index, leaf in enumerate(hash_events(events)):
+        proof = tree.get_proof(index)
+        assert len(proof) == len(tree.levels) - 1
+        assert MerkleTree.verify_proof(leaf, proof, root)
+
+
+def test_tampered_proof_and_unknown_event_fail():
+    events = _events(5)
+    tree = MerkleTree(events)
+    proof = tree.get_proof(2)
+
+    sibling, is_left = proof[0]
+    tampered = [(sibling[::-1], is_left)] + proof[1:]
+    assert not MerkleTree.verify_proof(events[2].hash(), tampered, tree.get_root_hash())
+    assert not tree.verify_event(VaultEvent(event_type="outsider"))
+
+    with pytest.raises(IndexError):
+        tree.get_proof(5)
+
+
+def test_from_leaf_hashes_matches_event_tree():
+    events = _events(9)
+    assert MerkleTree.from_leaf_hashes(hash_events(events)).get_root_hash() == MerkleTree(events).get_root_hash()
+
+
+def test_block_verifies_sealed_events():
+    block = VaultBlock(block_number=1)
+    witness = seal_witness_event(claim_id="c1", witness_id="w1", status="verified")
+    minted = seal_emp_minted(claim_id="c1", user_id="u1", amount=10)
+    block.add_event(witness)
+    block.add_event(minted)
+    block.build_merkle_tree()
+
+    assert block.verify_event(witness)
+    assert block.verify_event(minted)
+    assert block.get_event_proof(VaultEvent(event_type="outsider")) is None
+
+
+def test_tampered_event_on_deserialized_block_fails():
+    block = VaultBlock(block_number=1)
+    for event in _events(4):
+        block.add_event(event)
+    block.build_merkle_tree()
+    sealed_root = block.merkle_root
+
+    loaded = VaultBlock.from_dict(block.to_dict())
+    assert loaded.verify_event(loaded.events[1])
+
+    loaded = VaultBlock.from_dict(block.to_dict())
+    loaded.events[1].event_data["data"] = "forged"
+    assert not loaded.verify_event(loaded.events[1])
+    assert loaded.merkle_root == sealed_root
+
+    forged = VaultEvent(event_type="event", event_data={"data": "late"})
+    loaded.add_event(forged)
+    assert not loaded.verify_event(forged)
+    assert loaded.merkle_root == sealed_root
+
+
+def test_unsealed_block_verifies_nothing():
+    block = VaultBlock(block_number=1)
+    event = _events(1)[0]
+    block.add_event(event)
+    assert not block.verify_event(event)
+    assert block.merkle_root == ""
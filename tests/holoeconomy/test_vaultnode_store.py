@@ -0,0 +1,135 @@
+import hashlib
+import os
+
+from holoeconomy.vaultnode import VaultEvent, VaultNode
+from holoeconomy.vaultnode_store import INDEX_ENTRY, INDEX_FILENAME, VaultSegmentStore
+
+SIGNATURES = {
+    "chief_oracle_sigma": hashlib.sha256(b"chief_oracle_sigma").hexdigest(),
+    "senior_oracle_alpha": hashlib.sha256(b"senior_oracle_alpha").hexdigest(),
+    "senior_oracle_beta": hashlib.sha256(b"senior_oracle_beta").hexdigest(),
+}
+
+
+def _grow(vault, blocks):
+    for i in range(blocks):
+        vault.add_event(VaultEvent(event_type="scarcoin_minted", event_data={"block": i}))
+        vault.create_block(oracle_signatures=SIGNATURES)
+
+
+def test_vaultnode_survives_restart(tmp_path):
+    with VaultSegmentStore(str(tmp_path), max_segment_bytes=1024) as store:
+        vault = VaultNode(vault_id="test-vault", store=store)
+        _grow(vault, 10)
+        hashes = [block.calculate_hash() for block in vault.blocks]
+        assert store.segment_count > 1
+
+    with VaultSegmentStore(str(tmp_path), max_segment_bytes=1024) as store:
+        vault = VaultNode(vault_id="test-vault", store=store)
+        assert len(vault.blocks) == 11
+        assert vault.total_events == 11
+        assert [block.calculate_hash() for block in vault.blocks] == hashes
+        assert vault.get_block(7).events[0].event_data == {"block": 6}
+        assert vault.verify_chain(full=True)
+
+        _grow(vault, 1)
+        assert vault.get_latest_block().previous_hash == hashes[-1]
+
+
+def test_recovery_drops_torn_tail(tmp_path):
+    with VaultSegmentStore(str(tmp_path)) as store:
+        vault = VaultNode(vault_id="test-vault", store=store)
+        _grow(vault, 3)
+
+    # Simulate a crash mid-append: half an index entry and stray payload bytes
+    with open(os.path.join(tmp_path, INDEX_FILENAME), "ab") as handle:
+        handle.write(b"\x00" * (INDEX_ENTRY.size // 2))
+    with open(os.path.join(tmp_path, "segment-000000.log"), "ab") as handle:
+        handle.write(b'{"partial":')
+
+    with VaultSegmentStore(str(tmp_path)) as store:
+        assert len(store) == 4
+        vault = VaultNode(vault_id="test-vault", store=store)
+        _grow(vault, 1)
+        assert vault.verify_chain(full=True)
+        assert store[-1].block_number == 4
+
+
+def test_blocks_are_cached_and_written_back_explicitly(tmp_path):
+    with VaultSegmentStore(str(tmp_path), cache_size=4) as store:
+        vault = VaultNode(vault_id="test-vault", store=store)
+        _grow(vault, 10)
+
+        block = store[3]
+        assert store[3] is block
+        block.add_event(VaultEvent(event_type="annotation", event_data={"note": "late"}))
+        block.build_merkle_tree()
+        store.update(block)
+        assert store.total_events == 12
+
+        for i in range(len(store)):
+            store[i]  # cycle the cache
+        assert store.cache_hits and store.cache_misses
+
+    with VaultSegmentStore(str(tmp_path), cache_size=4) as store:
+        reloaded = store[3]
+        assert [event.event_type for event in reloaded.events][-1] == "annotation"
+        assert reloaded.merkle_root == block.merkle_root
+        assert reloaded.verify_event(reloaded.events[-1])
+        assert store.total_events == 12
+        assert store[9].events[0].event_data == {"block": 8}
+
+        vault = VaultNode(vault_id="test-vault", store=store)
+        _grow(vault, 1)
+        assert len(store) == 12
+
+
+def test_checkpoint_survives_restart(tmp_path):
+    with VaultSegmentStore(str(tmp_path)) as store:
+        vault = VaultNode(vault_id="test-vault", store=store)
+        _grow(vault, 5)
+        assert vault.verify_chain()
+        checkpoint = vault.checkpoint
+
+    with VaultSegmentStore(str(tmp_path)) as store:
+        vault = VaultNode(vault_id="test-vault", store=store)
+        assert vault.checkpoint == checkpoint
+        assert vault.get_chain_stats()["verified_through"] == 5
+
+
+def test_reopen_after_updating_latest_block(tmp_path):
+    with VaultSegmentStore(str(tmp_path)) as store:
+        vault = VaultNode(vault_id="test-vault", store=store)
+        _grow(vault, 3)
+        latest = store[-1]
+        latest.metadata["annotated"] = True
+        store.update(latest)
+
+    with VaultSegmentStore(str(tmp_path)) as store:
+        assert store[-1].metadata == {"annotated": True}
+        vault = VaultNode(vault_id="test-vault", store=store)
+        _grow(vault, 2)
+
+    with VaultSegmentStore(str(tmp_path)) as store:
+        assert len(store) == 6
+        assert [store[i].block_number for i in range(6)] == list(range(6))
+        assert store[3].metadata == {"annotated": True}
+
+
+def test_failed_audit_clears_persisted_checkpoint(tmp_path):
+    with VaultSegmentStore(str(tmp_path)) as store:
+        vault = VaultNode(vault_id="test-vault", store=store)
+        _grow(vault, 4)
+        assert vault.verify_chain()
+
+        forged = store[2]
+        forged.add_event(VaultEvent(event_type="forged"))
+        forged.build_merkle_tree()
+        store.update(forged)
+        assert not vault.verify_chain(full=True)
+
+    # The stale checkpoint must not let incremental verification skip the forged block
+    with VaultSegmentStore(str(tmp_path)) as store:
+        vault = VaultNode(vault_id="test-vault", store=store)
+        assert vault.checkpoint is None
+        assert not vault.verify_chain()
@@ -0,0 +1,112 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from liquidity_mirror import fixed_point
+from liquidity_mirror.scarmarket_dex import FixedPointLiquidityPool, LiquidityPool, ScarMarketDEX, TokenType
+
+ULP = Decimal("1E-18")
+
+
+def _pools(reserve_a, reserve_b, fee_rate=Decimal("0.003")):
+    kwargs = dict(token_a_id="a", token_b_id="b", reserve_a=reserve_a, reserve_b=reserve_b, fee_rate=fee_rate)
+    return LiquidityPool(**kwargs), FixedPointLiquidityPool(**kwargs)
+
+
+@pytest.mark.parametrize("value", ["0", "1", "0.000000000000000001", "123.456", "-42.5", "1E+30"])
+def test_round_trip_is_exact(value):
+    assert fixed_point.from_fixed(fixed_point.to_fixed(Decimal(value))) == Decimal(value)
+
+
+def test_to_fixed_truncates_toward_zero():
+    assert fixed_point.to_fixed(Decimal("1.0000000000000000019")) == fixed_point.SCALE + 1
+    assert fixed_point.to_fixed(Decimal("-1.0000000000000000019")) == -(fixed_point.SCALE + 1)
+
+
+def test_random_swaps_match_decimal_within_one_ulp():
+    rng = random.Random(42)
+    for _ in range(500):
+        reserve_a = Decimal(rng.randint(1, 10**9)) / 1000
+        reserve_b = Decimal(rng.randint(1, 10**9)) / 1000
+        amount = Decimal(rng.randint(1, 10**7)) / 1000
+        input_is_a = rng.random() < 0.5
+        decimal_pool, fixed_pool = _pools(reserve_a, reserve_b)
+
+        expected = decimal_pool.calculate_output_amount(amount, input_is_a)
+        actual = fixed_pool.calculate_output_amount(amount, input_is_a)
+        assert abs(expected - actual) <= ULP
+        # Rounded in favour of the pool
+        assert actual <= expected.quantize(ULP) + ULP
+
+        expected_slip = decimal_pool.calculate_slippage(amount, actual, input_is_a)
+        actual_slip = fixed_pool.calculate_slippage(amount, actual, input_is_a)
+        assert abs(expected_slip - actual_slip) <= ULP
+
+
+def test_apply_swap_keeps_integer_reserves():
+    _, pool = _pools(Decimal("1000"), Decimal("10"))
+    amount_out = pool.calculate_output_amount(Decimal("100"), True)
+    pool.apply_swap(Decimal("100"), amount_out, True)
+
+    assert pool.reserve_a_fx == 1100 * fixed_point.SCALE
+    assert pool.reserve_b == Decimal("10") - amount_out
+    assert pool.total_volume_b == amount_out
+
+
+def test_dex_fixed_point_pool_executes_swaps():
+    dex = ScarMarketDEX()
+    scar = dex.register_token("SCAR", "ScarCoin", TokenType.FUNGIBLE).token_id
+    vault = dex.register_token("VAULT", "VaultNode Asset", TokenType.SEMI_FUNGIBLE).token_id
+    dex.mint_tokens(scar, "alice", Decimal("100000"))
+    dex.mint_tokens(vault, "alice", Decimal("1000"))
+    dex.mint_tokens(scar, "bob", Decimal("1000"))
+
+    pool = dex.create_liquidity_pool(scar, vault, Decimal("10000"), Decimal("100"), "alice", fixed_point_math=True)
+    trade = dex.execute_swap("bob", scar, vault, Decimal("100"))
+
+    assert isinstance(pool, FixedPointLiquidityPool)
+    assert trade is not None and trade.amount_out > 0
+    assert dex.get_balance("bob", vault) == trade.amount_out
+    assert pool.reserve_b == Decimal("100") - trade.amount_out
+
+
+def test_dex_swaps_settle_in_integers_and_enforce_limits(monkeypatch):
+    dex = ScarMarketDEX()
+    scar = dex.register_token("SCAR", "ScarCoin", TokenType.FUNGIBLE).token_id
+    vault = dex.register_token("VAULT", "VaultNode Asset", TokenType.SEMI_FUNGIBLE).token_id
+    dex.mint_tokens(scar, "alice", Decimal("100000"))
+    dex.mint_tokens(vault, "alice", Decimal("1000"))
+    dex.mint_tokens(scar, "bob", Decimal("1000"))
+    pool = dex.create_liquidity_pool(scar, vault, Decimal("10000"), Decimal("100"), "alice", fixed_point_math=True)
+
+    # The DEX must not fall back to the Decimal pool API
+    monkeypatch.setattr(pool, "calculate_output_amount", None)
+    monkeypatch.setattr(pool, "calculate_slippage", None)
+
+    expected_fx = pool.calculate_output_amount_fx(50 * fixed_point.SCALE, True)
+    trade = dex.execute_swap("bob", scar, vault, Decimal("50"))
+    assert trade.amount_out == fixed_point.from_fixed(expected_fx)
+    assert pool.reserve_b_fx == 100 * fixed_point.SCALE - expected_fx
+    assert pool.total_volume_a == Decimal("50") and pool.total_volume_b_fx == expected_fx
+
+    reserves = (pool.reserve_a_fx, pool.reserve_b_fx)
+    assert dex.execute_swap("bob", scar, vault, Decimal("50"), min_amount_out=Decimal("1")) is None
+    assert dex.execute_swap("bob", scar, vault, Decimal("500"), max_slippage=Decimal("0.1")) is None
+    assert (pool.reserve_a_fx, pool.reserve_b_fx) == reserves
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1e100", 10**118),
+        ("-1.5e-30", 0),
+        (
+            "123456789012345678901234567890.1234567890123456789012345",
+            123456789012345678901234567890123456789012345678,
+        ),
+    ],
+)
+def test_conversions_are_exact_beyond_context_precision(value, expected):
+    assert fixed_point.to_fixed(Decimal(value)) == expected
+    assert fixed_point.from_fixed(expected) == Decimal(f"{expected}E-18")
@@ -0,0 +1,89 @@
+from decimal import Decimal
+
+import pytest
+
+from liquidity_mirror.scarmarket_dex import ScarMarketDEX, SwapRequest, TokenType
+
+
+def _build_market():
+    dex = ScarMarketDEX()
+    scar = dex.register_token("SCAR", "ScarCoin", TokenType.FUNGIBLE).token_id
+    vault = dex.register_token("VAULT", "VaultNode Asset", TokenType.SEMI_FUNGIBLE).token_id
+    glyph = dex.register_token("GLYPH", "Glyph", TokenType.FUNGIBLE).token_id
+    emp = dex.register_token("EMP", "Empathy", TokenType.NON_FUNGIBLE, transferable=False).token_id
+
+    for token_id in (scar, vault, glyph, emp):
+        dex.mint_tokens(token_id, "alice", Decimal("100000"))
+        dex.mint_tokens(token_id, "bob", Decimal("1000"))
+
+    dex.create_liquidity_pool(scar, vault, Decimal("10000"), Decimal("100"), "alice")
+    dex.create_liquidity_pool(vault, glyph, Decimal("100"), Decimal("5000"), "alice")
+    dex.create_liquidity_pool(scar, glyph, Decimal("10000"), Decimal("4000"), "alice")
+    dex.create_liquidity_pool(scar, emp, Decimal("1000"), Decimal("1000"), "alice")
+    return dex, scar, vault, glyph, emp
+
+
+@pytest.fixture
+def market():
+    return _build_market()
+
+
+def _swaps(scar, vault, emp):
+    return [
+        SwapRequest("bob", scar, vault, Decimal("10")),
+        SwapRequest("bob", vault, scar, Decimal("0.05")),
+        SwapRequest("bob", scar, emp, Decimal("1")),  # soul-bound, rejected
+        SwapRequest("carol", scar, vault, Decimal("1")),  # no balance, rejected
+        SwapRequest("bob", scar, vault, Decimal("20")),
+    ]
+
+
+def test_batch_reproduces_sequential_execute_swap():
+    dex, scar, vault, _, emp = _build_market()
+    single = [
+        dex.execute_swap(s.trader_address, s.token_in_id, s.token_out_id, s.amount_in)
+        for s in _swaps(scar, vault, emp)
+    ]
+
+    bdex, bscar, bvault, _, bemp = _build_market()
+    batched = bdex.execute_swap_batch(_swaps(bscar, bvault, bemp))
+
+    assert [t is None for t in batched] == [False, False, True, True, False]
+    assert [t.amount_out if t else None for t in batched] == [t.amount_out if t else None for t in single]
+    assert bdex.get_balance("bob", bvault) == dex.get_balance("bob", vault)
+    assert bdex.get_pool(bscar, bvault).total_trades == 3
+    assert len(bdex.trades) == 3
+
+
+def test_batch_can_skip_trade_records(market):
+    dex, scar, vault, _, emp = market
+    results = dex.execute_swap_batch(_swaps(scar, vault, emp), record_trades=False)
+
+    assert sum(1 for t in results if t) == 3
+    assert len(dex.trades) == 0
+    assert dex.get_ohlcv(scar, vault)[-1].trades == 3
+    assert dex.total_trades == 3
+
+
+def test_quote_route_is_read_only(market):
+    dex, scar, vault, glyph, _ = market
+    before = {pid: (p.reserve_a, p.reserve_b) for pid, p in dex.pools.items()}
+
+    quote = dex.quote_route([scar, vault, glyph], Decimal("50"))
+    first_pool = dex.get_pool(scar, vault)
+    direct = first_pool.calculate_output_amount(Decimal("50"), scar == first_pool.token_a_id)
+
+    assert quote.hop_amounts[1] == direct
+    assert quote.amount_out == quote.hop_amounts[-1] > 0
+    assert {pid: (p.reserve_a, p.reserve_b) for pid, p in dex.pools.items()} == before
+    assert dex.quote_route([scar, vault, scar], Decimal("50")).amount_out < Decimal("50")
+
+
+def test_find_best_route_prefers_higher_output(market):
+    dex, scar, vault, glyph, emp = market
+    best = dex.find_best_route(scar, glyph, Decimal("100"))
+
+    direct = dex.quote_route([scar, glyph], Decimal("100"))
+    via_vault = dex.quote_route([scar, vault, glyph], Decimal("100"))
+    assert best.amount_out == max(direct.amount_out, via_vault.amount_out)
+    assert dex.find_best_route(scar, emp, Decimal("1")) is None
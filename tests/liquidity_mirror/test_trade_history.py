@@ -0,0 +1,159 @@
+import gc
+import weakref
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from liquidity_mirror import trade_history
+from liquidity_mirror.trade_history import Trade, TradeHistory
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _trade(i, pool_id="pool-1", trader="bob"):
+    return Trade(
+        trade_id=f"t{i}",
+        timestamp=T0 + timedelta(seconds=i),
+        pool_id=pool_id,
+        trader_address=trader,
+        token_in_id="A",
+        token_out_id="B",
+        amount_in=Decimal("10"),
+        amount_out=Decimal(i + 1),
+        price=Decimal(i + 1) / 10,
+        slippage=Decimal("0.5"),
+    )
+
+
+def _fill(history, count):
+    for i in range(count):
+        history.append(_trade(i, pool_id=f"pool-{i % 2}", trader="alice" if i % 3 else "bob"), "A")
+
+
+def test_ring_stays_bounded_and_spills_in_chunks(tmp_path):
+    history = TradeHistory(capacity=10, spill_path=str(tmp_path / "trades.col"), spill_chunk_size=4)
+    _fill(history, 50)
+
+    stats = history.get_stats()
+    assert len(history) == 10
+    assert stats["spilled"] + stats["pending_spill"] == 40
+    assert stats["spill_chunks"] == 10
+    assert "t49" in history and "t0" not in history
+    assert history.get("t0") is None
+    assert history.get("t0", search_spill=True).amount_out == Decimal("1")
+
+
+def test_query_spans_both_tiers(tmp_path):
+    history = TradeHistory(capacity=10, spill_path=str(tmp_path / "trades.col"), spill_chunk_size=4)
+    _fill(history, 50)
+
+    expected = [_trade(i, f"pool-{i % 2}", "alice" if i % 3 else "bob") for i in range(50)]
+    got = history.query()
+    assert [t.to_dict() for t in got] == [t.to_dict() for t in expected]
+
+    pool_bob = history.query(pool_id="pool-0", trader_address="bob")
+    assert [t.trade_id for t in pool_bob] == [f"t{i}" for i in range(50) if i % 2 == 0 and i % 3 == 0]
+
+    window = history.query(start=T0 + timedelta(seconds=5), end=T0 + timedelta(seconds=8))
+    assert [t.trade_id for t in window] == ["t5", "t6", "t7"]
+    assert [t.trade_id for t in history.query(limit=3)] == ["t47", "t48", "t49"]
+    assert [t.trade_id for t in history.query(pool_id="pool-1", limit=12)][0] == "t27"
+
+
+def test_reopen_recovers_chunks_and_drops_torn_tail(tmp_path):
+    path = tmp_path / "trades.col"
+    history = TradeHistory(capacity=5, spill_path=str(path), spill_chunk_size=5)
+    _fill(history, 20)
+    spilled = history.spilled_count
+
+    with open(path, "ab") as handle:
+        handle.write(b"\x05\x00\x00")
+
+    reopened = TradeHistory(capacity=5, spill_path=str(path), spill_chunk_size=5)
+    assert reopened.spilled_count == spilled
+    assert [t.trade_id for t in reopened.query()] == [f"t{i}" for i in range(spilled)]
+
+
+def test_without_spill_old_trades_are_discarded():
+    history = TradeHistory(capacity=3)
+    _fill(history, 5)
+    assert history.discarded_count == 2
+    assert [t.trade_id for t in history.query()] == ["t2", "t3", "t4"]
+
+
+def test_candles_are_incremental_and_bounded():
+    history = TradeHistory(capacity=2, candle_seconds=10, max_candles=2)
+    for i in range(35):
+        history.append(_trade(i), "A")
+
+    candles = history.get_candles("pool-1")
+    # Two closed candles plus the open one
+    assert [c.bucket_start for c in candles] == [T0 + timedelta(seconds=s) for s in (10, 20, 30)]
+    first = candles[0]
+    assert (first.open, first.high, first.low, first.close) == (
+        Decimal("1.1"),
+        Decimal("2"),
+        Decimal("1.1"),
+        Decimal("2"),
+    )
+    assert first.trades == 10 and first.volume_a == Decimal("100")
+
+    reverse = Trade(
+        pool_id="pool-1",
+        timestamp=T0 + timedelta(seconds=36),
+        token_in_id="B",
+        token_out_id="A",
+        amount_in=Decimal("50"),
+        amount_out=Decimal("10"),
+    )
+    history.append(reverse, "A")
+    current = history.get_candles("pool-1")[-1]
+    assert current.close == Decimal("5")
+    assert current.volume_a == Decimal("60") and current.volume_b == sum(range(31, 36)) + 50
+
+
+def test_close_persists_partial_chunk_and_recent_trades(tmp_path):
+    path = str(tmp_path / "trades.col")
+    history = TradeHistory(capacity=5, spill_path=path, spill_chunk_size=4)
+    _fill(history, 11)
+    assert history.get_stats()["pending_spill"] == 2
+
+    history.close()
+    reopened = TradeHistory(capacity=5, spill_path=path, spill_chunk_size=4)
+    assert [t.trade_id for t in reopened.query()] == [f"t{i}" for i in range(11)]
+
+
+def test_dex_close_flushes_trade_history(tmp_path):
+    from liquidity_mirror.scarmarket_dex import ScarMarketDEX, TokenType
+
+    path = str(tmp_path / "trades.col")
+    with ScarMarketDEX(trade_capacity=3, trade_spill_path=path) as dex:
+        scar = dex.register_token("SCAR", "ScarCoin", TokenType.FUNGIBLE).token_id
+        vault = dex.register_token("VAULT", "VaultNode Asset", TokenType.FUNGIBLE).token_id
+        for token in (scar, vault):
+            dex.mint_tokens(token, "alice", Decimal("100000"))
+        dex.create_liquidity_pool(scar, vault, Decimal("10000"), Decimal("1000"), "alice")
+        trades = [dex.execute_swap("alice", scar, vault, Decimal("1")) for _ in range(7)]
+
+    assert [t.trade_id for t in TradeHistory(spill_path=path).query()] == [t.trade_id for t in trades]
+
+
+def test_open_histories_are_closed_at_exit_without_being_kept_alive(tmp_path):
+    kept = TradeHistory(capacity=4, spill_path=str(tmp_path / "kept.col"))
+    _fill(kept, 3)
+    dropped = weakref.ref(TradeHistory(capacity=4, spill_path=str(tmp_path / "dropped.col")))
+    gc.collect()
+    assert dropped() is None
+
+    trade_history._close_open_histories()
+    assert kept.get_stats()["spilled"] == 3
+    assert kept not in trade_history._open_histories
+
+
+def test_ids_with_nul_are_rejected_before_they_reach_the_spill(tmp_path):
+    history = TradeHistory(capacity=1, spill_path=str(tmp_path / "trades.col"))
+    bad = _trade(0, trader="bo\0b")
+    with pytest.raises(ValueError):
+        history.append(bad, "A")
+    assert len(history) == 0 and history.total_recorded == 0
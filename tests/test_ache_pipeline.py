@@ -0,0 +1,140 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+try:
+    from core.scarindex import CoherenceComponents
+    from core.supabase_integration import AcheEventRequest, LatencyHistogram, PersistenceResponse, SpiralOSBackend
+except ModuleNotFoundError:  # pragma: no cover - fallback when executed directly
+    REPO_ROOT = Path(__file__).resolve().parents[1]
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.append(str(REPO_ROOT))
+    from core.scarindex import CoherenceComponents
+    from core.supabase_integration import AcheEventRequest, LatencyHistogram, PersistenceResponse, SpiralOSBackend
+
+ROUND_TRIP = 0.02
+
+
+class FakeSupabase:
+    """Records calls and simulates a fixed round trip per insert."""
+
+    def __init__(self, fail_source=None):
+        self.calls = []
+        self.panic_frames = []
+        self.fail_source = fail_source
+        self.panic_manager = FakePanicManager()
+
+    async def _insert(self, table, payload):
+        self.calls.append(table)
+        await asyncio.sleep(ROUND_TRIP)
+        inserted_id = f"{table}-{len(self.calls)}"
+        return PersistenceResponse(table=table, status_code=201, inserted_id=inserted_id, payload=payload)
+
+    async def insert_ache_event(self, source, content, ache_level, metadata=None):
+        if source == self.fail_source:
+            raise RuntimeError("insert failed")
+        return await self._insert("ache_events", {"source": source, **content})
+
+    async def insert_scarindex_calculation(self, result, ache_event_id=None):
+        return await self._insert("scarindex_calculations", {"id": result.id, "ache_event_id": ache_event_id})
+
+    async def insert_vaultnode(self, **record):
+        return await self._insert("vaultnodes", record)
+
+    async def insert_panic_frame(self, event):
+        self.panic_frames.append(event)
+        return await self._insert("panic_frames", {})
+
+
+class FakePanicManager:
+    def __init__(self):
+        self.triggered = []
+
+    def should_trigger(self, scarindex):
+        return scarindex < 0.3
+
+    def trigger_panic_frame(self, scarindex, metadata=None):
+        self.triggered.append(scarindex)
+        return {"scarindex": scarindex}
+
+
+def _events(count, low_every=0):
+    for i in range(count):
+        level = 0.05 if low_every and i % low_every == 0 else 0.8
+        yield AcheEventRequest(
+            source=f"event-{i}",
+            content={"index": i},
+            ache_level=0.6,
+            coherence_components=CoherenceComponents(narrative=level, social=level, economic=level, technical=level),
+        )
+
+
+async def _collect(backend, events, **kwargs):
+    return [result async for result in backend.process_ache_events(events, **kwargs)]
+
+
+def test_pipeline_preserves_order_and_overlaps_events():
+    supabase = FakeSupabase()
+    backend = SpiralOSBackend(supabase=supabase, concurrency=10)
+
+    started = time.perf_counter()
+    results = asyncio.run(_collect(backend, _events(20, low_every=5)))
+    elapsed = time.perf_counter() - started
+
+    assert [r["ache_event"]["index"] for r in results] == list(range(20))
+    # Sequential processing would take 20 events x 3 dependent round trips
+    assert elapsed < 20 * 3 * ROUND_TRIP / 2
+    assert len(supabase.panic_manager.triggered) == 4
+    assert len(supabase.panic_frames) == 4
+
+    metrics = backend.get_pipeline_metrics()
+    assert metrics["events_processed"] == 20
+    assert metrics["stages"]["vaultnode"]["count"] == 20
+    assert metrics["stages"]["total"]["p50_ms"] >= 3 * ROUND_TRIP * 1000 * 0.9
+
+
+def test_async_source_and_dict_events():
+    async def source():
+        for event in _events(3):
+            yield vars(event)
+
+    backend = SpiralOSBackend(supabase=FakeSupabase(), concurrency=2)
+    results = asyncio.run(_collect(backend, source()))
+    assert [r["ache_event"]["source"] for r in results] == ["event-0", "event-1", "event-2"]
+
+
+def test_failures_raise_or_are_returned():
+    backend = SpiralOSBackend(supabase=FakeSupabase(fail_source="event-1"), concurrency=4)
+    results = asyncio.run(_collect(backend, _events(4), return_exceptions=True))
+
+    assert isinstance(results[1], RuntimeError)
+    assert [r["ache_event"]["index"] for i, r in enumerate(results) if i != 1] == [0, 2, 3]
+    assert backend.events_failed == 1
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(_collect(SpiralOSBackend(supabase=FakeSupabase(fail_source="event-0")), _events(3)))
+
+
+def test_failure_reaps_in_flight_events():
+    async def run():
+        backend = SpiralOSBackend(supabase=FakeSupabase(fail_source="event-0"), concurrency=4)
+        with pytest.raises(RuntimeError):
+            await _collect(backend, _events(8))
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(run()) == set()
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for ms in [0.5, 3, 3, 40, 7000]:
+        histogram.record(ms / 1000)
+
+    summary = histogram.to_dict()
+    assert summary["count"] == 5
+    assert summary["p50_ms"] == 5
+    assert summary["p99_ms"] == 7000
+    assert summary["buckets"]["<=1ms"] == 1
@@ -0,0 +1,86 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+try:
+    from core.config import SupabaseSettings
+    from core.supabase_integration import SupabaseClient
+    from core.supabase_local import LocalSupabaseClient
+except ModuleNotFoundError:  # pragma: no cover - fallback when executed directly
+    REPO_ROOT = Path(__file__).resolve().parents[1]
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.append(str(REPO_ROOT))
+    from core.config import SupabaseSettings
+    from core.supabase_integration import SupabaseClient
+    from core.supabase_local import LocalSupabaseClient
+
+
+def _supabase(local, **kwargs):
+    supabase = SupabaseClient(
+        client=local,
+        settings=SupabaseSettings(url="https://example.supabase.co", service_role_key="service-key"),
+        retry_delay=0,
+        **kwargs,
+    )
+    supabase._record_panic_frame = lambda operation, error: None
+    return supabase
+
+
+def test_bulk_insert_chunks_and_returns_rows_in_order():
+    local = LocalSupabaseClient()
+    supabase = _supabase(local, bulk_chunk_size=4)
+    events = [{"source": "guardian", "content": {"commit_id": f"c{i}"}, "ache_level": 1.5} for i in range(10)]
+
+    result = asyncio.run(supabase.insert_ache_events(events))
+
+    assert result.ok and result.chunks == 3 and result.succeeded == 10
+    assert [r.payload["source_id"] for r in result.responses] == [f"c{i}" for i in range(10)]
+    assert all(r.inserted_id for r in result.responses)
+    assert local.requests == 3
+    assert [row["ache_level"] for row in local.rows("ache_events")] == [1.0] * 10
+
+
+def test_failed_chunk_is_retried_then_reported_per_row():
+    # Every second request fails: chunks recover on retry
+    local = LocalSupabaseClient(fail_every=2)
+    supabase = _supabase(local, bulk_chunk_size=5, bulk_concurrency=1)
+    result = asyncio.run(supabase.bulk_write("verification_records", [{"n": i} for i in range(20)]))
+    assert result.ok and len(local.rows("verification_records")) == 20
+
+    # A chunk that exhausts its retries only fails its own rows
+    local = LocalSupabaseClient()
+    supabase = _supabase(local, bulk_chunk_size=5, max_retries=2)
+    rows = [{"id": i} for i in range(10)] + [{"id": 0}]
+    result = asyncio.run(supabase.bulk_write("verification_records", rows))
+
+    assert sorted(result.errors) == [10]
+    assert result.failed_chunks == 1 and result.succeeded == 10
+    assert result.responses[10] is None and result.responses[3].inserted_id == 3
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(supabase.insert_verification_records([{"id": 1}]))
+
+
+def test_bulk_upsert_merges_on_conflict_columns():
+    local = LocalSupabaseClient()
+    supabase = _supabase(local)
+    asyncio.run(supabase.bulk_write("pid_controller_state", [{"name": "a", "kp": 1}, {"name": "b", "kp": 1}]))
+    rows = [{"name": "a", "kp": 2}, {"name": "c", "kp": 3}]
+    result = asyncio.run(supabase.bulk_write("pid_controller_state", rows, upsert=True, on_conflict="name"))
+
+    assert result.ok
+    stored = local.rows("pid_controller_state")
+    assert [(row["name"], row["kp"]) for row in stored] == [("a", 2), ("b", 1), ("c", 3)]
+    assert result.responses[0].inserted_id == stored[0]["id"]
+
+
+def test_local_client_select_and_rpc():
+    local = LocalSupabaseClient(rpc_handlers={"double": lambda params: {"value": params["x"] * 2}})
+    local.table("t").insert([{"k": 1}, {"k": 2}]).execute()
+
+    assert [row["k"] for row in local.table("t").select("*").eq("k", 2).execute().data] == [2]
+    assert local.rpc("double", {"x": 4}).execute().data == {"value": 8}
+    assert local.rpc("missing").execute().error
+    assert local.table("t").insert({"id": local.rows("t")[0]["id"]}).execute().status_code == 409